@@ -43,19 +43,51 @@ class EvaluatorAgent(BaseAgent):
     def build_messages(self, **inputs):
         raise NotImplementedError("build_messages is unused when using tool-powered agent.")
 
-    def __call__(self, **inputs):
+    def __call__(self, *, page_images: list[str] | None = None, **inputs):
         prompt = self._build_user_prompt(**inputs)
-        raw = self.agent.run(prompt)
+        if page_images:
+            raw = self._run_multimodal(prompt, page_images)
+        else:
+            raw = self.agent.run(prompt)
         return self.postprocess(raw, **inputs)
 
+    def _run_multimodal(self, prompt: str, page_images: list[str]) -> str:
+        """One chat call that also sees the page thumbnails (data URLs); no tool use."""
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        content = [{
+            "type": "text",
+            "text": (
+                f"{prompt}\n\n### Page images\nThe attached images are the résumé pages as "
+                "rendered (low resolution, grayscale); judge visual from them. Tools are not "
+                "available in this call, so compute the weighted overall score yourself."
+            ),
+        }]
+        content += [
+            {"type": "image_url", "image_url": {"url": url, "detail": "low"}} for url in page_images
+        ]
+        reply = self.llm.invoke([SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=content)])
+        return reply.content
+
     def _build_user_prompt(self, raw_text: str, structured_json: dict, role: str) -> str:
         rubric_md = "### Rubric\n| Dimension | Description | Weight |\n|---|---|---|\n"
         for dim, cfg in RUBRIC.items():
             rubric_md += f"| {dim} | {cfg['description']} | {cfg['weight']} |\n"
 
+        # measured layout and proofreading go in their own short blocks, not the JSON dump
+        meta = structured_json.get("meta", {})
+        layout, proofread = meta.get("layout"), meta.get("proofread")
+        if layout or proofread:
+            structured_json = {
+                **structured_json,
+                "meta": {k: v for k, v in meta.items() if k not in ("layout", "proofread")},
+            }
+
         return (
             f"{rubric_md}\n\n"
             f"### Target role\n{role}\n\n"
+            f"{_layout_block(layout)}"
+            f"{_language_block(proofread)}"
             "### Structured résumé JSON\n```json\n"
             f"{json.dumps(structured_json, indent=2)[:8000]}\n```\n"
             "### Extracted CV text (truncated)\n"
@@ -75,6 +107,46 @@ class EvaluatorAgent(BaseAgent):
         return report
 
 
+def _layout_block(layout: dict | None) -> str:
+    """Measured PDF layout for the visual/ats dimensions (empty if unknown)."""
+    if not layout:
+        return ""
+    sizes = ", ".join(f"{size}pt {share:.0%}" for size, share in layout["font_sizes"].items())
+    return (
+        "### Layout features (measured from the PDF; use for visual and ats)\n"
+        f"- pages: {layout['pages']}, text columns: {layout['columns']}\n"
+        f"- font sizes (share of glyphs): {sizes}; body {layout['body_size']}pt, "
+        f"{layout['font_families']} font families\n"
+        f"- whitespace ratio: {layout['whitespace_ratio']:.2f}\n"
+        f"- tables: {layout['tables']}, images: {layout['images']}, drawn boxes/lines: {layout['rects']}\n"
+        f"- characters per page: {layout['chars_per_page']}\n\n"
+    )
+
+
+def _language_block(proofread: dict | None, per_kind: int = 8) -> str:
+    """Local spelling/grammar findings for the language dimension (empty if unknown)."""
+    if not proofread:
+        return ""
+    lang = proofread["language"]
+    shares = ", ".join(f"{code} {share:.0%}" for code, share in lang["shares"].items())
+    counts = proofread["counts"]
+    lines = [
+        "### Language findings (local pre-check; use for language, verify against the text)",
+        f"- language: {lang['detected']} ({shares or 'no stop words'}); {counts['words']} words",
+        f"- spelling: {counts['spelling']}, tense shifts: {counts['tense']}, "
+        f"passive constructions: {counts['passive']}, "
+        f"passages in another language: {counts['other_language']}",
+    ]
+    shown: dict[str, int] = {}
+    for f in proofread["findings"]:
+        if shown.setdefault(f["kind"], 0) >= per_kind:
+            continue
+        shown[f["kind"]] += 1
+        detail = f.get("suggestion") or f.get("note") or f.get("language")
+        lines.append(f"- {f['kind']}: \"{f['text']}\"" + (f" → {detail}" if detail else ""))
+    return "\n".join(lines) + "\n\n"
+
+
 # Optional CLI
 if __name__ == "__main__":
     import argparse
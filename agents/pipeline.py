@@ -19,6 +19,7 @@ class PipelineState(TypedDict):
     evaluation_report: dict
     coach: dict
     market: dict
+    page_images: list | None  # page thumbnails (data URLs) for a multimodal evaluation
 
 
 
@@ -52,6 +53,7 @@ def _build_graph():
             raw_text=state["resume_text"],   # ➋ FIXED
             structured_json=state["structured_json"],
             role=state["role"],
+            page_images=state.get("page_images"),
         )
         return {"evaluation_report": report}
 
@@ -71,18 +73,77 @@ CV_GRAPH = _build_graph()
 
 
 # … at the very end …
-def run_pipeline(pdf_path, resume_text, structured_json, role, country):
+def run_pipeline(
+    pdf_path, resume_text, structured_json, role, country, *, near_duplicates=None, page_images=None
+):
+    """
+    Evaluator → coach + market for one résumé.
+
+    With *near_duplicates* (an ``ingestion.resume_reviewer.corpus.NearDuplicateIndex``)
+    the very file (same checksum) already run for the same role and country
+    gets that earlier result back, marked with ``"reused_from"``; fresh
+    results are added to the index.  A merely similar résumé is always run:
+    ``find_prior_run`` lets a caller offer the earlier result as an option.
+    Résumés without text (a failed OCR) are never matched.
+
+    *page_images* (``data_urls(page_thumbnails(...))`` from
+    ``ingestion.resume_reviewer.parser.raster``) let the evaluator look at
+    the pages as well.
+    """
+    if near_duplicates is not None:
+        checksum = structured_json.get("meta", {}).get("checksum")
+        prior = find_prior_run(near_duplicates, resume_text, role, country, checksum=checksum)
+        if prior is not None and prior["reused_from"]["same_file"]:
+            return prior
+
     initial = {
         "pdf_path": pdf_path,
         "resume_text": resume_text,
         "structured_json": structured_json,
         "role": role,
         "country": country,
+        "page_images": page_images,
     }
     state = CV_GRAPH.invoke(initial)
-    return {
+    result = {
         "report": state["evaluation_report"],   # <- new key
         "coach":  state["coach"],
         "market": state["market"],
     }
+    if near_duplicates is not None:
+        remember_run(near_duplicates, resume_text, structured_json, role, country, result)
+    return result
+
+
+def find_prior_run(near_duplicates, resume_text, role, country, *, checksum=None):
+    """
+    The earlier result for this role/country of the file with *checksum*,
+    else of the most similar résumé, or ``None``.  ``reused_from["same_file"]``
+    tells which: only a same-file result is safe to reuse without asking.
+    """
+    if not resume_text.strip():
+        return None
+    if checksum is not None:
+        key = f"{checksum}|{role}|{country}"
+        run = near_duplicates.get(key)
+        if run:
+            reused_from = {"key": key, "similarity": 1.0, "same_file": True}
+            return {**run["result"], "reused_from": reused_from}
+    for match in near_duplicates.query(resume_text):
+        run = match.payload
+        if run and run["role"] == role and run["country"] == country:
+            reused_from = {"key": match.key, "similarity": match.similarity, "same_file": False}
+            return {**run["result"], "reused_from": reused_from}
+    return None
+
+
+def remember_run(near_duplicates, resume_text, structured_json, role, country, result):
+    if not resume_text.strip():
+        return
+    checksum = structured_json.get("meta", {}).get("checksum", "")
+    near_duplicates.add(
+        f"{checksum}|{role}|{country}",
+        resume_text,
+        payload={"role": role, "country": country, "result": result},
+    )
 
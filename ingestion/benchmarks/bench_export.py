@@ -0,0 +1,90 @@
+"""
+Serialisation benchmark: pretty JSON vs. msgpack vs. Parquet.
+
+    python benchmarks/bench_export.py [--sample 20] [--copies 2000]
+
+Parses ``--sample`` PDFs from the bundled corpus once, repeats the results to
+``--copies`` résumés and reports write time, load time and size on disk for
+each format.  Repeated copies compress unrealistically well in Parquet;
+raise ``--sample`` for a fairer size comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from resume_reviewer.parser import ParsedResume, parse_resume  # noqa: E402
+from resume_reviewer.parser.export import read_parquet, write_parquet  # noqa: E402
+
+DATA = ROOT.parent / "data" / "data" / "data"
+
+
+def json_rw(results, tmp: Path) -> tuple[float, float, int]:
+    path = tmp / "resumes.json"
+    t0 = time.perf_counter()
+    with open(path, "w", encoding="utf-8") as fh:
+        for res in results:
+            fh.write(res.to_json() + "\n\x1e\n")  # record separator between pretty docs
+    t1 = time.perf_counter()
+    docs = path.read_text("utf-8").split("\n\x1e\n")
+    loaded = [ParsedResume.from_dict(json.loads(doc)) for doc in docs if doc]
+    t2 = time.perf_counter()
+    assert len(loaded) == len(results)
+    return t1 - t0, t2 - t1, path.stat().st_size
+
+
+def msgpack_rw(results, tmp: Path) -> tuple[float, float, int]:
+    import msgpack
+
+    path = tmp / "resumes.msgpack"
+    t0 = time.perf_counter()
+    with open(path, "wb") as fh:
+        for res in results:
+            fh.write(res.to_msgpack())
+    t1 = time.perf_counter()
+    with open(path, "rb") as fh:
+        unpacker = msgpack.Unpacker(fh, raw=False)
+        loaded = [ParsedResume.from_dict(p) for p in unpacker]
+    t2 = time.perf_counter()
+    assert len(loaded) == len(results)
+    return t1 - t0, t2 - t1, path.stat().st_size
+
+
+def parquet_rw(results, tmp: Path) -> tuple[float, float, int]:
+    out = tmp / "parquet"
+    t0 = time.perf_counter()
+    write_parquet(results, out)
+    t1 = time.perf_counter()
+    loaded = list(read_parquet(out))
+    t2 = time.perf_counter()
+    assert len(loaded) == len(results)
+    return t1 - t0, t2 - t1, sum(p.stat().st_size for p in out.iterdir())
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sample", type=int, default=20)
+    ap.add_argument("--copies", type=int, default=2000)
+    args = ap.parse_args()
+
+    pdfs = sorted(glob.glob(str(DATA / "*" / "*.pdf")))[:: max(1, 2400 // args.sample)][: args.sample]
+    parsed = [parse_resume(p, ocr=False) for p in pdfs]
+    results = [parsed[i % len(parsed)] for i in range(args.copies)]
+    print(f"{len(results)} résumés ({len(parsed)} distinct)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, fn in (("json", json_rw), ("msgpack", msgpack_rw), ("parquet", parquet_rw)):
+            write, load, size = fn(results, Path(tmp))
+            print(f"{name:>8}: write {write:6.2f}s   load {load:6.2f}s   {size / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
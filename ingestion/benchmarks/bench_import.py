@@ -0,0 +1,57 @@
+"""
+Import-time benchmark for ``resume_reviewer.parser``.
+
+    python benchmarks/bench_import.py [--repeat 5] [--top 10]
+
+Runs ``python -X importtime -c "import resume_reviewer.parser"`` in fresh
+interpreters, reports the best cumulative time of the package import and the
+slowest modules it pulled in, and lists any heavy backend (pdfplumber, PIL,
+pytesseract, ...) that got imported eagerly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+TARGET = "resume_reviewer.parser"
+HEAVY = ("pdfplumber", "pdfminer", "PIL", "pytesseract", "dateutil", "docx", "filetype")
+
+
+def importtime() -> list[tuple[int, str]]:
+    """(cumulative µs, module) for every module imported by TARGET."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        rows.append((int(cumulative), name.strip()))
+    return rows
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--top", type=int, default=10)
+    args = ap.parse_args()
+
+    runs = [importtime() for _ in range(args.repeat)]
+    best = min(runs, key=lambda rows: dict((n, c) for c, n in rows)[TARGET])
+    total = dict((n, c) for c, n in best)[TARGET]
+    print(f"{TARGET}: {total / 1e3:.1f} ms (best of {args.repeat})")
+    for cumulative, name in sorted(best, reverse=True)[1 : args.top + 1]:
+        print(f"  {cumulative / 1e3:8.1f} ms  {name}")
+    loaded = {name for _, name in best}
+    eager = [m for m in HEAVY if m in loaded]
+    print("eager backends:", ", ".join(eager) if eager else "none")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+PDF backend benchmark: pypdfium2 ("fast") vs. pdfplumber ("layout").
+
+    python benchmarks/bench_pdf_backends.py [--per-category 3] [--seed 0]
+
+Extracts the same sampled corpus PDFs with both backends and reports total
+time, speed-up, how many pages the fast backend handed back to pdfplumber,
+and text similarity against the layout output: ``tokens`` is the multiset
+overlap of words (reading-order independent), ``sequence`` the difflib ratio
+over the word sequences (penalises column-order differences too).
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from resume_reviewer.parser import pdf_parser, pdfium_parser  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_stages import DATA, sample_corpus  # noqa: E402
+
+
+def token_overlap(a: list[str], b: list[str]) -> float:
+    ca, cb = Counter(a), Counter(b)
+    total = sum((ca | cb).values())
+    return sum((ca & cb).values()) / total if total else 1.0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--data", type=Path, default=DATA)
+    ap.add_argument("--per-category", type=int, default=3)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    files = sample_corpus(args.data, args.per_category, args.seed)
+    t_fast = t_layout = 0.0
+    fallbacks = pages = 0
+    overlap, sequence = [], []
+    for path in files:
+        notes: list[str] = []
+        t0 = time.perf_counter()
+        fast = pdfium_parser.extract_pages(str(path), notes=notes)
+        t1 = time.perf_counter()
+        layout = pdf_parser.extract_pages(str(path))
+        t2 = time.perf_counter()
+        t_fast += t1 - t0
+        t_layout += t2 - t1
+        fallbacks += len(notes)
+        pages += len(layout)
+        a, b = "\n".join(fast).split(), "\n".join(layout).split()
+        overlap.append(token_overlap(a, b))
+        sequence.append(difflib.SequenceMatcher(None, a, b, autojunk=False).ratio())
+
+    print(f"{len(files)} files, {pages} pages")
+    print(f"  fast:   {t_fast:7.2f}s  ({len(files) / t_fast:6.1f} files/s)")
+    print(f"  layout: {t_layout:7.2f}s  ({len(files) / t_layout:6.1f} files/s)")
+    print(f"  speed-up x{t_layout / t_fast:.1f}, layout fallback on {fallbacks} page(s)")
+    for name, values in (("tokens", overlap), ("sequence", sequence)):
+        print(
+            f"  similarity {name:>8}: mean {statistics.mean(values):.3f}"
+            f"  p5 {sorted(values)[len(values) // 20]:.3f}  min {min(values):.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
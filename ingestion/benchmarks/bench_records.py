@@ -0,0 +1,73 @@
+"""
+Memory benchmark: ``structured`` dicts vs. ``ResumeRecord`` slotted records.
+
+    python benchmarks/bench_records.py [--sample 50] [--copies 10000]
+
+Parses ``--sample`` PDFs once and loads ``--copies`` résumés from their JSON
+(as a batch job reading the parse cache would: every copy has its own
+strings).  Reports the memory held by the list of dicts and by the list of
+records (``tracemalloc``), and the time per résumé for ``from_dict`` / ``to_dict``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import glob
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from resume_reviewer.parser import ResumeRecord, parse_resume  # noqa: E402
+
+DATA = ROOT.parent / "data" / "data" / "data"
+
+
+def held(build) -> tuple[object, int]:
+    """``build()`` and the bytes it still holds."""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sample", type=int, default=50)
+    ap.add_argument("--copies", type=int, default=10_000)
+    args = ap.parse_args()
+
+    pdfs = sorted(glob.glob(str(DATA / "*" / "*.pdf")))[: args.sample]
+    if not pdfs:
+        sys.exit(f"no PDFs under {DATA}")
+    blobs = [json.dumps(parse_resume(p).structured) for p in pdfs]
+    blobs = [blobs[i % len(blobs)] for i in range(args.copies)]
+
+    dicts, dict_bytes = held(lambda: [json.loads(b) for b in blobs])
+    records, rec_bytes = held(lambda: [ResumeRecord.from_dict(json.loads(b)) for b in blobs])
+    t0 = time.perf_counter()
+    for d in dicts:
+        ResumeRecord.from_dict(d)
+    t1 = time.perf_counter()
+    assert [r.to_dict() for r in records] == dicts
+    t_from, t_to = t1 - t0, time.perf_counter() - t1
+
+    n = len(dicts)
+    print(f"{n} résumés ({len(pdfs)} distinct)")
+    print(f"{'form':>8} {'MiB':>8} {'bytes/CV':>9}")
+    for name, size in (("dicts", dict_bytes), ("records", rec_bytes)):
+        print(f"{name:>8} {size / 2**20:8.1f} {size / n:9.0f}")
+    print(f"records use {rec_bytes / dict_bytes:.0%} of the dict memory")
+    print(f"from_dict {t_from / n * 1e6:.1f} µs/CV, to_dict {t_to / n * 1e6:.1f} µs/CV")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Stage-level benchmark over the bundled résumé corpus (``data/data/data``).
+
+    python benchmarks/bench_stages.py [--per-category 5] [--repeat 3] [--seed 0]
+    python benchmarks/bench_stages.py --save baseline.json
+    python benchmarks/bench_stages.py --compare baseline.json [--threshold 0.10]
+
+Samples ``--per-category`` PDFs from every category directory and times each
+stage in isolation on the same input: detection, extraction, the four cleanup
+stages on their own (nfkc, headers, whitespace, markdown), the fused
+``normalize`` pass the parser actually runs, and ``to_schema``.  Per-file
+latency is the best of ``--repeat`` runs; the report gives p50/p95/p99,
+throughput (files/s) and memory per stage.
+
+``rss_peak`` is how far the stage pushed the process RSS high-water mark
+above its starting RSS, measured on the first repeat after resetting the mark
+through ``/proc/self/clear_refs`` (Linux only; ``null`` elsewhere).  With
+``--tracemalloc`` an extra untimed run per stage records the Python heap peak
+(``py_peak``); it is slow on extraction.  ``ru_maxrss`` is always recorded.
+
+``--compare`` re-runs the suite with the baseline's sampling parameters and
+exits non-zero if any stage's ``--metric`` grew by more than ``--threshold``.
+OCR is off unless ``--ocr`` is given, so runs do not depend on tesseract.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from resume_reviewer.parser.cleanup import normalize  # noqa: E402
+from resume_reviewer.parser.detector import detect  # noqa: E402
+from resume_reviewer.parser.document import checksum_stream  # noqa: E402
+from resume_reviewer.parser.registry import get_extractor  # noqa: E402
+from resume_reviewer.parser.structure import PARSER_VERSION, to_schema  # noqa: E402
+
+DATA = ROOT.parent / "data" / "data" / "data"
+STAGES = (
+    "detect", "extract", "nfkc", "headers", "whitespace", "markdown", "normalize", "to_schema",
+)
+METRICS = ("p50", "p95", "p99", "mean")
+
+
+# ---- corpus ------------------------------------------------------------------
+def sample_corpus(root: Path, per_category: int, seed: int) -> list[Path]:
+    rng = random.Random(seed)
+    picked: list[Path] = []
+    for category in sorted(p for p in root.iterdir() if p.is_dir()):
+        pdfs = sorted(category.glob("*.pdf"))
+        picked += rng.sample(pdfs, min(per_category, len(pdfs)))
+    return picked
+
+
+# ---- stages ------------------------------------------------------------------
+# The cleanup stages all run on the extracted text, ``to_schema`` on the fused
+# ``normalize`` output, so every stage sees the input it gets in production.
+def _extract(path: Path, *, ocr: bool) -> str:
+    with open(path, "rb") as fp:
+        checksum = checksum_stream(fp)
+        return get_extractor(detect(str(path)))(fp, checksum, ocr=ocr).text
+
+
+def stage_fns(path: Path, *, ocr: bool) -> dict:
+    only = dict(strip_headers=False, collapse_whitespace=False, nfkc=False)
+    return {
+        "detect": lambda _: detect(str(path)),
+        "extract": lambda _: _extract(path, ocr=ocr),
+        "nfkc": lambda text: normalize(text, **{**only, "nfkc": True}),
+        "headers": lambda text: normalize(text, **{**only, "strip_headers": True}),
+        "whitespace": lambda text: normalize(text, **{**only, "collapse_whitespace": True}),
+        "markdown": lambda text: normalize(text, **{**only, "markdown": True}),
+        "normalize": lambda text: normalize(text, markdown=True),
+        "to_schema": lambda text: to_schema(
+            text, filepath=path, checksum="sha256:bench", normalized=True
+        ),
+    }
+
+
+def _inputs(stage: str, extracted: str, normalized: str | None) -> str | None:
+    if stage in ("detect", "extract"):
+        return None
+    return normalized if stage == "to_schema" else extracted
+
+
+# ---- memory ------------------------------------------------------------------
+def _reset_rss_peak() -> int | None:
+    """Reset the high-water mark to the current RSS and return it (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")
+    except OSError:
+        return None
+    return _proc_status("VmRSS:")
+
+
+def _proc_status(field: str) -> int | None:
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith(field):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _maxrss() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # bytes vs KiB
+
+
+# ---- measurement -------------------------------------------------------------
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted *values*."""
+    if not values:
+        return float("nan")
+    rank = max(1, math.ceil(q / 100 * len(values)))
+    return values[rank - 1]
+
+
+def run(files: list[Path], *, repeat: int, ocr: bool, trace: bool = False) -> dict:
+    latency = {s: [] for s in STAGES}
+    py_peak = dict.fromkeys(STAGES, 0)
+    rss_peak: dict[str, int | None] = dict.fromkeys(STAGES, 0)
+    failed: list[str] = []
+
+    for path in files:
+        fns = stage_fns(path, ocr=ocr)
+        try:
+            extracted = fns["extract"](None)
+        except Exception as exc:  # noqa: BLE001 - keep going, report at the end
+            failed.append(f"{path.name}: {exc!r}")
+            continue
+        normalized = fns["normalize"](extracted)
+
+        for stage in STAGES:
+            arg = _inputs(stage, extracted, normalized)
+            fn = fns[stage]
+            best = float("inf")
+            for i in range(repeat):
+                base = _reset_rss_peak() if i == 0 else None
+                t0 = time.perf_counter()
+                fn(arg)
+                best = min(best, time.perf_counter() - t0)
+                if base is not None:
+                    grown = (_proc_status("VmHWM:") or base) - base
+                    rss_peak[stage] = max(rss_peak[stage] or 0, grown)
+                elif i == 0:
+                    rss_peak[stage] = None
+            latency[stage].append(best)
+
+            if trace:
+                tracemalloc.start()
+                fn(arg)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                py_peak[stage] = max(py_peak[stage], peak)
+
+    stages = {}
+    for stage, values in latency.items():
+        values.sort()
+        total = sum(values)
+        stages[stage] = {
+            "n": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "mean": total / len(values) if values else float("nan"),
+            "files_per_sec": len(values) / total if total else 0.0,
+            "py_peak_mib": py_peak[stage] / 2**20 if trace else None,
+            "rss_peak_mib": None if rss_peak[stage] is None else rss_peak[stage] / 2**20,
+        }
+    return {"stages": stages, "failed": failed, "ru_maxrss_mib": _maxrss() / 2**20}
+
+
+# ---- reporting ---------------------------------------------------------------
+def _fmt_mib(v: float | None) -> str:
+    return "      -" if v is None else f"{v:7.1f}"
+
+
+def report(result: dict) -> None:
+    meta = result["meta"]
+    print(
+        f"{meta['files']} files ({meta['per_category']}/category, seed {meta['seed']}), "
+        f"best of {meta['repeat']}, parser {meta['parser_version']}"
+    )
+    print(
+        f"{'stage':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'files/s':>9}"
+        f" {'py MiB':>7} {'rss MiB':>7}"
+    )
+    for stage, s in result["stages"].items():
+        print(
+            f"{stage:>10} {s['p50'] * 1e3:9.2f} {s['p95'] * 1e3:9.2f} {s['p99'] * 1e3:9.2f}"
+            f" {s['files_per_sec']:9.1f} {_fmt_mib(s['py_peak_mib'])} {_fmt_mib(s['rss_peak_mib'])}"
+        )
+    print(f"ru_maxrss: {result['ru_maxrss_mib']:.1f} MiB")
+    for line in result["failed"]:
+        print(f"[FAILED] {line}", file=sys.stderr)
+
+
+def compare(baseline: dict, current: dict, *, metric: str, threshold: float) -> list[str]:
+    """Stages whose *metric* got slower than *threshold* (a fraction) vs *baseline*."""
+    regressions = []
+    print(f"\n{'stage':>10} {'base ms':>9} {'now ms':>9} {'change':>8}   ({metric})")
+    for stage, now in current["stages"].items():
+        base = baseline["stages"].get(stage)
+        if not base or not base[metric]:
+            continue
+        change = now[metric] / base[metric] - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{stage:>10} {base[metric] * 1e3:9.2f} {now[metric] * 1e3:9.2f} {change:+8.1%}{flag}")
+        if flag:
+            regressions.append(stage)
+    return regressions
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--data", type=Path, default=DATA)
+    ap.add_argument("--per-category", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--ocr", action="store_true", help="OCR blank PDF pages (needs tesseract)")
+    ap.add_argument("--tracemalloc", action="store_true", help="Also record Python heap peaks (slow)")
+    ap.add_argument("--save", type=Path, metavar="JSON", help="Write results as a baseline")
+    ap.add_argument("--compare", type=Path, metavar="JSON", help="Check against a baseline")
+    ap.add_argument("--metric", choices=METRICS, default="p95")
+    ap.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown (0.10 = 10%%)")
+    args = ap.parse_args()
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    if baseline:
+        # same sample as the baseline, otherwise the numbers are not comparable
+        args.per_category = baseline["meta"]["per_category"]
+        args.seed = baseline["meta"]["seed"]
+        args.repeat = baseline["meta"]["repeat"]
+
+    files = sample_corpus(args.data, args.per_category, args.seed)
+    if not files:
+        sys.exit(f"no PDFs under {args.data}")
+    result = run(files, repeat=args.repeat, ocr=args.ocr, trace=args.tracemalloc)
+    result["meta"] = {
+        "files": len(files),
+        "per_category": args.per_category,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "ocr": args.ocr,
+        "parser_version": PARSER_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+    report(result)
+
+    if args.save:
+        args.save.write_text(json.dumps(result, indent=2))
+        print(f"baseline written to {args.save}")
+    if baseline:
+        regressions = compare(baseline, result, metric=args.metric, threshold=args.threshold)
+        if regressions:
+            sys.exit(f"{len(regressions)} stage(s) regressed by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Corpus access benchmark: one JSON file per résumé vs. the mmap packed store.
+
+    python benchmarks/bench_store.py [--sample 20] [--copies 5000] [--lookups 2000]
+
+Parses ``--sample`` PDFs once and repeats the results to ``--copies``
+résumés under distinct checksums.  Reports, for both layouts: a full-text
+scan of every résumé (count of a term), ``--lookups`` random accesses to
+the structured record, and size on disk.  Run it twice to see warm page
+cache numbers; the store's scan never builds Python strings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from resume_reviewer.corpus import PackedStore  # noqa: E402
+from resume_reviewer.parser import parse_resume  # noqa: E402
+
+DATA = ROOT.parent / "data" / "data" / "data"
+TERM = "management"
+
+
+def copies(results, n: int):
+    for i in range(n):
+        res = results[i % len(results)]
+        checksum = f"sha256:{hashlib.sha256(str(i).encode()).hexdigest()}"
+        meta = {**res.structured["meta"], "checksum": checksum}
+        yield res._replace(structured={**res.structured, "meta": meta})
+
+
+def bench_json(results, tmp: Path, lookups: list[int]) -> dict:
+    files = []
+    for res in results:
+        path = tmp / f"{res.structured['meta']['checksum'][7:]}.json"
+        path.write_text(json.dumps(res.to_dict(), ensure_ascii=False), "utf-8")
+        files.append(path)
+    t0 = time.perf_counter()
+    hits = sum(json.loads(p.read_text("utf-8"))["text"].count(TERM) for p in files)
+    t1 = time.perf_counter()
+    for i in lookups:
+        json.loads(files[i].read_text("utf-8"))["structured"]
+    t2 = time.perf_counter()
+    return {"scan": t1 - t0, "lookup": t2 - t1, "hits": hits,
+            "bytes": sum(p.stat().st_size for p in files)}
+
+
+def bench_store(results, tmp: Path, lookups: list[int]) -> dict:
+    with PackedStore(tmp / "pack", mode="a") as store:
+        store.add_many(results)
+    term = re.compile(TERM.encode())
+    with PackedStore(tmp / "pack") as store:
+        keys = list(store)
+        t0 = time.perf_counter()
+        hits = sum(len(term.findall(view)) for _, view in store.texts())
+        t1 = time.perf_counter()
+        for i in lookups:
+            store.record(keys[i])["structured"]
+        t2 = time.perf_counter()
+    size = sum(f.stat().st_size for f in (tmp / "pack").iterdir())
+    return {"scan": t1 - t0, "lookup": t2 - t1, "hits": hits, "bytes": size}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sample", type=int, default=20)
+    ap.add_argument("--copies", type=int, default=5000)
+    ap.add_argument("--lookups", type=int, default=2000)
+    args = ap.parse_args()
+
+    pdfs = sorted(glob.glob(str(DATA / "*" / "*.pdf")))[: args.sample]
+    if not pdfs:
+        sys.exit(f"no PDFs under {DATA}")
+    results = list(copies([parse_resume(p) for p in pdfs], args.copies))
+    rng = random.Random(0)
+    lookups = [rng.randrange(len(results)) for _ in range(args.lookups)]
+
+    print(f"{len(results)} résumés, {args.lookups} random lookups")
+    print(f"{'layout':>10} {'scan ms':>9} {'lookup ms':>10} {'MiB':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = {
+            "json files": bench_json(results, Path(tmp), lookups),
+            "packed": bench_store(results, Path(tmp), lookups),
+        }
+    for name, r in rows.items():
+        mib = r["bytes"] / 2**20
+        print(f"{name:>10} {r['scan'] * 1e3:9.1f} {r['lookup'] * 1e3:10.1f} {mib:7.1f}")
+    assert rows["json files"]["hits"] == rows["packed"]["hits"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""Corpus-level tooling over many parsed résumés."""
+from .catalog import Catalog
+from .dedupe import NearDuplicateIndex
+from .search import SearchIndex
+from .store import PackedStore
+__all__ = ["Catalog", "NearDuplicateIndex", "PackedStore", "SearchIndex"]
@@ -0,0 +1,344 @@
+"""
+SQLite catalog of a résumé corpus (the Kaggle dataset ``data/main.py``
+downloads: one directory per category).
+
+One row per file, keyed by its path relative to the corpus root, with the
+category, size, mtime, content hash, page count, parse status and duration
+and the ``parser_version`` that produced it.  ``Catalog.update`` walks the
+root and re-parses only what is new, changed or was parsed by an older
+parser; unchanged files cost one ``stat`` each.  Files whose mtime moved but
+whose bytes did not are re-hashed, not re-parsed.  Parse results themselves
+live in the ``ParseCache`` (keyed by content hash), so a renamed or copied
+file is a cache hit as well::
+
+    with Catalog("corpus.sqlite") as cat:
+        cat.update("data/data/data", workers=8)
+        cat.result("ACCOUNTANT/10554236.pdf")
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterator
+
+from ..parser.batch import iter_inputs, parse_many
+from ..parser.cache import DEFAULT_ROOT, ParseCache
+from ..parser.document import checksum_file
+from ..parser.structure import PARSER_VERSION
+
+COMMIT_EVERY = 200  # parse records per transaction
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path           TEXT PRIMARY KEY,  -- relative to the root, '/'-separated
+    category       TEXT NOT NULL,
+    size           INTEGER NOT NULL,
+    mtime_ns       INTEGER NOT NULL,
+    checksum       TEXT,
+    page_count     INTEGER,
+    status         TEXT NOT NULL,     -- 'ok' | 'failed'
+    error          TEXT,
+    parse_seconds  REAL,
+    parser_version TEXT,
+    parsed_at      TEXT
+);
+CREATE INDEX IF NOT EXISTS files_category ON files (category);
+CREATE INDEX IF NOT EXISTS files_checksum ON files (checksum);
+CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+_COLUMNS = (
+    "path", "category", "size", "mtime_ns", "checksum", "page_count",
+    "status", "error", "parse_seconds", "parser_version", "parsed_at",
+)
+
+
+class Catalog:
+    """The catalog database; ``root`` is remembered after the first ``update``."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        cache_root: str | Path = DEFAULT_ROOT,
+        parser_version: str = PARSER_VERSION,
+    ):
+        self.path = Path(path).expanduser()
+        self.cache_root = Path(cache_root).expanduser()
+        self.parser_version = parser_version
+        self._parse_cache: ParseCache | None = None
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")  # readers don't block update
+        self.db.executescript(_SCHEMA)
+
+    # ---- settings ------------------------------------------------------------
+    @property
+    def root(self) -> Path | None:
+        row = self.db.execute("SELECT value FROM settings WHERE key = 'root'").fetchone()
+        return Path(row[0]) if row else None
+
+    def settings(self) -> dict[str, str]:
+        return dict(self.db.execute("SELECT key, value FROM settings").fetchall())
+
+    def _set(self, key: str, value: str) -> None:
+        self.db.execute("INSERT OR REPLACE INTO settings VALUES (?, ?)", (key, value))
+
+    # ---- scanning ------------------------------------------------------------
+    def plan(
+        self,
+        root: str | Path | None = None,
+        *,
+        retry_failed: bool = False,
+        reparse_all: bool = False,
+    ) -> dict:
+        """
+        What ``update`` would do: ``{"new", "changed", "stale", "touched",
+        "unchanged", "removed"}`` lists of relative paths (``touched`` =
+        mtime/size moved, bytes still to be compared).  With *reparse_all*
+        every known file is stale.
+        """
+        root = self._root(root)
+        known = {row["path"]: row for row in self.db.execute("SELECT * FROM files")}
+        plan: dict[str, list[str]] = {
+            k: [] for k in ("new", "changed", "stale", "touched", "unchanged", "removed")
+        }
+        for file in iter_inputs([root]):
+            rel = file.relative_to(root).as_posix()
+            row = known.pop(rel, None)
+            if row is None:
+                plan["new"].append(rel)
+                continue
+            st = file.stat()
+            if (st.st_size, st.st_mtime_ns) != (row["size"], row["mtime_ns"]):
+                plan["touched"].append(rel)
+            elif (
+                reparse_all
+                or row["parser_version"] != self.parser_version
+                or (retry_failed and row["status"] != "ok")
+            ):
+                plan["stale"].append(rel)
+            else:
+                plan["unchanged"].append(rel)
+        plan["removed"] = sorted(known)
+        return plan
+
+    def update(
+        self,
+        root: str | Path | None = None,
+        *,
+        workers: int | None = None,
+        chunksize: int = 4,
+        convert_to_md: bool = True,
+        backend: str = "fast",
+        retry_failed: bool = False,
+        progress=None,
+    ) -> dict[str, int]:
+        """
+        Bring the catalog in line with *root* and return counts per plan
+        bucket plus ``parsed`` / ``failed``.  Failed files are retried only
+        when they change, the parser version moves or *retry_failed* is set.
+        *progress*, if given, is called with every parse record.  Changing
+        *convert_to_md* or *backend* from the last run re-parses everything.
+        """
+        root = self._root(root)
+        variant = {"convert_to_md": str(int(convert_to_md)), "backend": backend}
+        previous = self.settings()
+        reparse_all = any(previous.get(k, v) != v for k, v in variant.items())
+        plan = self.plan(root, retry_failed=retry_failed, reparse_all=reparse_all)
+        todo = plan["new"] + plan["stale"]
+        for rel in plan["touched"]:
+            row = self._row(rel)
+            st = (root / rel).stat()
+            if (
+                not reparse_all
+                and row["status"] == "ok"
+                and row["parser_version"] == self.parser_version
+                and checksum_file(root / rel) == row["checksum"]
+            ):
+                # same bytes, new mtime: nothing to parse
+                self.db.execute(
+                    "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                    (st.st_size, st.st_mtime_ns, rel),
+                )
+            else:
+                plan["changed"].append(rel)
+                todo.append(rel)
+        self.db.executemany("DELETE FROM files WHERE path = ?", [(r,) for r in plan["removed"]])
+        self._set("root", str(root))
+        self.db.commit()
+
+        parsed = failed = 0
+        records = parse_many(
+            [root / rel for rel in todo],
+            workers=workers,
+            chunksize=chunksize,
+            convert_to_md=convert_to_md,
+            cache_root=self.cache_root,
+            parser_version=self.parser_version,
+            backend=backend,
+        )
+        for i, record in enumerate(records, 1):
+            self._record(root, record)
+            if record["ok"]:
+                parsed += 1
+            else:
+                failed += 1
+            if progress is not None:
+                progress(record)
+            if i % COMMIT_EVERY == 0:
+                self.db.commit()
+        # only now: an interrupted run with new options re-parses everything
+        # next time (mostly cache hits) instead of keeping old-variant rows
+        for key, value in variant.items():
+            self._set(key, value)
+        self.db.commit()
+        counts = {k: len(v) for k, v in plan.items()}
+        counts["touched"] -= counts["changed"]
+        counts.update(parsed=parsed, failed=failed)
+        return counts
+
+    def _record(self, root: Path, record: dict) -> None:
+        file = Path(record["source"])
+        rel = file.relative_to(root).as_posix()
+        st = file.stat()
+        row = {
+            "path": rel,
+            "category": _category(rel),
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "checksum": None,
+            "page_count": None,
+            "status": "ok" if record["ok"] else "failed",
+            "error": record.get("error"),
+            "parse_seconds": record["seconds"],
+            "parser_version": self.parser_version,
+            "parsed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        if record["ok"]:
+            meta = record["result"]["structured"]["meta"]
+            row.update(
+                checksum=meta["checksum"],
+                page_count=meta.get("page_count"),
+                parsed_at=meta.get("parsed_at") or row["parsed_at"],
+            )
+        else:
+            row["checksum"] = checksum_file(file)
+        self.db.execute(
+            f"INSERT OR REPLACE INTO files VALUES ({', '.join('?' * len(_COLUMNS))})",
+            tuple(row[c] for c in _COLUMNS),
+        )
+
+    # ---- queries -------------------------------------------------------------
+    def rows(self, *, category: str | None = None, status: str | None = None) -> Iterator[dict]:
+        sql, args = "SELECT * FROM files WHERE 1", []
+        if category is not None:
+            sql += " AND category = ?"
+            args.append(category)
+        if status is not None:
+            sql += " AND status = ?"
+            args.append(status)
+        for row in self.db.execute(sql + " ORDER BY path", args):
+            yield dict(row)
+
+    def stats(self) -> dict:
+        """Counts per status, stale rows, and files / pages per category."""
+        q = self.db.execute
+        return {
+            "files": q("SELECT count(*) FROM files").fetchone()[0],
+            "status": dict(q("SELECT status, count(*) FROM files GROUP BY status").fetchall()),
+            "stale": q(
+                "SELECT count(*) FROM files WHERE parser_version IS NOT ?", (self.parser_version,)
+            ).fetchone()[0],
+            "categories": {
+                cat: {"files": n, "pages": pages or 0}
+                for cat, n, pages in q(
+                    "SELECT category, count(*), sum(page_count) FROM files GROUP BY category"
+                )
+            },
+            "parse_seconds": q("SELECT total(parse_seconds) FROM files").fetchone()[0],
+        }
+
+    def result(self, rel: str):
+        """
+        The cached ``ParsedResume`` for catalog path *rel*, or ``None`` (not
+        parsed, or evicted from the cache since).
+        """
+        row = self._row(rel)
+        if row is None or row["status"] != "ok":
+            return None
+        return _cached(self._cache(), row["checksum"], self._variant())
+
+    def results(
+        self, *, category: str | None = None, missing: list[dict] | None = None
+    ) -> Iterator[tuple[dict, object]]:
+        """
+        ``(row, ParsedResume)`` for every parsed file.  Rows whose result the
+        cache has evicted are appended to *missing* instead and, once the
+        iteration is done, marked stale so the next ``update`` parses them
+        again.
+        """
+        cache, variant = self._cache(), self._variant()
+        evicted = []
+        for row in self.rows(category=category, status="ok"):
+            result = _cached(cache, row["checksum"], variant)
+            if result is None:
+                evicted.append(row)
+                if missing is not None:
+                    missing.append(row)
+                continue
+            yield row, result
+        if evicted:
+            self.db.executemany(
+                "UPDATE files SET parser_version = NULL WHERE path = ?",
+                [(row["path"],) for row in evicted],
+            )
+            self.db.commit()
+
+    def _cache(self) -> ParseCache:
+        if self._parse_cache is None:
+            self._parse_cache = ParseCache(self.cache_root, parser_version=self.parser_version)
+        return self._parse_cache
+
+    def _variant(self) -> dict:
+        """``ParseCache.key`` options of the last ``update``."""
+        settings = self.settings()
+        return {
+            "convert_to_md": bool(int(settings.get("convert_to_md", "1"))),
+            "backend": settings.get("backend", "fast"),
+        }
+
+    # ---- plumbing ------------------------------------------------------------
+    def _row(self, rel: str) -> sqlite3.Row | None:
+        return self.db.execute("SELECT * FROM files WHERE path = ?", (rel,)).fetchone()
+
+    def _root(self, root: str | Path | None) -> Path:
+        root = Path(root).expanduser().resolve() if root is not None else self.root
+        if root is None:
+            raise ValueError("No corpus root given and none recorded in the catalog")
+        if not root.is_dir():
+            raise FileNotFoundError(root)
+        return root
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "Catalog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _cached(cache: ParseCache, checksum: str, variant: dict):
+    from ..parser.core import ParsedResume
+
+    hit = cache.get(checksum, **variant)
+    return None if hit is None else ParsedResume.from_dict(hit)
+
+
+def _category(rel: str) -> str:
+    """The top-level directory of *rel* (the dataset's category), ``""`` at the root."""
+    head, sep, _ = rel.partition("/")
+    return head if sep else ""
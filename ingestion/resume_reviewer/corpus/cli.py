@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from ..parser.cache import DEFAULT_ROOT
+from .catalog import Catalog
+
+DEFAULT_DB = Path("corpus.sqlite")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(prog="resume-corpus")
+    ap.add_argument("--db", type=Path, default=DEFAULT_DB, help="Catalog database")
+    ap.add_argument(
+        "--cache",
+        type=Path,
+        default=DEFAULT_ROOT,
+        metavar="DIR",
+        help="Parse cache holding the results (default: %(default)s)",
+    )
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    up = sub.add_parser("update", help="Parse new, changed and version-stale files")
+    up.add_argument("root", type=Path, nargs="?", help="Dataset root (default: the last one used)")
+    up.add_argument("-j", "--workers", type=int, default=None, help="Worker processes")
+    up.add_argument("--chunksize", type=int, default=4, help="Files handed to a worker at a time")
+    up.add_argument("--plain", action="store_true", help="Cache raw text results (no Markdown)")
+    up.add_argument("--backend", choices=("fast", "layout"), default="fast")
+    up.add_argument("--retry-failed", action="store_true", help="Also re-parse failed files")
+    up.add_argument("--dry-run", action="store_true", help="Only print what would be parsed")
+    up.add_argument(
+        "--index", type=Path, metavar="FILE", help="Then bring this search index up to date"
+    )
+
+    sub.add_parser("status", help="Counts per status and category, as JSON")
+
+    ls = sub.add_parser("list", help="Catalog rows as JSON lines")
+    ls.add_argument("--category")
+    ls.add_argument("--status", choices=("ok", "failed"))
+
+    pack = sub.add_parser("pack", help="Append parsed results to an mmap-able packed store")
+    pack.add_argument("store", type=Path, help="Store directory (created if missing)")
+    pack.add_argument("--category")
+
+    ix = sub.add_parser("index", help="Create or update a search index from the catalog")
+    ix.add_argument("index", type=Path, metavar="FILE")
+
+    se = sub.add_parser("search", help="BM25 search: terms, \"phrases\", AND/OR/NOT, field:term")
+    se.add_argument("index", type=Path, metavar="FILE")
+    se.add_argument("query")
+    se.add_argument("--category", action="append", help="Only these categories (repeatable)")
+    se.add_argument("-n", "--limit", type=int, default=20)
+
+    dd = sub.add_parser(
+        "dedupe", help="Groups of near-duplicate résumés (MinHash/LSH), as JSON lines"
+    )
+    dd.add_argument("--category")
+    dd.add_argument("-t", "--threshold", type=float, default=0.8, help="Minimum estimated Jaccard")
+    dd.add_argument("--save", type=Path, metavar="FILE", help="Also save the near-duplicate index")
+
+    wd = sub.add_parser("words", help="Write a spelling word list (word, document count)")
+    wd.add_argument("out", type=Path, metavar="FILE")
+    wd.add_argument("--min-docs", type=int, default=3, help="Drop words in fewer documents")
+    args = ap.parse_args()
+
+    if args.command == "search":
+        from .search import SearchIndex
+
+        for hit in SearchIndex.load(args.index).search(
+            args.query, category=args.category, limit=args.limit
+        ):
+            print(f"{hit.score:8.3f}  {hit.key}")
+        return
+
+    with Catalog(args.db, cache_root=args.cache) as cat:
+        if args.command == "status":
+            print(json.dumps(cat.stats(), indent=2))
+        elif args.command == "list":
+            for row in cat.rows(category=args.category, status=args.status):
+                print(json.dumps(row, ensure_ascii=False))
+        elif args.command == "dedupe":
+            _dedupe(cat, args)
+        elif args.command == "words":
+            _words(cat, args)
+        elif args.command == "index":
+            _sync_index(cat, args.index)
+        elif args.command == "pack":
+            from .store import PackedStore
+
+            missing: list[dict] = []
+            with PackedStore(args.store, mode="a") as store:
+                added = store.add_many(
+                    res for _, res in cat.results(category=args.category, missing=missing)
+                )
+                print(f"[SUMMARY] {added} added, {len(store)} in {args.store}", file=sys.stderr)
+            _report_missing(missing)
+        elif args.dry_run:
+            plan = cat.plan(args.root, retry_failed=args.retry_failed)
+            print(json.dumps({k: len(v) for k, v in plan.items()}))
+        else:
+            _update(cat, args)
+            if args.index:
+                _sync_index(cat, args.index)
+
+
+def _sync_index(cat: Catalog, path: Path) -> None:
+    from .search import SearchIndex
+
+    index = SearchIndex.load(path) if path.exists() else SearchIndex()
+    counts = index.sync(cat)
+    index.save(path)
+    print(
+        f"[INDEX] {counts['added']} added, {counts['removed']} removed, "
+        f"{counts['documents']} documents",
+        file=sys.stderr,
+    )
+
+
+def _dedupe(cat: Catalog, args: argparse.Namespace) -> None:
+    from .dedupe import NearDuplicateIndex
+
+    index = NearDuplicateIndex(threshold=args.threshold)
+    missing: list[dict] = []
+    for row, res in cat.results(category=args.category, missing=missing):
+        index.add(row["path"], res.text, payload=row["checksum"])
+    groups = sorted(index.duplicates(), key=len, reverse=True)
+    for group in groups:
+        print(json.dumps(sorted(group), ensure_ascii=False))
+    if args.save:
+        index.save(args.save)
+    print(
+        f"[SUMMARY] {len(index)} résumés, {len(groups)} near-duplicate groups, "
+        f"{sum(map(len, groups)) - len(groups)} redundant",
+        file=sys.stderr,
+    )
+    _report_missing(missing)
+
+
+def _words(cat: Catalog, args: argparse.Namespace) -> None:
+    from ..parser.proofread import build_word_counts
+
+    missing: list[dict] = []
+    counts = build_word_counts(
+        (res.text for _, res in cat.results(missing=missing)), min_docs=args.min_docs
+    )
+    args.out.write_text("".join(f"{w} {n}\n" for w, n in counts.items()), "utf-8")
+    print(f"[SUMMARY] {len(counts)} words in {args.out}", file=sys.stderr)
+    _report_missing(missing)
+
+
+def _report_missing(missing: list[dict]) -> None:
+    if missing:
+        print(
+            f"[MISSING] {len(missing)} parsed files were evicted from the parse cache and "
+            "left out; the next update re-parses them",
+            file=sys.stderr,
+        )
+
+
+def _update(cat: Catalog, args: argparse.Namespace) -> None:
+    t0 = time.perf_counter()
+
+    def progress(record: dict) -> None:
+        if not record["ok"]:
+            print(f"[FAILED] {record['source']}: {record['error']}", file=sys.stderr)
+
+    counts = cat.update(
+        args.root,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        convert_to_md=not args.plain,
+        backend=args.backend,
+        retry_failed=args.retry_failed,
+        progress=progress,
+    )
+    elapsed = time.perf_counter() - t0
+    print(
+        f"[SUMMARY] {counts['new']} new, {counts['changed']} changed, {counts['stale']} stale, "
+        f"{counts['unchanged'] + counts['touched']} unchanged, {counts['removed']} removed; "
+        f"{counts['parsed']} parsed, {counts['failed']} failed in {elapsed:.1f}s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
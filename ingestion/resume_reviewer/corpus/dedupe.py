@@ -0,0 +1,243 @@
+"""
+Near-duplicate résumés with MinHash signatures and LSH banding.
+
+A résumé's cleaned text becomes a set of word ``shingle``-grams; its MinHash
+signature is ``num_perm`` minima of a multiply-shift hash family over the
+shingle hashes, and the share of equal signature slots estimates the
+Jaccard similarity of two shingle sets.  Signatures are cut into ``bands``
+of ``rows``; two résumés become candidates when any band matches exactly,
+which for the chosen split happens with high probability above
+``threshold`` and rarely below it.  A lookup is one signature, ``bands``
+dict probes and a vectorised comparison with the few candidates::
+
+    index = NearDuplicateIndex(threshold=0.8)
+    index.add("cv-1", text, payload={"report": ...})
+    index.query(other_text)   # [Match(key="cv-1", similarity=0.93, payload=...)]
+
+Text without any word (a scan whose OCR failed, say) has no shingles and
+is neither indexed nor matched: an empty set would otherwise look identical
+to every other empty one.
+
+Shingle hashes are CRC32 (stable across processes and runs), so saved
+indexes stay valid; ``save`` / ``load`` pickle like ``search.SearchIndex``.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+import zlib
+from collections import namedtuple
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from .search import tokenize
+
+NUM_PERM = 128
+SHINGLE = 5  # words per shingle
+FORMAT_VERSION = 1
+_MASK32 = np.uint64(0xFFFFFFFF)
+EMPTY = 0xFFFFFFFF  # every slot of the signature of a text without shingles
+
+Match = namedtuple("Match", ["key", "similarity", "payload"])
+
+
+def lsh_params(threshold: float, num_perm: int) -> tuple[int, int]:
+    """
+    ``(bands, rows)`` with ``bands * rows == num_perm`` whose S-curve
+    midpoint ``(1 / bands) ** (1 / rows)`` is closest to *threshold* from
+    below, so pairs at the threshold are rarely missed.
+    """
+    splits = [(num_perm // r, r) for r in range(1, num_perm + 1) if num_perm % r == 0]
+    below = [(b, r) for b, r in splits if (1 / b) ** (1 / r) <= threshold]
+    return max(below or splits[:1], key=lambda br: (1 / br[0]) ** (1 / br[1]))
+
+
+class NearDuplicateIndex:
+    """Keys with MinHash signatures and optional payloads (e.g. earlier results)."""
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.8,
+        num_perm: int = NUM_PERM,
+        shingle: int = SHINGLE,
+        seed: int = 1,
+    ):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle = shingle
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        rng = np.random.default_rng(seed)
+        # odd multipliers for multiply-shift hashing of 32-bit shingle hashes
+        self._a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+        self.keys: list[str] = []
+        self.payloads: list = []
+        self._sigs: list[np.ndarray] = []
+        self._matrix: np.ndarray | None = None  # stacked _sigs, built on demand
+        self.by_key: dict[str, int] = {}
+        self.buckets: list[dict[bytes, list[int]]] = [{} for _ in range(self.bands)]
+
+    # ---- signatures ------------------------------------------------------------
+    def shingles(self, text: str) -> np.ndarray:
+        """Distinct 32-bit hashes of the word shingles of *text*."""
+        tokens = tokenize(text)
+        if not tokens:
+            return np.empty(0, np.uint64)
+        k = min(self.shingle, len(tokens))
+        grams = (" ".join(tokens[i : i + k]) for i in range(len(tokens) - k + 1))
+        hashes = np.fromiter(
+            (zlib.crc32(g.encode("utf-8")) for g in grams), np.uint64, len(tokens) - k + 1
+        )
+        return np.unique(hashes)
+
+    def signature(self, text: str) -> np.ndarray:
+        """``num_perm`` MinHash values (uint32) of *text*; all ``EMPTY`` without shingles."""
+        x = self.shingles(text)
+        if not x.size:
+            return np.full(self.num_perm, EMPTY, np.uint32)
+        # (a * x + b) mod 2**64, top 32 bits: one row per shingle, one column per hash
+        h = (x[:, None] * self._a[None, :] + self._b[None, :]) >> np.uint64(32)
+        return (h & _MASK32).min(axis=0).astype(np.uint32)
+
+    # ---- building ----------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.by_key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.by_key
+
+    def add(self, key: str, text: str | np.ndarray, payload=None) -> None:
+        """
+        Index *text* (or a precomputed signature) under *key*, replacing an
+        earlier entry; text without shingles only removes the earlier entry.
+        """
+        sig = text if isinstance(text, np.ndarray) else self.signature(text)
+        self.remove(key)
+        if _empty(sig):
+            return
+        i = len(self.keys)
+        self.keys.append(key)
+        self.payloads.append(payload)
+        self._sigs.append(sig)
+        self._matrix = None
+        self.by_key[key] = i
+        for band, chunk in enumerate(self._band_keys(sig)):
+            self.buckets[band].setdefault(chunk, []).append(i)
+
+    def get(self, key: str, default=None):
+        """Payload indexed under *key*, or *default*."""
+        i = self.by_key.get(key)
+        return default if i is None else self.payloads[i]
+
+    def remove(self, key: str) -> bool:
+        """Forget *key*; its slot never matches again and goes at the next ``compact``."""
+        i = self.by_key.pop(key, None)
+        if i is None:
+            return False
+        for band, chunk in enumerate(self._band_keys(self._sigs[i])):
+            self.buckets[band][chunk].remove(i)
+        self.payloads[i] = None
+        return True
+
+    def compact(self) -> None:
+        """Drop the slots ``remove`` left behind and renumber the live entries."""
+        if len(self.by_key) == len(self.keys):
+            return
+        live = sorted(self.by_key.values())
+        self.keys = [self.keys[i] for i in live]
+        self.payloads = [self.payloads[i] for i in live]
+        self._sigs = [self._sigs[i] for i in live]
+        self._matrix = None
+        self.by_key = {key: i for i, key in enumerate(self.keys)}
+        self.buckets = [{} for _ in range(self.bands)]
+        for i, sig in enumerate(self._sigs):
+            for band, chunk in enumerate(self._band_keys(sig)):
+                self.buckets[band].setdefault(chunk, []).append(i)
+
+    # ---- querying ----------------------------------------------------------------
+    def query(self, text: str | np.ndarray, *, threshold: float | None = None) -> list[Match]:
+        """Indexed entries with estimated Jaccard ≥ *threshold*, most similar first."""
+        sig = text if isinstance(text, np.ndarray) else self.signature(text)
+        if _empty(sig):
+            return []
+        threshold = self.threshold if threshold is None else threshold
+        candidates = sorted(
+            {i for band, chunk in enumerate(self._band_keys(sig))
+             for i in self.buckets[band].get(chunk, ())}
+        )
+        if not candidates:
+            return []
+        sims = (self._stacked()[candidates] == sig).mean(axis=1)
+        order = np.argsort(-sims, kind="stable")
+        return [
+            Match(self.keys[candidates[j]], float(sims[j]), self.payloads[candidates[j]])
+            for j in order
+            if sims[j] >= threshold
+        ]
+
+    def duplicates(self, *, threshold: float | None = None) -> Iterator[list[str]]:
+        """Groups (size ≥ 2) of keys linked by near-duplicate pairs: a corpus dedupe pass."""
+        parent = list(range(len(self.keys)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for key, i in self.by_key.items():
+            for match in self.query(self._sigs[i], threshold=threshold):
+                j = self.by_key[match.key]
+                parent[find(i)] = find(j)
+        groups: dict[int, list[str]] = {}
+        for key, i in self.by_key.items():
+            groups.setdefault(find(i), []).append(key)
+        return (g for g in groups.values() if len(g) > 1)
+
+    def _band_keys(self, sig: np.ndarray) -> Iterable[bytes]:
+        return (
+            sig[b * self.rows : (b + 1) * self.rows].tobytes() for b in range(self.bands)
+        )
+
+    def _stacked(self) -> np.ndarray:
+        if self._matrix is None or len(self._matrix) != len(self._sigs):
+            self._matrix = np.vstack(self._sigs)
+        return self._matrix
+
+    # ---- persistence -------------------------------------------------------------
+    def save(self, path: str | Path) -> None:
+        """
+        Pickle the index (trusted files only: ``load`` unpickles), compacted
+        first so removed entries don't keep growing the file.
+        """
+        self.compact()
+        state = {**self.__dict__, "_matrix": None}
+        path = Path(path)
+        # a temp file of its own: concurrent savers never write into each other's
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump((FORMAT_VERSION, state), fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: str | Path) -> "NearDuplicateIndex":
+        with open(path, "rb") as fh:
+            version, state = pickle.load(fh)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported near-duplicate index version: {version!r}")
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        return index
+
+
+def _empty(sig: np.ndarray) -> bool:
+    return bool((sig == EMPTY).all())
@@ -0,0 +1,373 @@
+"""
+Inverted-index search over parsed résumés, ranked with BM25.
+
+Three fields per résumé, scored separately and summed with weights
+(``FIELDS``): ``skills`` (``sections.skills.hard``), ``bullets``
+(experience bullets) and ``text`` (the cleaned full text, with positions
+for phrase queries).  Postings are ``array("i")`` per term and field —
+document ids in increasing order, term frequencies alongside — so adding a
+résumé only appends, and queries view them as NumPy arrays without copying.
+
+Query syntax::
+
+    kubernetes terraform               both terms (implicit AND)
+    python OR golang                   either (operators in any case)
+    aws AND NOT azure                  exclusion
+    "machine learning" (spark OR flink)  phrases and grouping
+    skills:docker                      one field only (skills, bullets, text)
+
+``search(..., category="INFORMATION-TECHNOLOGY")`` restricts to catalog
+categories.  Replacing or removing a résumé only hides the old document;
+its postings stay until the index is rebuilt, and so does their small
+effect on document frequencies.
+"""
+
+from __future__ import annotations
+
+import pickle
+import re
+from array import array
+from collections import Counter, namedtuple
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ..parser.core import ParsedResume
+    from .catalog import Catalog
+
+FIELDS = {"skills": 3.0, "bullets": 1.5, "text": 1.0}  # BM25 weight per field
+K1, B = 1.2, 0.75
+FORMAT_VERSION = 1
+
+_TOKEN_RE = re.compile(r"[^\W_](?:[^\W_]|[+#]|[.\-](?=[^\W_]))*")  # keeps c++, c#, node.js
+_QUERY_RE = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+_INT = np.intc  # array("i") items
+
+Hit = namedtuple("Hit", ["key", "score", "category", "checksum"])
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+class _Field:
+    """Postings of one field: doc ids and term frequencies per term."""
+
+    __slots__ = ("docs", "tfs", "lengths", "total", "pos", "pos_start")
+
+    def __init__(self, positional: bool = False):
+        self.docs: dict[str, array] = {}
+        self.tfs: dict[str, array] = {}
+        self.lengths = array("i")  # per document
+        self.total = 0
+        # flat positions per term, and where each posting's run starts
+        self.pos: dict[str, array] | None = {} if positional else None
+        self.pos_start: dict[str, array] | None = {} if positional else None
+
+    def add(self, doc: int, tokens: list[str]) -> None:
+        self.lengths.append(len(tokens))
+        self.total += len(tokens)
+        if self.pos is None:
+            counts = Counter(tokens)
+        else:
+            where: dict[str, list[int]] = {}
+            for i, tok in enumerate(tokens):
+                where.setdefault(tok, []).append(i)
+            counts = {tok: len(p) for tok, p in where.items()}
+        for tok, tf in counts.items():
+            if tok not in self.docs:
+                self.docs[tok], self.tfs[tok] = array("i"), array("i")
+                if self.pos is not None:
+                    self.pos[tok], self.pos_start[tok] = array("i"), array("i")
+            self.docs[tok].append(doc)
+            self.tfs[tok].append(tf)
+            if self.pos is not None:
+                self.pos_start[tok].append(len(self.pos[tok]))
+                self.pos[tok].extend(where[tok])
+
+    def postings(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        docs = self.docs.get(term)
+        if docs is None:
+            return np.empty(0, _INT), np.empty(0, _INT)
+        return np.frombuffer(docs, _INT), np.frombuffer(self.tfs[term], _INT)
+
+    def positions(self, term: str, i: int) -> np.ndarray:
+        """Positions of *term* in its *i*-th posting."""
+        starts, pos = self.pos_start[term], self.pos[term]
+        end = starts[i + 1] if i + 1 < len(starts) else len(pos)
+        return np.frombuffer(pos, _INT)[starts[i] : end]
+
+
+class SearchIndex:
+    """BM25 index over ``ParsedResume`` results, keyed by a caller-chosen string."""
+
+    def __init__(self):
+        self.fields = {name: _Field(positional=name == "text") for name in FIELDS}
+        self.keys: list[str] = []  # doc id -> key
+        self.checksums: list[str] = []
+        self.category_ids = array("h")  # doc id -> index into self.categories
+        self.categories: list[str] = []
+        self.alive = bytearray()  # doc id -> 1 while not replaced / removed
+        self.by_key: dict[str, int] = {}
+
+    # ---- building ------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.by_key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.by_key
+
+    def add(self, key: str, result: ParsedResume, *, category: str = "") -> int:
+        """Index *result* under *key* (replacing an earlier one); returns its doc id."""
+        self.remove(key)
+        doc = len(self.keys)
+        sections = result.structured.get("sections", {})
+        bullets = [b for entry in sections.get("experience", ()) for b in entry.get("bullets", ())]
+        skills = sections.get("skills", {}).get("hard", ())
+        self.fields["skills"].add(doc, tokenize(" \n ".join(skills)))
+        self.fields["bullets"].add(doc, tokenize(" \n ".join(bullets)))
+        self.fields["text"].add(doc, tokenize(result.text))
+        if category not in self.categories:
+            self.categories.append(category)
+        self.category_ids.append(self.categories.index(category))
+        self.keys.append(key)
+        self.checksums.append(result.structured["meta"]["checksum"])
+        self.alive.append(1)
+        self.by_key[key] = doc
+        return doc
+
+    def remove(self, key: str) -> bool:
+        doc = self.by_key.pop(key, None)
+        if doc is None:
+            return False
+        self.alive[doc] = 0
+        return True
+
+    def sync(self, catalog: Catalog) -> dict[str, int]:
+        """Index new or re-parsed catalog files (keyed by path) and drop vanished ones."""
+        seen, added = set(), 0
+        for row in catalog.rows(status="ok"):
+            seen.add(row["path"])
+            doc = self.by_key.get(row["path"])
+            if doc is not None and self.checksums[doc] == row["checksum"]:
+                continue
+            result = catalog.result(row["path"])
+            if result is not None:
+                self.add(row["path"], result, category=row["category"])
+                added += 1
+        gone = [key for key in self.by_key if key not in seen]
+        for key in gone:
+            self.remove(key)
+        return {"added": added, "removed": len(gone), "documents": len(self)}
+
+    # ---- querying ------------------------------------------------------------
+    def search(
+        self,
+        query: str,
+        *,
+        category: str | Iterable[str] | None = None,
+        limit: int | None = 20,
+    ) -> list[Hit]:
+        """Documents matching *query*, best BM25 score first."""
+        node = _Parser(query).parse()
+        if node is None:
+            return []
+        matched = self._eval(node)
+        matched = matched[self._live_mask(category)[matched]]
+        if not matched.size:
+            return []
+        scores = np.zeros(len(self.keys))
+        for field, term in _positive_terms(node):
+            self._score(scores, field, term)
+        found = scores[matched]
+        if limit is not None and limit < matched.size:
+            top = np.argpartition(-found, limit)[:limit]
+            matched, found = matched[top], found[top]
+        order = np.lexsort((matched, -found))  # ties: older documents first
+        return [
+            Hit(
+                self.keys[d],
+                float(s),
+                self.categories[self.category_ids[d]],
+                self.checksums[d],
+            )
+            for d, s in zip(matched[order].tolist(), found[order].tolist())
+        ]
+
+    def _live_mask(self, category) -> np.ndarray:
+        mask = np.frombuffer(bytes(self.alive), np.uint8).astype(bool)
+        if category is not None:
+            wanted = [category] if isinstance(category, str) else list(category)
+            ids = [self.categories.index(c) for c in wanted if c in self.categories]
+            mask &= np.isin(np.frombuffer(self.category_ids, np.int16), ids)
+        return mask
+
+    def _eval(self, node) -> np.ndarray:
+        """Sorted doc ids (live or not) matching *node*."""
+        kind = node[0]
+        if kind == "term":
+            _, field, term = node
+            fields = [field] if field else FIELDS
+            parts = [self.fields[f].postings(term)[0] for f in fields]
+            return np.unique(np.concatenate(parts)) if len(parts) > 1 else parts[0]
+        if kind == "phrase":
+            return self._phrase(node[2])
+        if kind == "and":
+            out = self._eval(node[1])
+            for child in node[2:]:
+                if not out.size:
+                    break
+                out = np.intersect1d(out, self._eval(child), assume_unique=True)
+            return out
+        if kind == "or":
+            return np.unique(np.concatenate([self._eval(c) for c in node[1:]]))
+        if kind == "not":
+            every = np.arange(len(self.keys), dtype=_INT)
+            return np.setdiff1d(every, self._eval(node[1]), assume_unique=True)
+        raise ValueError(f"bad query node {node!r}")
+
+    def _phrase(self, terms: list[str]) -> np.ndarray:
+        text = self.fields["text"]
+        postings = [text.postings(t)[0] for t in terms]
+        candidates = postings[0]
+        for docs in postings[1:]:
+            candidates = np.intersect1d(candidates, docs, assume_unique=True)
+        keep = []
+        for doc in candidates.tolist():
+            starts = None
+            for k, (term, docs) in enumerate(zip(terms, postings)):
+                i = int(np.searchsorted(docs, doc))
+                pos = text.positions(term, i) - k  # align every term on the first
+                starts = pos if starts is None else np.intersect1d(starts, pos, assume_unique=True)
+                if not starts.size:
+                    break
+            if starts.size:
+                keep.append(doc)
+        return np.array(keep, _INT)
+
+    def _score(self, scores: np.ndarray, field: str | None, term: str) -> None:
+        n_docs = max(len(self), 1)
+        for name in [field] if field else FIELDS:
+            f = self.fields[name]
+            docs, tfs = f.postings(term)
+            if not docs.size:
+                continue
+            idf = np.log1p((n_docs - docs.size + 0.5) / (docs.size + 0.5))
+            avg = f.total / max(len(f.lengths), 1) or 1.0
+            lengths = np.frombuffer(f.lengths, _INT)[docs]
+            tf = tfs.astype(float)
+            part = tf * (K1 + 1) / (tf + K1 * (1 - B + B * lengths / avg))
+            scores[docs] += FIELDS[name] * idf * part
+
+    # ---- persistence -----------------------------------------------------------
+    def save(self, path: str | Path) -> None:
+        """Pickle the index (trusted files only: ``load`` unpickles)."""
+        tmp = Path(f"{path}.tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump((FORMAT_VERSION, self.__dict__), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SearchIndex":
+        with open(path, "rb") as fh:
+            version, state = pickle.load(fh)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported search index version: {version!r}")
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        return index
+
+
+# ---- query parsing ---------------------------------------------------------------
+# Nodes: ("term", field | None, term), ("phrase", field, [terms]),
+# ("and", *children), ("or", *children), ("not", child).
+class _Parser:
+    def __init__(self, query: str):
+        self.tokens = [m.groups() for m in _QUERY_RE.finditer(query) if any(m.groups())]
+        self.i = 0
+
+    def parse(self):
+        node = self._or()
+        if self.i < len(self.tokens):
+            raise ValueError(f"Unbalanced parentheses in query at token {self.i + 1}")
+        return node
+
+    def _peek_op(self) -> str | None:
+        """``AND`` / ``OR`` / ``NOT`` (any case) if that is the next token."""
+        if self.i < len(self.tokens):
+            word = (self.tokens[self.i][3] or "").upper()
+            if word in ("AND", "OR", "NOT"):
+                return word
+        return None
+
+    def _or(self):
+        parts = [self._and()]
+        while self._peek_op() == "OR":
+            self.i += 1
+            parts.append(self._and())
+        return _combine("or", parts)
+
+    def _and(self):
+        parts = []
+        while self.i < len(self.tokens) and self.tokens[self.i][1] is None:
+            op = self._peek_op()
+            if op == "OR":
+                break
+            if op == "AND":
+                self.i += 1
+                continue
+            parts.append(self._not())
+        return _combine("and", parts)
+
+    def _not(self):
+        if self._peek_op() == "NOT":
+            self.i += 1
+            child = self._not()
+            return None if child is None else ("not", child)
+        return self._atom()
+
+    def _atom(self):
+        if self.i >= len(self.tokens):
+            return None
+        open_, _, phrase, word = self.tokens[self.i]
+        self.i += 1
+        if open_:
+            node = self._or()
+            if self.i >= len(self.tokens) or not self.tokens[self.i][1]:
+                raise ValueError("Unbalanced parentheses in query")
+            self.i += 1
+            return node
+        field = None
+        if phrase is None:
+            head, sep, rest = word.partition(":")
+            if sep and head.lower() in FIELDS:
+                field, word = head.lower(), rest
+            terms = tokenize(word)
+        else:
+            terms = tokenize(phrase)
+        if not terms:
+            return None
+        if len(terms) == 1:
+            return ("term", field, terms[0])
+        return ("phrase", "text", terms)  # positions are kept for the text field only
+
+
+def _combine(op: str, parts: list):
+    parts = [p for p in parts if p is not None]
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 else (op, *parts)
+
+
+def _positive_terms(node) -> list[tuple[str | None, str]]:
+    """``(field, term)`` pairs that count towards the score (not under NOT)."""
+    kind = node[0]
+    if kind == "term":
+        return [(node[1], node[2])]
+    if kind == "phrase":
+        return [(node[1], t) for t in node[2]]
+    if kind == "not":
+        return []
+    return [pair for child in node[1:] for pair in _positive_terms(child)]
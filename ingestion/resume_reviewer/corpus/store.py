@@ -0,0 +1,198 @@
+"""
+Append-only packed store of parsed résumés, read through ``mmap``.
+
+Two files in one directory:
+
+* ``data.bin`` — per résumé the cleaned text (UTF-8) immediately followed
+  by a compact JSON record ``{"metadata": ..., "structured": ...}``;
+* ``index.bin`` — a header, then one fixed-size entry per résumé: the raw
+  SHA-256 digest of its checksum, the data offset, the text length and the
+  record length.
+
+Readers map ``data.bin`` read-only, so ``text_view`` hands out slices of
+the page cache without copying and every process that opens the store
+shares the same pages.  Writers append the data before the index entry;
+an entry that points past the end of the data (a crashed writer) is ignored
+on open.  Adding a checksum again appends a new version that shadows the
+old one.
+
+    with PackedStore("corpus.pack", mode="a") as store:
+        store.add_many(results)
+    with PackedStore("corpus.pack") as store:
+        bytes(store.text_view(checksum)[:200]).decode()
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from ..parser.core import ParsedResume
+
+MAGIC = b"RRPACK\x00\x01"  # format version in the last two bytes
+_ENTRY = struct.Struct("<32sQII")  # digest, offset, text length, record length
+DATA, INDEX = "data.bin", "index.bin"
+
+
+class PackedStore:
+    """Open *directory* for reading (``mode="r"``) or appending (``mode="a"``)."""
+
+    def __init__(self, directory: str | Path, *, mode: str = "r"):
+        if mode not in ("r", "a"):
+            raise ValueError(f"mode must be 'r' or 'a', not {mode!r}")
+        self.directory = Path(directory)
+        self.mode = mode
+        if mode == "a":
+            self.directory.mkdir(parents=True, exist_ok=True)
+            for name in (DATA, INDEX):
+                (self.directory / name).touch()
+            self._data_out = open(self.directory / DATA, "ab")
+            self._index_out = open(self.directory / INDEX, "ab")
+            if self._index_out.tell() == 0:
+                self._index_out.write(MAGIC)
+                self._index_out.flush()
+        self._slots: dict[bytes, tuple[int, int, int]] = {}
+        self._map: mmap.mmap | None = None
+        index_size = self._load_index()
+        if mode == "a" and self._index_out.tell() > index_size:
+            self._index_out.truncate(index_size)  # or later entries would be misaligned
+
+    # ---- reading ---------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, checksum: str) -> bool:
+        return _digest(checksum) in self._slots
+
+    def __iter__(self) -> Iterator[str]:
+        """Checksums in the order they were first added."""
+        return (f"sha256:{d.hex()}" for d in self._slots)
+
+    def text_view(self, checksum: str) -> memoryview:
+        """The UTF-8 text as a zero-copy view of the mapped file."""
+        offset, text_len, _ = self._slot(checksum)
+        return memoryview(self._mapped(offset + text_len))[offset : offset + text_len]
+
+    def text(self, checksum: str) -> str:
+        offset, text_len, _ = self._slot(checksum)
+        return self._mapped(offset + text_len)[offset : offset + text_len].decode("utf-8")
+
+    def record(self, checksum: str) -> dict:
+        """``{"metadata": ..., "structured": ...}`` for *checksum*."""
+        offset, text_len, rec_len = self._slot(checksum)
+        start = offset + text_len
+        return json.loads(self._mapped(start + rec_len)[start : start + rec_len])
+
+    def get(self, checksum: str) -> ParsedResume:
+        from ..parser.core import ParsedResume
+
+        rec = self.record(checksum)
+        return ParsedResume(self.text(checksum), rec["metadata"], rec["structured"])
+
+    def texts(self) -> Iterator[tuple[str, memoryview]]:
+        """``(checksum, text_view)`` for every résumé, in the order first added."""
+        for checksum in self:
+            yield checksum, self.text_view(checksum)
+
+    # ---- writing ---------------------------------------------------------------
+    def add(self, result: ParsedResume, *, replace: bool = False) -> bool:
+        """
+        Append *result* under its ``meta.checksum``; ``False`` if that
+        checksum is already stored and *replace* is off.
+        """
+        if self.mode != "a":
+            raise PermissionError("store opened read-only")
+        digest = _digest(result.structured["meta"]["checksum"])
+        if digest in self._slots and not replace:
+            return False
+        text = result.text.encode("utf-8")
+        rec = json.dumps(
+            {"metadata": result.metadata, "structured": result.structured},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        offset = self._data_out.tell()
+        self._data_out.write(text)
+        self._data_out.write(rec)
+        self._data_out.flush()  # data before index: no entry points at missing bytes
+        self._index_out.write(_ENTRY.pack(digest, offset, len(text), len(rec)))
+        self._index_out.flush()
+        self._slots[digest] = (offset, len(text), len(rec))
+        return True
+
+    def add_many(self, results: Iterable[ParsedResume], *, replace: bool = False) -> int:
+        added = sum(self.add(r, replace=replace) for r in results)
+        os.fsync(self._data_out.fileno())
+        os.fsync(self._index_out.fileno())
+        return added
+
+    # ---- plumbing --------------------------------------------------------------
+    def _load_index(self) -> int:
+        """Read the index into ``_slots``; returns the size of its intact part."""
+        data_size = _size(self.directory / DATA)
+        try:
+            raw = (self.directory / INDEX).read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"no packed store in {self.directory}") from None
+        if raw[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.directory / INDEX} is not a packed-store index")
+        usable = (len(raw) - len(MAGIC)) // _ENTRY.size * _ENTRY.size  # drop a torn entry
+        for digest, offset, text_len, rec_len in _ENTRY.iter_unpack(
+            raw[len(MAGIC) : len(MAGIC) + usable]
+        ):
+            if offset + text_len + rec_len <= data_size:
+                self._slots[digest] = (offset, text_len, rec_len)
+        return len(MAGIC) + usable
+
+    def _slot(self, checksum: str) -> tuple[int, int, int]:
+        try:
+            return self._slots[_digest(checksum)]
+        except KeyError:
+            raise KeyError(checksum) from None
+
+    def _mapped(self, end: int) -> mmap.mmap:
+        """The data file mapping, re-mapped if it no longer reaches *end*."""
+        if self._map is None or len(self._map) < end:
+            self._unmap()
+            with open(self.directory / DATA, "rb") as fh:
+                self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _unmap(self) -> None:
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # views from text_view still alive; freed with them
+            self._map = None
+
+    def close(self) -> None:
+        self._unmap()
+        if self.mode == "a":
+            self._data_out.close()
+            self._index_out.close()
+
+    def __enter__(self) -> "PackedStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _digest(checksum: str) -> bytes:
+    algo, _, hexdigest = checksum.partition(":")
+    if algo != "sha256" or len(hexdigest) != 64:
+        raise ValueError(f"not a sha256 checksum: {checksum!r}")
+    return bytes.fromhex(hexdigest)
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
@@ -1,2 +1,15 @@
-from .core import parse_resume
-__all__ = ["parse_resume"]
\ No newline at end of file
+from .cache import ParseCache
+from .core import ParsedResume, parse_resume, parse_resume_bytes
+from .records import ResumeRecord
+from .registry import register
+from .sandbox import Limits, parse_resume_sandboxed
+__all__ = [
+    "Limits",
+    "ParseCache",
+    "ParsedResume",
+    "ResumeRecord",
+    "parse_resume",
+    "parse_resume_bytes",
+    "parse_resume_sandboxed",
+    "register",
+]
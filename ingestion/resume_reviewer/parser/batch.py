@@ -0,0 +1,157 @@
+"""Parse many résumés across a process pool, yielding one record per file."""
+
+from __future__ import annotations
+
+import glob
+import multiprocessing as mp
+import os
+import signal
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .cache import ParseCache
+from .core import parse_resume
+from .registry import filetypes
+from .sandbox import Limits, apply_limits
+from .structure import PARSER_VERSION
+
+# per-worker state, set once by the pool initializer
+_OPTIONS: dict = {}
+
+
+def iter_inputs(specs: Iterable[str | Path]) -> Iterator[Path]:
+    """Expand files, directories (recursively) and glob patterns to files."""
+    for spec in specs:
+        spec = str(spec)
+        path = Path(spec).expanduser()
+        if path.is_dir():
+            suffixes = {f".{ft}" for ft in filetypes()}
+            yield from sorted(
+                p for p in path.rglob("*") if p.is_file() and p.suffix.lower() in suffixes
+            )
+        elif path.is_file():
+            yield path
+        elif glob.has_magic(spec):
+            yield from sorted(Path(p) for p in glob.glob(os.path.expanduser(spec), recursive=True)
+                              if os.path.isfile(p))
+        else:
+            raise FileNotFoundError(spec)
+
+
+def parse_many(
+    paths: Iterable[Path],
+    *,
+    workers: int | None = None,
+    chunksize: int = 4,
+    convert_to_md: bool = True,
+    cache_root: str | Path | None = None,
+    parser_version: str = PARSER_VERSION,
+    backend: str = "fast",
+    layout: bool = False,
+    proofread: bool = False,
+    limits: Limits | None = None,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+) -> Iterator[dict]:
+    """
+    Yield one record per file, in completion order.
+
+    Successful records carry ``ok=True`` and the ``ParsedResume`` dict under
+    ``result``; failures carry ``ok=False`` and the error message, so one bad
+    file never stops the run.  *parser_version* names the ``ParseCache``
+    generation under *cache_root* the results are read from and stored in.
+
+    *max_pages* / *max_chars* cut every file short (see ``parse_resume``).
+    With *limits* they default to the limits' values, and a file fails once
+    it takes longer than ``wall_seconds``; pool workers also get
+    the memory and image-size caps (CPU time accumulates over a worker's
+    files, so it is not capped here).  Pool workers can't start the
+    per-file child ``parse_resume_sandboxed`` uses.
+    """
+    if limits is not None:
+        max_pages = limits.max_pages if max_pages is None else max_pages
+        max_chars = limits.max_chars if max_chars is None else max_chars
+    options = {
+        "convert_to_md": convert_to_md,
+        "cache_root": cache_root,
+        "parser_version": parser_version,
+        "backend": backend,
+        "layout": layout,
+        "proofread": proofread,
+        "limits": limits,
+        "max_pages": max_pages,
+        "max_chars": max_chars,
+    }
+    paths = [str(p) for p in paths]
+    if not paths:
+        return
+    if workers == 1:
+        # no rlimits on the caller's own process
+        _init_worker({**options, "pool": False})
+        yield from map(_parse_one, paths)
+        return
+    with mp.Pool(workers, initializer=_init_worker, initargs=(options,)) as pool:
+        yield from pool.imap_unordered(_parse_one, paths, chunksize=chunksize)
+
+
+def _init_worker(options: dict) -> None:
+    _OPTIONS.clear()
+    _OPTIONS.update(options)
+    root = options.get("cache_root")
+    _OPTIONS["cache"] = (
+        ParseCache(root, parser_version=options["parser_version"]) if root else None
+    )
+    limits = options.get("limits")
+    if limits is not None and options.get("pool", True):
+        apply_limits(limits, cpu=False)
+
+
+def _parse_one(path: str) -> dict:
+    t0 = time.perf_counter()
+    limits = _OPTIONS["limits"]
+    try:
+        with _deadline(limits.wall_seconds if limits else None):
+            res = parse_resume(
+                path,
+                convert_to_md=_OPTIONS["convert_to_md"],
+                cache=_OPTIONS["cache"],
+                backend=_OPTIONS["backend"],
+                layout=_OPTIONS["layout"],
+                proofread=_OPTIONS["proofread"],
+                max_pages=_OPTIONS["max_pages"],
+                max_chars=_OPTIONS["max_chars"],
+            )
+    except Exception as exc:  # noqa: BLE001 - every failure becomes a record
+        return {
+            "source": path,
+            "ok": False,
+            "error": f"{type(exc).__name__}: {exc}",
+            "seconds": round(time.perf_counter() - t0, 4),
+        }
+    return {
+        "source": path,
+        "ok": True,
+        "seconds": round(time.perf_counter() - t0, 4),
+        "result": res.to_dict(),
+    }
+
+
+class _deadline:
+    """Raise ``TimeoutError`` in this (main) thread after *seconds* (POSIX only)."""
+
+    def __init__(self, seconds: float | None):
+        self.seconds = seconds if hasattr(signal, "setitimer") else None
+
+    def __enter__(self):
+        if self.seconds:
+            self._old = signal.signal(signal.SIGALRM, self._expire)
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+
+    def __exit__(self, *exc):
+        if self.seconds:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._old)
+
+    def _expire(self, *_):
+        raise TimeoutError(f"wall-clock limit of {self.seconds:g}s exceeded")
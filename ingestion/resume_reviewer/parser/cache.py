@@ -0,0 +1,198 @@
+"""Content-addressed on-disk cache of ParsedResume results.
+
+Entries are keyed by the résumé checksum plus the parser version, the
+``convert_to_md`` flag, the PDF backend, the OCR setting and whether layout
+features and proofreading findings were requested; ``cache_variant`` turns
+parse options into those key options, for every lookup and store alike.
+
+Every parser version gets its own directory under ``<root>/versions``, so a
+version bump invalidates the old entries; the next cache open removes the
+trees of *older* versions, and only those carrying the ``MARKER`` file a cache
+wrote, so nothing else under the root (or a newer deployment sharing it) is
+touched.  Writes go through a temp file + ``os.replace``, which is atomic on
+POSIX and Windows, so several processes can share one cache root.
+
+Each cache object keeps a running total of the bytes stored and lists the
+directory only when that passes ``max_bytes``, trimming to 90% and counting
+what other processes wrote in the meantime, so a put is not a scan of every
+entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from .document import discard_file
+from .structure import PARSER_VERSION
+
+DEFAULT_ROOT = Path(
+    os.environ.get("RESUME_REVIEWER_CACHE", "~/.cache/resume_reviewer/parse")
+).expanduser()
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+MARKER = ".resume-reviewer-cache"  # in every version directory a cache created
+
+
+def cache_variant(
+    *,
+    convert_to_md: bool = True,
+    backend: str = "fast",
+    layout: bool = False,
+    proofread: bool = False,
+    ocr=True,
+) -> dict:
+    """
+    ``ParseCache.key`` options of a parse with these ``parse_resume``
+    options.  *ocr* becomes ``"default"`` (the shared engine), ``"off"`` or
+    the engine's ``cache_key``.
+    """
+    if ocr is True:
+        setting = "default"
+    elif not ocr:
+        setting = "off"
+    else:
+        setting = ocr.cache_key
+    return {
+        "convert_to_md": convert_to_md,
+        "backend": backend,
+        "layout": layout,
+        "proofread": proofread,
+        "ocr": setting,
+    }
+
+
+class ParseCache:
+    """Size-bounded LRU cache of ``ParsedResume.to_dict()`` payloads."""
+
+    def __init__(
+        self,
+        root: str | Path = DEFAULT_ROOT,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        parser_version: str = PARSER_VERSION,
+    ):
+        self.root = Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self.parser_version = parser_version
+        self.dir = self.root / "versions" / parser_version
+        self._size: int | None = None  # bytes stored as of the last ``evict`` + own puts since
+        self._make_dir()
+        self._drop_stale_versions()
+
+    # ---- public API ------------------------------------------------------
+    def key(
+        self,
+        checksum: str,
+        *,
+        convert_to_md: bool,
+        backend: str = "fast",
+        layout: bool = False,
+        proofread: bool = False,
+        ocr: str = "default",
+    ) -> str:
+        raw = f"{checksum}|{self.parser_version}|md={int(convert_to_md)}|backend={backend}"
+        if layout:  # keeps the keys of plain parses stable
+            raw += "|layout"
+        if proofread:
+            raw += "|proofread"
+        if ocr != "default":
+            raw += f"|ocr={ocr}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, checksum: str, **variant) -> dict | None:
+        """Payload stored for *checksum* and the ``key`` options, or ``None``."""
+        path = self._path(self.key(checksum, **variant))
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # half-written or corrupt entry from a crashed writer: treat as miss
+            discard_file(path)
+            return None
+        try:
+            os.utime(path)  # bump recency for LRU eviction
+        except OSError:
+            pass
+        return payload
+
+    def put(self, checksum: str, payload: dict, **variant) -> None:
+        path = self._path(self.key(checksum, **variant))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        import tempfile  # deferred: keeps ``import resume_reviewer.parser`` cheap
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
+            size = os.path.getsize(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            discard_file(tmp)
+            raise
+        # a running total instead of a directory listing per put: only when
+        # it crosses ``max_bytes`` does ``evict`` list, stat and trim to 90%
+        if self._size is not None:
+            self._size += size
+        if self._size is None or self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Drop least-recently-used entries until the cache fits ``max_bytes``,
+        and resync the running total with what is on disk (other processes
+        sharing the root included).
+        """
+        entries = []
+        total = 0
+        for path in self.dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:  # evicted by another process
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total > self.max_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                discard_file(path)
+                total -= size
+                if total <= self.max_bytes * 0.9:  # hysteresis: don't evict on every put
+                    break
+        self._size = total
+
+    def clear(self) -> None:
+        import shutil
+
+        shutil.rmtree(self.dir, ignore_errors=True)
+        self._size = 0
+        self._make_dir()
+
+    # ---- helpers ---------------------------------------------------------
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / f"{key}.json"
+
+    def _make_dir(self) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        (self.dir / MARKER).touch()
+
+    def _drop_stale_versions(self) -> None:
+        current = _version_key(self.parser_version)
+        if current is None:
+            return
+        for child in self.dir.parent.iterdir():
+            older = _version_key(child.name)
+            if older is not None and older < current and (child / MARKER).is_file():
+                import shutil
+
+                shutil.rmtree(child, ignore_errors=True)
+
+
+def _version_key(version: str) -> tuple[int, ...] | None:
+    """``"0.10.0"`` -> ``(0, 10, 0)``; ``None`` for names that aren't versions."""
+    if not re.fullmatch(r"\d+(?:\.\d+)*", version):
+        return None
+    return tuple(map(int, version.split(".")))
@@ -1,13 +1,91 @@
 import re
+import time
+import unicodedata
+
+from .document import iter_lines
+from .structure import SECTION_RE
+
+HEADER_FOOTER_RE = re.compile(r"^\s*(Page\s+\d+|Curriculum Vitae)", re.I)
+
+STAGES = ("nfkc", "headers", "whitespace", "markdown")
+
+
+def normalize(
+    text: str,
+    *,
+    strip_headers: bool = True,
+    collapse_whitespace: bool = True,
+    nfkc: bool = True,
+    markdown: bool = False,
+    timings: dict | None = None,
+) -> str:
+    """
+    Fused cleanup: NFKC, header/footer stripping, whitespace collapsing and
+    Markdown heading emission in one pass over the lines.
+
+    Every stage can be switched off.  Pass a dict as *timings* to have the
+    seconds spent in each stage (keys from ``STAGES``) added to it; that
+    costs a few clock reads per line, so leave it off in production.
+    """
+    timed = timings is not None
+    if timed:
+        spent = dict.fromkeys(STAGES, 0.0)
+        clock = time.perf_counter
+
+    out: list[str] = []
+    blank_run = 0
+    for line in iter_lines(text):
+        if timed:
+            t0 = clock()
+        if nfkc and not line.isascii():  # ASCII is NFKC already
+            line = unicodedata.normalize("NFKC", line)
+        if timed:
+            t1 = clock()
+            spent["nfkc"] += t1 - t0
+        if strip_headers and HEADER_FOOTER_RE.match(line):
+            if timed:
+                spent["headers"] += clock() - t1
+            continue
+        if timed:
+            t2 = clock()
+            spent["headers"] += t2 - t1
+        if collapse_whitespace:
+            line = line.rstrip(" \t")
+            if not line:
+                blank_run += 1
+                if timed:
+                    spent["whitespace"] += clock() - t2
+                continue
+            if not out:
+                line = line.lstrip()  # leading text.strip()
+                if not line:
+                    continue
+            elif blank_run:
+                out.append("")  # 3+ blank lines -> 1
+            blank_run = 0
+        if timed:
+            t3 = clock()
+            spent["whitespace"] += t3 - t2
+        if (
+            markdown
+            and len(line) <= 40  # headings are short
+            and not line.startswith("#")  # the backend already emitted one
+            and SECTION_RE.match(line.strip())
+        ):
+            line = f"## {line.strip()}"
+        if timed:
+            spent["markdown"] += clock() - t3
+        out.append(line)
+
+    if timed:
+        for stage, secs in spent.items():
+            timings[stage] = timings.get(stage, 0.0) + secs
+    return "\n".join(out)
+
 
 def strip_headers_footers(text: str) -> str:
-    lines = text.splitlines()
-    return "\n".join(
-        ln for ln in lines
-        if not re.match(r"^\s*(Page\s+\d+|Curriculum Vitae)", ln, re.I)
-    )
+    return normalize(text, collapse_whitespace=False, nfkc=False)
+
 
 def normalize_whitespace(text: str) -> str:
-    text = re.sub(r"[ \t]+$", "", text, flags=re.M)   # trim line-end spaces
-    text = re.sub(r"\n{3,}", "\n\n", text)            # 3+ blank lines → 1
-    return text.strip()
\ No newline at end of file
+    return normalize(text, strip_headers=False, nfkc=False)
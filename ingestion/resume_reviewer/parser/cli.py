@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import glob
+import json
+import sys
+import time
 from pathlib import Path
 
 from . import parse_resume
+from .cache import ParseCache
 
 
 def main() -> None:
@@ -11,7 +16,11 @@ def main() -> None:
     # 1)  Parse arguments
     # ------------------------------------------------------------------ #
     ap = argparse.ArgumentParser(prog="parse-resume")
-    ap.add_argument("file", type=Path, help="Résumé file (PDF, DOCX, JPG, PNG, TIFF)")
+    ap.add_argument(
+        "paths",
+        nargs="+",
+        help="Résumé file(s) (PDF, DOCX, JPG, PNG, TIFF), directories or globs",
+    )
     ap.add_argument(
         "--plain",
         action="store_true",
@@ -22,12 +31,108 @@ def main() -> None:
         action="store_true",
         help="Emit full JSON instead of plain output",
     )
+    ap.add_argument(
+        "--cache",
+        type=Path,
+        metavar="DIR",
+        help="Reuse / store results in an on-disk parse cache",
+    )
+    ap.add_argument(
+        "--backend",
+        choices=("fast", "layout"),
+        default="fast",
+        help="PDF text extraction: pypdfium2 with pdfplumber fallback, or pdfplumber only",
+    )
+    ap.add_argument(
+        "--layout",
+        action="store_true",
+        help="Add PDF layout features (columns, fonts, whitespace, tables) to meta.layout",
+    )
+    ap.add_argument(
+        "--proofread",
+        action="store_true",
+        help="Add spelling, tense, passive-voice and language findings to meta.proofread",
+    )
+    ap.add_argument(
+        "--page-workers",
+        type=int,
+        default=0,
+        help="Extract long PDFs page-parallel (single-file mode only)",
+    )
+    ap.add_argument(
+        "--max-pages",
+        type=int,
+        help="Stop extracting after this many pages (partial result, noted in parser_notes)",
+    )
+    ap.add_argument(
+        "--max-chars",
+        type=int,
+        help="Stop extracting after this many characters of text",
+    )
+    ap.add_argument(
+        "--sandbox",
+        action="store_true",
+        help="Parse in a CPU-, memory- and time-limited child process (batch: per-worker "
+        "memory cap and per-file timeout); --max-pages/--max-chars override its defaults",
+    )
+
+    batch = ap.add_argument_group("batch mode (several files, a directory or a glob)")
+    batch.add_argument(
+        "--batch",
+        action="store_true",
+        help="Force JSON-lines batch output even for a single file",
+    )
+    batch.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count; 1 = no pool)",
+    )
+    batch.add_argument(
+        "--chunksize",
+        type=int,
+        default=4,
+        help="Files handed to a worker at a time",
+    )
+    batch.add_argument(
+        "-o", "--output",
+        type=Path,
+        help="Write JSON lines here instead of stdout (a directory for --format parquet)",
+    )
+    batch.add_argument(
+        "--format",
+        choices=("jsonl", "parquet"),
+        default="jsonl",
+        help="Batch output: JSON lines, or resumes/experience/education/skills Parquet tables",
+    )
     args = ap.parse_args()
 
+    single = Path(args.paths[0])
+    if args.batch or len(args.paths) > 1 or single.is_dir() or glob.has_magic(args.paths[0]):
+        if args.page_workers > 1:  # the pool's workers can't fork page workers
+            ap.error("--page-workers is for a single file; use -j/--workers in batch mode")
+        _run_batch(args)
+        return
+
     # ------------------------------------------------------------------ #
     # 2)  Run the parser
     # ------------------------------------------------------------------ #
-    result = parse_resume(args.file, convert_to_md=not args.plain)
+    options = dict(
+        convert_to_md=not args.plain,
+        cache=ParseCache(args.cache) if args.cache else None,
+        page_workers=args.page_workers,
+        backend=args.backend,
+        layout=args.layout,
+        proofread=args.proofread,
+    )
+    if args.sandbox:
+        from .sandbox import parse_resume_sandboxed
+
+        result = parse_resume_sandboxed(single, limits=_limits(args), **options)
+    else:
+        result = parse_resume(
+            single, max_pages=args.max_pages, max_chars=args.max_chars, **options
+        )
 
     # ------------------------------------------------------------------ #
     # 3)  Output
@@ -43,5 +148,68 @@ def main() -> None:
     print(result.text)
 
 
+def _limits(args: argparse.Namespace):
+    """``--sandbox`` limits: the defaults, with the page/text flags applied."""
+    from .sandbox import DEFAULT_LIMITS
+
+    given = {"max_pages": args.max_pages, "max_chars": args.max_chars}
+    return DEFAULT_LIMITS._replace(**{k: v for k, v in given.items() if v is not None})
+
+
+def _run_batch(args: argparse.Namespace) -> None:
+    """Stream one JSON object per file as results finish, then a summary."""
+    from .batch import iter_inputs, parse_many
+
+    paths = list(iter_inputs(args.paths))
+    if args.format == "parquet":
+        if not args.output:
+            sys.exit("--format parquet needs -o DIR")
+        from .core import ParsedResume
+        from .export import ParquetExporter
+
+        sink = ParquetExporter(args.output)
+    else:
+        sink = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    ok = failed = 0
+    t0 = time.perf_counter()
+    try:
+        for record in parse_many(
+            paths,
+            workers=args.workers,
+            chunksize=args.chunksize,
+            convert_to_md=not args.plain,
+            cache_root=args.cache,
+            backend=args.backend,
+            layout=args.layout,
+            proofread=args.proofread,
+            limits=_limits(args) if args.sandbox else None,
+            max_pages=args.max_pages,
+            max_chars=args.max_chars,
+        ):
+            if record["ok"]:
+                ok += 1
+            else:
+                failed += 1
+            if args.format == "parquet":
+                if record["ok"]:
+                    sink.write(ParsedResume.from_dict(record["result"]))
+                else:
+                    print(f"[FAILED] {record['source']}: {record['error']}", file=sys.stderr)
+                continue
+            sink.write(json.dumps(record, ensure_ascii=False) + "\n")
+            sink.flush()
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+
+    elapsed = time.perf_counter() - t0
+    rate = len(paths) / elapsed if elapsed else 0.0
+    print(
+        f"[SUMMARY] {len(paths)} files, {ok} ok, {failed} failed "
+        f"in {elapsed:.1f}s ({rate:.2f} files/sec)",
+        file=sys.stderr,
+    )
+
+
 if __name__ == "__main__":
     main()
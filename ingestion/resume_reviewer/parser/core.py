@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import io
 import json
+import time
 from collections import namedtuple
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
-from .detector import detect
-from .pdf_parser import extract as pdf_extract
-from .docx_parser import extract as docx_extract
-from .image_parser import extract as img_extract
-from .cleanup import strip_headers_footers, normalize_whitespace
-from .markdown_utils import to_markdown
+from .cache import ParseCache, cache_variant
+from .detector import detect, detect_bytes
+from .document import LIMIT_NOTE, checksum_bytes, checksum_stream, clip_pages
+from .registry import get_extractor
+from .cleanup import normalize
 from .structure import to_schema
-import pdfplumber
+
+if TYPE_CHECKING:
+    from .ocr import OcrEngine
+    from .records import ResumeRecord
 
 # --------------------------------------------------------------------------- #
 class ParsedResume(namedtuple("ParsedResume", ["text", "metadata", "structured"])):
@@ -27,10 +32,32 @@ class ParsedResume(namedtuple("ParsedResume", ["text", "metadata", "structured"]
             "structured": self.structured,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ParsedResume":
+        return cls(data["text"], data["metadata"], data["structured"])
+
     def to_json(self, **json_kwargs) -> str:
         default = {"ensure_ascii": False, "indent": 2}
         default.update(json_kwargs)
         return json.dumps(self.to_dict(), **default)
+
+    def record(self) -> "ResumeRecord":
+        """``structured`` as compact slotted records (see ``records``)."""
+        from .records import ResumeRecord
+
+        return ResumeRecord.from_dict(self.structured)
+
+    def to_msgpack(self) -> bytes:
+        """Compact binary form (see ``export``); needs ``msgpack``."""
+        from .export import to_msgpack
+
+        return to_msgpack(self)
+
+    @classmethod
+    def from_msgpack(cls, data: bytes) -> "ParsedResume":
+        from .export import from_msgpack
+
+        return from_msgpack(data)
 # --------------------------------------------------------------------------- #
 
 
@@ -38,6 +65,15 @@ def parse_resume(
     path: str | Path,
     *,
     convert_to_md: bool = True,
+    cache: ParseCache | None = None,
+    page_workers: int = 0,
+    backend: str = "fast",
+    ocr: OcrEngine | bool = True,
+    layout: bool = False,
+    proofread: bool = False,
+    profile: bool = False,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
 ) -> ParsedResume:
     """
     Parse a résumé file and return cleaned text + metadata.
@@ -48,6 +84,35 @@ def parse_resume(
         File to parse (PDF, DOCX, or image).
     convert_to_md : bool, default True
         Convert cleaned text to Markdown.
+    cache : ParseCache | None
+        Return a previous result for identical content instead of parsing.
+    page_workers : int, default 0
+        Extract long PDFs page-parallel in this many processes (0/1 = serial).
+        Don't combine with the batch pool, whose workers can't fork children.
+        Only the ``"layout"`` backend splits work across pages.
+    backend : {"fast", "layout"}, default "fast"
+        PDF text extraction: ``"fast"`` uses pypdfium2 and re-extracts
+        pages whose text looks degenerate with pdfplumber; ``"layout"`` uses
+        pdfplumber for every page.
+    ocr : OcrEngine | bool, default True
+        Engine used for images and for PDF pages without a text layer.
+        ``True`` uses the shared default engine, ``False`` disables the
+        per-page PDF fallback and leaves images unread: their text is empty
+        and ``parser_notes`` says OCR was off.
+    layout : bool, default False
+        Add PDF layout features (columns, font sizes, whitespace, tables,
+        images, density) to ``meta.layout``, measured on the pages the PDF
+        backend has open rather than in a second parse; see ``layout``.
+    proofread : bool, default False
+        Add spelling, tense, passive-voice and language findings to
+        ``meta.proofread``; see ``proofread.proofread``.
+    profile : bool, default False
+        Break the cleanup time in ``meta.timings`` down per stage.
+    max_pages, max_chars : int | None
+        Stop extracting after this many pages / characters of text and
+        return the partial result, with a ``"limit: ..."`` entry in
+        ``parser_notes``.  Partial results are not cached.  For CPU-time and
+        memory limits as well see ``sandbox.parse_resume_sandboxed``.
 
     Returns
     -------
@@ -56,35 +121,184 @@ def parse_resume(
     path = Path(path).expanduser().resolve()
     filetype = detect(path)
 
-    # ---------- extraction --------------------------------------------------
-    if filetype == "pdf":
-        raw_text = pdf_extract(path)
-        # Get page count for PDFs
-        with pdfplumber.open(path) as pdf:
-            page_count = len(pdf.pages)
-    elif filetype == "docx":
-        raw_text = docx_extract(path)
-        page_count = 1  # DOCX files are typically single-page documents
-    elif filetype in {"jpg", "jpeg", "png", "tiff"}:
-        raw_text = img_extract(path)
-        page_count = 1  # Images are single-page
-    else:
-        raise ValueError(f"Unsupported file type: {filetype}")
-
-    # ---------- cleanup -----------------------------------------------------
-    cleaned = normalize_whitespace(strip_headers_footers(raw_text))
-        # ---------- optional Markdown conversion -------------------------------
-    if convert_to_md:
-        cleaned = to_markdown(cleaned)
-
-    structured = to_schema(cleaned, filepath=path)
-    structured["meta"]["page_count"] = page_count
-
-    return ParsedResume(
+    # ---------- extraction (one open: hash, then parse the same handle) ----
+    with open(path, "rb") as fp:
+        return _parse_stream(
+            fp,
+            filetype,
+            checksum_stream(fp),
+            source=str(path),
+            file_name=path.name,
+            convert_to_md=convert_to_md,
+            cache=cache,
+            page_workers=page_workers,
+            backend=backend,
+            ocr=ocr,
+            layout=layout,
+            proofread=proofread,
+            profile=profile,
+            max_pages=max_pages,
+            max_chars=max_chars,
+        )
+
+
+def parse_resume_bytes(
+    data: bytes | bytearray | memoryview | BinaryIO,
+    *,
+    filename: str | None = None,
+    convert_to_md: bool = True,
+    cache: ParseCache | None = None,
+    page_workers: int = 0,
+    backend: str = "fast",
+    ocr: OcrEngine | bool = True,
+    layout: bool = False,
+    proofread: bool = False,
+    profile: bool = False,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+) -> ParsedResume:
+    """
+    Parse a résumé held in memory (e.g. an upload) without a temp file.
+
+    The file type comes from the magic bytes, the checksum is computed over
+    the buffer itself, and the backends read it through a ``BytesIO`` that
+    shares the ``bytes`` object instead of copying it.  Other buffers and
+    file-like objects are materialised as ``bytes`` once.
+
+    *filename* only labels the result (``metadata.source`` and
+    ``meta.file_name``); the remaining parameters are as in ``parse_resume``.
+    """
+    if hasattr(data, "read"):
+        data = data.read()
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    filetype = detect_bytes(data)
+    name = filename or f"upload.{filetype}"
+
+    return _parse_stream(
+        io.BytesIO(data),
+        filetype,
+        checksum_bytes(data),
+        source=filename or "<bytes>",
+        file_name=Path(name).name,
+        convert_to_md=convert_to_md,
+        cache=cache,
+        page_workers=page_workers,
+        backend=backend,
+        ocr=ocr,
+        layout=layout,
+        proofread=proofread,
+        profile=profile,
+        max_pages=max_pages,
+        max_chars=max_chars,
+    )
+
+
+def _parse_stream(
+    fp: BinaryIO,
+    filetype: str,
+    checksum: str,
+    *,
+    source: str,
+    file_name: str,
+    convert_to_md: bool,
+    cache: ParseCache | None,
+    page_workers: int,
+    ocr: OcrEngine | bool,
+    backend: str = "fast",
+    layout: bool = False,
+    proofread: bool = False,
+    profile: bool = False,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+) -> ParsedResume:
+    variant = cache_variant(
+        convert_to_md=convert_to_md, backend=backend, layout=layout, proofread=proofread, ocr=ocr
+    )
+    if cache is not None:
+        hit = cache.get(checksum, **variant)
+        if hit is not None:
+            return _rebind(ParsedResume.from_dict(hit), source, file_name)
+    timings: dict[str, float] = {}
+    t0 = time.perf_counter()
+    extractor = get_extractor(filetype)  # imports the backend on first use
+    doc = extractor(
+        fp,
+        checksum,
+        page_workers=page_workers,
+        ocr=ocr,
+        markdown=convert_to_md,
+        backend=backend,
+        layout=layout,
+        max_pages=max_pages,
+        max_chars=max_chars,
+    )
+    # backends stop early where they can; this makes the cut exact
+    pages, cut = clip_pages(list(doc.pages), max_chars)
+    notes = [*doc.notes, cut] if cut else list(doc.notes)
+    t1 = time.perf_counter()
+    timings["extract"] = t1 - t0
+
+    # ---------- cleanup + optional Markdown headings (one fused pass) -------
+    cleaned = normalize(
+        "\n".join(pages), markdown=convert_to_md, timings=timings if profile else None
+    )
+    t2 = time.perf_counter()
+    timings["normalize"] = t2 - t1
+
+    structured = to_schema(
+        cleaned, filepath=Path(file_name), checksum=doc.checksum, normalized=True
+    )
+    timings["schema"] = time.perf_counter() - t2
+    structured["meta"]["page_count"] = doc.page_count
+    if layout and doc.layout is not None:
+        from .layout import summarize
+
+        t3 = time.perf_counter()
+        structured["meta"]["layout"] = summarize(doc.layout)
+        # the per-page part ran inside the extractor (and is in "extract" too)
+        timings["layout"] = sum(p["seconds"] for p in doc.layout) + time.perf_counter() - t3
+    if proofread:
+        from .proofread import proofread as check
+
+        t4 = time.perf_counter()
+        structured["meta"]["proofread"] = check(cleaned)
+        timings["proofread"] = time.perf_counter() - t4
+    structured["meta"]["timings"] = {k: round(v, 6) for k, v in timings.items()}
+    if doc.ocr:
+        structured["meta"]["ocr"] = doc.ocr
+        structured["parser_notes"].extend(_ocr_notes(doc.ocr))
+    structured["parser_notes"].extend(notes)
+
+    result = ParsedResume(
         text=cleaned,
-        metadata={"filetype": filetype, "source": str(path)},
+        metadata={"filetype": filetype, "source": source},
         structured=structured,
     )
+    # partial results (a limit, an OCR failure such as a missing tesseract)
+    # must not answer later parses that could do better
+    ocr_failed = any("error" in r for r in doc.ocr)
+    if cache is not None and not ocr_failed and not any(n.startswith(LIMIT_NOTE) for n in notes):
+        cache.put(checksum, result.to_dict(), **variant)
+    return result
+
 
+def _rebind(cached: ParsedResume, source: str, file_name: str) -> ParsedResume:
+    """Point a cached result at the file it was requested for."""
+    cached.metadata["source"] = source
+    cached.structured["meta"]["file_name"] = file_name
+    return cached
 
 
+def _ocr_notes(log: list[dict]) -> list[str]:
+    notes = []
+    failed = [r for r in log if "error" in r]
+    done = [r for r in log if "error" not in r]
+    if done:
+        secs = sum(r["seconds"] for r in done)
+        pages = ", ".join(str(r["page"]) for r in done)
+        notes.append(f"OCR on page(s) {pages} ({secs:.2f}s)")
+    if failed:
+        pages = ", ".join(str(r["page"]) for r in failed)
+        notes.append(f"OCR failed on page(s) {pages}: {failed[0]['error']}")
+    return notes
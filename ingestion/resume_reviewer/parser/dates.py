@@ -0,0 +1,99 @@
+"""
+Date normalisation for résumé date ranges → ``YYYY-MM`` / ``present``.
+
+CVs repeat a handful of forms (``Mar 2019``, ``03/2019``, ``2019``,
+``present``), so those are answered from a month table and a few anchored
+patterns, memoised, and ``dateutil`` is only imported for whatever is left.
+Year-only dates normalise to January so they still match the schema's
+``^[0-9]{4}-[0-9]{2}$``.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import re
+import unicodedata
+from functools import lru_cache
+
+_MONTH_NAMES = {
+    # en
+    1: "january jan", 2: "february feb", 3: "march mar", 4: "april apr",
+    5: "may", 6: "june jun", 7: "july jul", 8: "august aug",
+    9: "september sep sept", 10: "october oct", 11: "november nov", 12: "december dec",
+}
+_MONTH_NAMES_INTL = {
+    # de, fr, es, it, pt, nl
+    1: "januar jänner janvier janv enero ene gennaio gen janeiro januari",
+    2: "februar février févr fevrier fevr febrero febbraio fevereiro fev februari",
+    3: "märz maerz marz mär mars marzo março marco maart mrt",
+    4: "avril avr abril abr aprile",
+    5: "mai mayo maggio mag maio mei",
+    6: "juni juin junio giugno giu junho",
+    7: "juli juillet juil julio luglio lug julho",
+    8: "août aout agosto ago augustus",
+    9: "septembre septiembre settembre set setembro",
+    10: "oktober okt octobre octubre ottobre ott outubro out",
+    11: "novembre noviembre novembro",
+    12: "dezember dez décembre decembre diciembre dic dicembre dezembro",
+}
+MONTHS: dict[str, int] = {
+    name: num
+    for table in (_MONTH_NAMES, _MONTH_NAMES_INTL)
+    for num, names in table.items()
+    for name in names.split()
+}
+
+PRESENT = frozenset(
+    "present current now today ongoing heute aktuell derzeit présent actuel "
+    "presente actualidad actual oggi attuale atual heden nu".split()
+)
+
+_MON_YEAR_RE = re.compile(r"^([^\W\d_]+)\.?,?\s*(?:(\d{4})|['’](\d{2}))$")
+_NUM_YEAR_RE = re.compile(r"^(\d{1,2})\s*[./-]\s*(\d{4})$")
+_YEAR_NUM_RE = re.compile(r"^(\d{4})\s*[./-]\s*(\d{1,2})$")
+_YEAR_RE = re.compile(r"^(\d{4})$")
+_TRAILING_YEAR_RE = re.compile(r"\b((?:19|20)\d{2})$")
+
+# dateutil fills missing fields from this instead of today's date
+_DEFAULT = dt.datetime(2000, 1, 1)
+
+
+def _century(yy: str) -> int:
+    """'19' → 2019, '98' → 1998 (pivot on the current year)."""
+    y = 2000 + int(yy)
+    return y if y <= dt.date.today().year + 1 else y - 100
+
+
+def _ym(year: str | int, month: int) -> str:
+    return f"{int(year):04d}-{month:02d}" if 1 <= month <= 12 else ""
+
+
+@lru_cache(maxsize=2048)
+def normalize_date(raw: str) -> str:
+    """``'Mär. 2019'`` → ``'2019-03'``; ``'heute'`` → ``'present'``; ``''`` if unparseable."""
+    s = unicodedata.normalize("NFKC", raw).strip().lower()
+    if not s:
+        return ""
+    if s in PRESENT:
+        return "present"
+    if m := _MON_YEAR_RE.match(s):
+        year = m.group(2) or _century(m.group(3))
+        # "Company 2019": no month word, keep year precision only
+        return _ym(year, MONTHS.get(m.group(1), 1))
+    if m := _NUM_YEAR_RE.match(s):
+        return _ym(m.group(2), int(m.group(1)))
+    if m := _YEAR_NUM_RE.match(s):
+        return _ym(m.group(1), int(m.group(2)))
+    if _YEAR_RE.match(s):
+        return _ym(s, 1)
+    return _slow_path(s)
+
+
+def _slow_path(s: str) -> str:
+    from dateutil import parser as date_parse
+
+    try:
+        return date_parse.parse(s, default=_DEFAULT).strftime("%Y-%m")
+    except (ValueError, OverflowError):
+        m = _TRAILING_YEAR_RE.search(s)
+        return _ym(m.group(1), 1) if m else ""
@@ -1,11 +1,42 @@
-import pathlib, filetype
+import io, pathlib, zipfile
+
+from .registry import filetypes
+
 
 def detect(path: str) -> str:
     """Return 'pdf', 'docx', 'jpg', etc.; raise on unknown."""
     ext = pathlib.Path(path).suffix.lower().lstrip(".")
-    if ext in {"pdf", "docx", "jpg", "jpeg", "png", "tiff"}:
+    if ext in filetypes():
         return ext
+    import filetype
+
     kind = filetype.guess(path)
     if kind is None:
         raise ValueError(f"Unsupported file type: {path}")
-    return kind.extension
\ No newline at end of file
+    return kind.extension
+
+
+def detect_bytes(buf) -> str:
+    """Like ``detect`` but sniffs the magic bytes of an in-memory file."""
+    head = bytes(buf[:1024])
+    if b"%PDF-" in head:  # the spec tolerates junk before the header
+        return "pdf"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith((b"II*\x00", b"MM\x00*")):
+        return "tiff"
+    if head.startswith(b"PK\x03\x04"):
+        try:
+            with zipfile.ZipFile(io.BytesIO(buf)) as zf:
+                if "word/document.xml" in zf.namelist():
+                    return "docx"
+        except zipfile.BadZipFile:
+            pass
+    import filetype
+
+    kind = filetype.guess(head)
+    if kind is None:
+        raise ValueError("Unsupported file type: unrecognised magic bytes")
+    return kind.extension
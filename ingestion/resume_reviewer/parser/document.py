@@ -0,0 +1,105 @@
+"""Extraction result shared by the file-type backends + streaming checksum."""
+
+from __future__ import annotations
+
+import hashlib
+from collections import namedtuple
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+CHUNK_SIZE = 1 << 20  # 1 MiB
+CHUNK_LINES = 1024  # lines per ``line_chunks`` batch of an iterable
+LIMIT_NOTE = "limit: "  # prefix of the parser notes about a max_pages / max_chars cut
+
+
+class Extraction(
+    namedtuple(
+        "Extraction",
+        ["pages", "page_count", "checksum", "ocr", "notes", "layout"],
+        defaults=((), (), None),
+    )
+):
+    """Per-page text, page count and content hash from a single open.
+
+    ``ocr`` holds one timing record per page that went through OCR;
+    ``notes`` are backend remarks that end up in ``parser_notes``;
+    ``layout`` the per-page ``layout`` features when they were asked for.
+    """
+    __slots__ = ()
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.pages)
+
+
+def clip_pages(pages: list[str], max_chars: int | None) -> tuple[list[str], str | None]:
+    """The leading *pages* holding at most *max_chars* characters, and a note if cut."""
+    if max_chars is None or sum(map(len, pages)) <= max_chars:
+        return pages, None
+    kept: list[str] = []
+    left = max_chars
+    for page in pages:
+        if left <= 0:
+            break
+        kept.append(page[:left])
+        left -= len(page)
+    return kept, f"{LIMIT_NOTE}text cut at {max_chars} characters (max_chars)"
+
+
+def page_limit_note(done: int, total: int, reason: str) -> str:
+    return f"{LIMIT_NOTE}stopped after {done} of {total} pages ({reason})"
+
+
+def discard_file(path: str | Path) -> None:
+    """Delete *path* if it is still there (a cache entry another process may have evicted)."""
+    Path(path).unlink(missing_ok=True)
+
+
+def checksum_stream(fp: BinaryIO, *, chunk_size: int = CHUNK_SIZE) -> str:
+    """Hash *fp* chunk-by-chunk from its current position, then rewind."""
+    start = fp.tell()
+    h = hashlib.sha256()
+    for chunk in iter(lambda: fp.read(chunk_size), b""):
+        h.update(chunk)
+    fp.seek(start)
+    return f"sha256:{h.hexdigest()}"
+
+
+def checksum_bytes(buf) -> str:
+    """Hash an in-memory buffer (bytes, bytearray, memoryview) without copying."""
+    return f"sha256:{hashlib.sha256(buf).hexdigest()}"
+
+
+def checksum_file(path: str | Path) -> str:
+    with open(path, "rb") as fp:
+        return checksum_stream(fp)
+
+
+def iter_lines(text: str | Iterable[str]) -> Iterator[str]:
+    """Lines of *text* without materialising a list of them."""
+    if not isinstance(text, str):
+        yield from text
+        return
+    for lines in line_chunks(text):
+        yield from lines
+
+
+def line_chunks(text: str | Iterable[str], *, chunk: int = 1 << 16) -> Iterator[list[str]]:
+    """
+    The lines of *text* in lists, for loops that want ``str.split`` speed
+    without a list of every line: a string is split on ``"\\n"`` only, about
+    *chunk* characters at a time; an iterable of lines is batched.
+    """
+    if not isinstance(text, str):
+        it = iter(text)
+        while batch := list(islice(it, CHUNK_LINES)):
+            yield batch
+        return
+    start, n = 0, len(text)
+    while start < n:
+        end = text.find("\n", start + chunk)
+        if end < 0:
+            end = n - 1 if text.endswith("\n") else n  # no empty last line
+        yield text[start:end].split("\n")
+        start = end + 1
@@ -0,0 +1,262 @@
+"""
+Compact binary and columnar forms of ``ParsedResume``.
+
+* msgpack: one résumé per blob, tagged with ``FORMAT_VERSION`` so a loader
+  can refuse payloads it does not understand.
+* Arrow / Parquet: a batch of résumés as four tables joined on
+  ``resume_id`` — ``resumes`` (one row per CV with the scalar fields analytics
+  usually filter on), and child tables ``experience``, ``education`` and
+  ``skills`` (one row per entry / skill).  Whatever is not flattened is kept
+  as JSON in ``resumes.metadata_json`` / ``structured_json``, so
+  ``from_arrow`` and ``read_parquet`` give back the exact same objects.
+
+``msgpack`` and ``pyarrow`` are optional and only imported when used.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from .core import ParsedResume
+
+FORMAT_VERSION = 1
+TABLES = ("resumes", "experience", "education", "skills")
+ENTRY_FIELDS = ("title", "employer", "location", "start_date", "end_date")
+FLATTENED = ("experience", "education", "skills")  # sections with child tables
+
+
+# ---- msgpack ------------------------------------------------------------------
+def to_msgpack(result: ParsedResume) -> bytes:
+    import msgpack
+
+    return msgpack.packb({"format": FORMAT_VERSION, **result.to_dict()}, use_bin_type=True)
+
+
+def from_msgpack(data: bytes) -> ParsedResume:
+    import msgpack
+
+    from .core import ParsedResume
+
+    payload = msgpack.unpackb(data, raw=False)
+    version = payload.pop("format", None)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported msgpack format version: {version!r}")
+    return ParsedResume.from_dict(payload)
+
+
+# ---- Arrow ---------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _schemas() -> dict[str, pa.Schema]:
+    import pyarrow as pa
+
+    entry = [(name, pa.string()) for name in ENTRY_FIELDS]
+    key = [("resume_id", pa.int64()), ("position", pa.int32())]
+    return {
+        "resumes": pa.schema([
+            ("resume_id", pa.int64()),
+            ("checksum", pa.string()),
+            ("file_name", pa.string()),
+            ("filetype", pa.dictionary(pa.int8(), pa.string())),
+            ("source", pa.string()),
+            ("parser_version", pa.dictionary(pa.int8(), pa.string())),
+            ("parsed_at", pa.string()),
+            ("page_count", pa.int32()),
+            ("full_name", pa.string()),
+            ("email", pa.string()),
+            ("phone", pa.string()),
+            ("text", pa.large_string()),
+            ("metadata_json", pa.string()),
+            ("structured_json", pa.string()),
+        ]),
+        "experience": pa.schema(key + entry + [("bullets", pa.list_(pa.string()))]),
+        "education": pa.schema(key + entry),
+        "skills": pa.schema(key + [
+            ("kind", pa.dictionary(pa.int8(), pa.string())),
+            ("skill", pa.string()),
+        ]),
+    }
+
+
+class _Rows:
+    """Column buffers for the four tables."""
+
+    def __init__(self):
+        self.columns = {
+            name: {field: [] for field in schema.names} for name, schema in _schemas().items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.columns["resumes"]["resume_id"])
+
+    def add(self, resume_id: int, result: ParsedResume) -> None:
+        s = result.structured
+        meta, candidate, sections = s["meta"], s["candidate"], s["sections"]
+        rest = {**s, "sections": {k: None if k in FLATTENED else v for k, v in sections.items()}}
+        # skill kinds in order, so kinds without rows ("other": []) come back too
+        rest["sections"]["skills"] = list(sections.get("skills", {})) or None
+        contact = candidate.get("contact", {})
+        _append(self.columns["resumes"], {
+            "resume_id": resume_id,
+            "checksum": meta.get("checksum"),
+            "file_name": meta.get("file_name"),
+            "filetype": result.metadata.get("filetype"),
+            "source": result.metadata.get("source"),
+            "parser_version": meta.get("parser_version"),
+            "parsed_at": meta.get("parsed_at"),
+            "page_count": meta.get("page_count"),
+            "full_name": candidate.get("full_name"),
+            "email": contact.get("email"),
+            "phone": contact.get("phone"),
+            "text": result.text,
+            "metadata_json": json.dumps(result.metadata, ensure_ascii=False),
+            "structured_json": json.dumps(rest, ensure_ascii=False),
+        })
+        for table in ("experience", "education"):
+            cols = self.columns[table]
+            for pos, entry in enumerate(sections.get(table, ())):
+                row = {"resume_id": resume_id, "position": pos}
+                row.update((f, entry.get(f, "")) for f in ENTRY_FIELDS)
+                if table == "experience":
+                    row["bullets"] = entry.get("bullets", [])
+                _append(cols, row)
+        skills = self.columns["skills"]
+        for kind, values in sections.get("skills", {}).items():
+            for pos, skill in enumerate(values):
+                _append(skills, {
+                    "resume_id": resume_id, "position": pos, "kind": kind, "skill": skill,
+                })
+
+    def tables(self) -> dict[str, pa.Table]:
+        import pyarrow as pa
+
+        return {
+            name: pa.Table.from_pydict(self.columns[name], schema=schema)
+            for name, schema in _schemas().items()
+        }
+
+
+def _append(columns: dict[str, list], row: dict) -> None:
+    for field, values in columns.items():
+        values.append(row[field])
+
+
+def to_arrow(results: Iterable[ParsedResume], *, first_id: int = 0) -> dict[str, pa.Table]:
+    """``{"resumes": ..., "experience": ..., "education": ..., "skills": ...}``."""
+    rows = _Rows()
+    for resume_id, result in enumerate(results, first_id):
+        rows.add(resume_id, result)
+    return rows.tables()
+
+
+def from_arrow(tables: dict[str, pa.Table]) -> Iterator[ParsedResume]:
+    """Rebuild ``ParsedResume`` objects from ``to_arrow`` / ``read_parquet`` tables."""
+    from .core import ParsedResume
+
+    order = [("resume_id", "ascending"), ("position", "ascending")]
+    children: dict[str, dict[int, list]] = {name: {} for name in FLATTENED}
+    for table in ("experience", "education"):
+        for row in tables[table].sort_by(order).to_pylist():
+            entry = {f: row[f] for f in ENTRY_FIELDS}
+            if table == "experience":
+                entry["bullets"] = row["bullets"]
+            children[table].setdefault(row["resume_id"], []).append(entry)
+    for row in tables["skills"].sort_by(order).to_pylist():
+        kinds = children["skills"].setdefault(row["resume_id"], {})
+        kinds.setdefault(row["kind"], []).append(row["skill"])
+
+    resumes = tables["resumes"]
+    ids = resumes.column("resume_id").to_pylist()
+    texts = resumes.column("text").to_pylist()
+    metas = resumes.column("metadata_json").to_pylist()
+    rests = resumes.column("structured_json").to_pylist()
+    for resume_id, text, meta, rest in zip(ids, texts, metas, rests):
+        structured = json.loads(rest)
+        sections = structured["sections"]
+        sections["experience"] = children["experience"].get(resume_id, [])
+        sections["education"] = children["education"].get(resume_id, [])
+        skills = children["skills"].get(resume_id, {})
+        kinds = sections.get("skills") or ("hard", "soft")  # None: written before kinds were kept
+        sections["skills"] = {**{k: skills.pop(k, []) for k in kinds}, **skills}
+        yield ParsedResume(text, json.loads(meta), structured)
+
+
+# ---- Parquet --------------------------------------------------------------------
+class ParquetExporter:
+    """
+    Stream résumés into ``<directory>/{resumes,experience,education,skills}.parquet``.
+
+    Rows are buffered and written as one row group per *batch_size* résumés,
+    so memory stays flat however many CVs go through::
+
+        with ParquetExporter("out/") as export:
+            for res in results:
+                export.write(res)
+    """
+
+    def __init__(self, directory: str | Path, *, batch_size: int = 1024, compression: str = "zstd"):
+        import pyarrow.parquet as pq
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self._writers = {
+            name: pq.ParquetWriter(self.directory / f"{name}.parquet", schema, compression=compression)
+            for name, schema in _schemas().items()
+        }
+        self._rows = _Rows()
+        self._next_id = 0
+
+    def write(self, result: ParsedResume) -> None:
+        self._rows.add(self._next_id, result)
+        self._next_id += 1
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, results: Iterable[ParsedResume]) -> None:
+        for result in results:
+            self.write(result)
+
+    def flush(self) -> None:
+        if not len(self._rows):
+            return
+        for name, table in self._rows.tables().items():
+            self._writers[name].write_table(table)
+        self._rows = _Rows()
+
+    def close(self) -> None:
+        self.flush()
+        for writer in self._writers.values():
+            writer.close()
+
+    def __enter__(self) -> "ParquetExporter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_parquet(results: Iterable[ParsedResume], directory: str | Path, **kwargs) -> None:
+    with ParquetExporter(directory, **kwargs) as export:
+        export.write_many(results)
+
+
+def read_tables(directory: str | Path, *, columns: dict[str, list[str]] | None = None) -> dict[str, pa.Table]:
+    """The four tables as Arrow, e.g. for analytics; *columns* prunes per table."""
+    import pyarrow.parquet as pq
+
+    directory = Path(directory)
+    columns = columns or {}
+    return {
+        name: pq.read_table(directory / f"{name}.parquet", columns=columns.get(name))
+        for name in TABLES
+    }
+
+
+def read_parquet(directory: str | Path) -> Iterator[ParsedResume]:
+    return from_arrow(read_tables(directory))
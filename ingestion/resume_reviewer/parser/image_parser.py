@@ -1,5 +1,31 @@
 from PIL import Image
-import pytesseract
 
-def extract(path: str) -> str:
-    return pytesseract.image_to_string(Image.open(path))
\ No newline at end of file
+from .document import Extraction
+from .ocr import OcrEngine, OcrPage, default_engine, resolve_engine
+
+
+def extract_page(source, engine: OcrEngine | None = None) -> OcrPage:
+    """OCR an image given as a path or binary stream, with timing."""
+    engine = engine or default_engine()
+    with Image.open(source) as img:
+        return engine.ocr(img)
+
+
+def extract(source) -> str:
+    return extract_page(source).text
+
+
+OCR_OFF_NOTE = "image not read: OCR is disabled (ocr=False)"
+
+
+def extract_file(fp, checksum: str, *, ocr=True, **_) -> Extraction:
+    """
+    Registry entry point; images are single-page and read by OCR only, so
+    with *ocr* off the page stays empty and a parser note says why.
+    """
+    engine = resolve_engine(ocr)
+    if engine is None:
+        return Extraction([""], 1, checksum, (), [OCR_OFF_NOTE])
+    res = extract_page(fp, engine)
+    log = [{"page": 1, "seconds": round(res.seconds, 4), "chars": len(res.text)}]
+    return Extraction([res.text], 1, checksum, log)
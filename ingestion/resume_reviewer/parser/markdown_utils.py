@@ -1,4 +1,97 @@
-from markdownify import markdownify as md
+"""
+Markdown from PDF layout instead of an HTML round-trip.
 
-def to_markdown(text: str) -> str:
-    return md(text, heading_style="ATX")
\ No newline at end of file
+``page_to_markdown`` works from pdfplumber's text lines and their characters.
+One vectorised pass over the page's character table gives every line its
+mean font size and bold share; lines set clearly larger than the body size
+become headings (bold short lines too, when the body is not bold).  Glyph
+bullets become ``-`` items nested by indentation, and hanging-indent
+continuation lines are folded into their item.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+BULLET_GLYPHS = frozenset("•◦▪▫‣●○■□◆◇►▶➢➤✓✔")
+ASCII_BULLETS = frozenset("-*–·")  # only with a following space
+HEADING_RATIOS = (1.6, 1.3, 1.1)  # size / body size for "#", "##", "###"
+BOLD_HEADING_MAX_CHARS = 40
+INDENT_STEP = 2.0  # body-size ems per list nesting level
+
+
+def page_to_markdown(page) -> str:
+    """Markdown for one pdfplumber page."""
+    return lines_to_markdown(page.extract_text_lines(return_chars=True))
+
+
+def lines_to_markdown(lines: list[dict]) -> str:
+    """Markdown for pdfplumber text lines (``extract_text_lines(return_chars=True)``)."""
+    n_lines = len(lines)
+    counts = np.fromiter((len(ln["chars"]) for ln in lines), np.intp, n_lines)
+    chars = [c for ln in lines for c in ln["chars"]]
+    if not chars:
+        return "\n".join(ln["text"] for ln in lines)
+
+    # ---- per-character table -> per-line font statistics ------------------
+    size = np.fromiter((c["size"] for c in chars), float, len(chars))
+    fonts, font_idx = np.unique([c["fontname"] for c in chars], return_inverse=True)
+    bold = np.array([_is_bold(f) for f in fonts])[font_idx]
+    line_of = np.repeat(np.arange(n_lines), counts)
+    per_line = np.maximum(counts, 1)
+    line_size = np.bincount(line_of, size, n_lines) / per_line
+    line_bold = np.bincount(line_of, bold, n_lines) / per_line
+
+    # body text is whatever size most characters are set in (0.5 pt bins)
+    half_pts = np.round(size * 2)
+    bins, bin_idx = np.unique(half_pts, return_inverse=True)
+    body_bin = np.bincount(bin_idx).argmax()
+    body = bins[body_bin] / 2
+    body_is_bold = bold[bin_idx == body_bin].mean() >= 0.5
+
+    ratio = line_size / body
+    level = np.select([ratio >= r for r in HEADING_RATIOS], [1, 2, 3], 0)
+    if not body_is_bold:
+        short = np.fromiter(
+            (len(ln["text"]) <= BOLD_HEADING_MAX_CHARS for ln in lines), bool, n_lines
+        )
+        level = np.where((level == 0) & (line_bold > 0.9) & short, 3, level)
+
+    x0 = np.fromiter((ln["x0"] for ln in lines), float, n_lines)
+    items = [_bullet_text(ln["text"].strip()) for ln in lines]
+    is_item = np.fromiter((t is not None for t in items), bool, n_lines)
+    margin = x0[is_item].min() if is_item.any() else 0.0
+    depth = np.maximum(np.floor((x0 - margin) / (body * INDENT_STEP)), 0).astype(int)
+
+    # ---- emit -----------------------------------------------------------------
+    out: list[str] = []
+    item_x = None  # x0 of the open list item's glyph
+    for i, ln in enumerate(lines):
+        text = ln["text"].strip()
+        if level[i]:
+            out.append(f"{'#' * level[i]} {text}")
+            item_x = None
+        elif items[i] is not None:
+            out.append(f"{'  ' * depth[i]}- {items[i]}")
+            item_x = x0[i]
+        elif item_x is not None and item_x + body * 0.5 < x0[i] < item_x + body * 3:
+            out[-1] += f" {text}"  # hanging indent: the item wraps
+        else:
+            out.append(text)
+            item_x = None
+    return "\n".join(out)
+
+
+def _is_bold(fontname: str) -> bool:
+    name = fontname.lower()
+    return "bold" in name or "black" in name or "heavy" in name
+
+
+def _bullet_text(text: str) -> str | None:
+    """The item text if *text* starts with a bullet, else ``None``."""
+    head = text[:1]
+    if head in BULLET_GLYPHS:
+        return text[1:].lstrip()
+    if head in ASCII_BULLETS and text[1:2] == " ":
+        return text[2:].lstrip()
+    return None
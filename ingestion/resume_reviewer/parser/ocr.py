@@ -0,0 +1,153 @@
+"""Pooled OCR engine: preprocessing, bounded worker pool, per-page timings.
+
+``pytesseract`` shells out to one ``tesseract`` process per call, so a thread
+pool is enough to keep several of them busy; ``max_workers`` bounds how many
+run at once.  Each image is converted to grayscale, downscaled to
+``target_dpi`` and binarised (Otsu threshold) before it is handed over, which
+is what dominates tesseract's run time on full-resolution scans.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from PIL import Image
+
+# tesseract's own OpenMP threads fight with our pool; one thread per process
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+DEFAULT_DPI = 300
+
+
+class OcrPage(namedtuple("OcrPage", ["text", "seconds", "size"])):
+    """OCR text with wall time and the (w, h) of the image actually OCR'd."""
+    __slots__ = ()
+
+
+class OcrEngine:
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        target_dpi: int = DEFAULT_DPI,
+        binarize: bool = True,
+        lang: str = "eng",
+        config: str = "",
+    ):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.target_dpi = target_dpi
+        self.binarize = binarize
+        self.lang = lang
+        self.config = config
+        self._pool: ThreadPoolExecutor | None = None
+
+    @property
+    def cache_key(self) -> str:
+        """The settings that change the text (not ``max_workers``), for ``ParseCache``."""
+        return f"{self.lang}/{self.target_dpi}/{int(self.binarize)}/{self.config}"
+
+    # ---- pool lifecycle --------------------------------------------------
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="ocr")
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getstate__(self):
+        # executors don't pickle; worker processes build their own pool
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    # ---- OCR -------------------------------------------------------------
+    def preprocess(self, image: Image.Image, *, source_dpi: float | None = None) -> Image.Image:
+        """Grayscale → downscale to ``target_dpi`` → binarise."""
+        img = image.convert("L")
+        dpi = source_dpi or _image_dpi(image)
+        if dpi and dpi > self.target_dpi:
+            scale = self.target_dpi / dpi
+            img = img.resize(
+                (max(1, round(img.width * scale)), max(1, round(img.height * scale))),
+                Image.LANCZOS,
+            )
+        if self.binarize:
+            t = _otsu_threshold(img.histogram())
+            img = img.point([255 if v > t else 0 for v in range(256)], mode="1")
+        return img
+
+    def ocr(self, image: Image.Image, *, source_dpi: float | None = None) -> OcrPage:
+        import pytesseract
+
+        t0 = time.perf_counter()
+        img = self.preprocess(image, source_dpi=source_dpi)
+        text = pytesseract.image_to_string(img, lang=self.lang, config=self.config)
+        return OcrPage(text, time.perf_counter() - t0, img.size)
+
+    def ocr_many(
+        self, images: Iterable[Image.Image], *, source_dpi: float | None = None
+    ) -> list[OcrPage]:
+        """OCR a batch of images on the pool; results keep the input order."""
+        futures = [self.pool.submit(self.ocr, img, source_dpi=source_dpi) for img in images]
+        return [f.result() for f in futures]
+
+
+_DEFAULT: OcrEngine | None = None
+
+
+def default_engine() -> OcrEngine:
+    """Process-wide shared engine, created on first use."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = OcrEngine()
+    return _DEFAULT
+
+
+def resolve_engine(ocr: "OcrEngine | bool | None") -> OcrEngine | None:
+    """``True`` → shared engine, ``False``/``None`` → no OCR, engine → itself."""
+    if ocr is True:
+        return default_engine()
+    return ocr or None
+
+
+def _image_dpi(image: Image.Image) -> float | None:
+    dpi = image.info.get("dpi")
+    if not dpi:
+        return None
+    return float(dpi[0] if isinstance(dpi, tuple) else dpi)
+
+
+def _otsu_threshold(hist: list[int]) -> int:
+    """Threshold maximising between-class variance of a 256-bin histogram."""
+    total = sum(hist)
+    sum_all = sum(i * h for i, h in enumerate(hist))
+    sum_bg = weight_bg = 0
+    best_t, best_var = 127, -1.0
+    for t, h in enumerate(hist):
+        weight_bg += h
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+        sum_bg += t * h
+        mean_bg = sum_bg / weight_bg
+        mean_fg = (sum_all - sum_bg) / weight_fg
+        var = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        if var > best_var:
+            best_t, best_var = t, var
+    return best_t
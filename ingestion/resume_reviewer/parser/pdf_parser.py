@@ -1,5 +1,221 @@
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import pdfplumber
 
+from .document import Extraction, page_limit_note
+from .ocr import resolve_engine
+
+# Below this many pages the process start-up costs more than it saves.
+PARALLEL_MIN_PAGES = 12
+
+
+def extract_pages(
+    source,
+    *,
+    workers: int = 0,
+    min_pages: int = PARALLEL_MIN_PAGES,
+    ocr=None,
+    ocr_log: list | None = None,
+    markdown: bool = False,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    notes: list | None = None,
+    info: dict | None = None,
+    layout: list | None = None,
+) -> list[str]:
+    """
+    Return the text of every page; *source* is a path or binary stream.
+
+    With ``workers > 1`` documents of at least *min_pages* pages are split
+    into page ranges that worker processes open and extract independently;
+    the text comes back in page order.  Smaller documents (and the default
+    ``workers=0``) stay on the serial path.
+
+    Pages without a text layer are rendered and OCR'd on *ocr* (an
+    ``OcrEngine``) when one is given; one timing record per OCR'd page is
+    appended to *ocr_log*.
+
+    With *markdown* pages come back as Markdown built from the font geometry
+    (``markdown_utils.page_to_markdown``); OCR'd pages stay plain text.
+
+    Only the first *max_pages* pages are read; the serial path also stops
+    once *max_chars* characters are in.  A cut is noted in *notes*; *info*
+    gets the document's ``page_count``, however many pages were read.
+    *layout*, if given, gets the ``layout.page_features`` of every page read,
+    from the same parsed pages.
+    """
+    with pdfplumber.open(source) as pdf:
+        total = len(pdf.pages)
+        if info is not None:
+            info["page_count"] = total
+        n_pages = total if max_pages is None else min(total, max_pages)
+        stopped_by = "max_pages"  # unless the text limit comes first (serial path only)
+        if workers <= 1 or n_pages < min_pages:
+            texts, log, feats = _extract_open(
+                pdf.pages[:n_pages], 0, ocr, markdown, max_chars, layout is not None
+            )
+            if max_chars is not None and sum(map(len, texts)) >= max_chars:
+                stopped_by = "max_chars"
+        else:
+            texts = None
+    if texts is None:
+        texts, log, feats = _extract_parallel(
+            _reopenable(source), n_pages, workers, ocr, markdown, layout is not None
+        )
+    if len(texts) < total and notes is not None:
+        notes.append(page_limit_note(len(texts), total, stopped_by))
+    if ocr_log is not None:
+        ocr_log.extend(log)
+    if layout is not None:
+        layout.extend(feats)
+    return texts
+
+
 def extract(path: str) -> str:
-    with pdfplumber.open(path) as pdf:
-        return "\n".join(page.extract_text() or "" for page in pdf.pages)
\ No newline at end of file
+    return "\n".join(extract_pages(path))
+
+
+def extract_file(
+    fp,
+    checksum: str,
+    *,
+    page_workers: int = 0,
+    ocr=True,
+    markdown: bool = False,
+    backend: str = "fast",
+    layout: bool = False,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+    **_,
+) -> Extraction:
+    """
+    Registry entry point (see ``registry``).
+
+    *backend* ``"fast"`` extracts with pypdfium2 and falls back to pdfplumber
+    per page when the text looks degenerate (``pdfium_parser``); ``"layout"``
+    uses pdfplumber throughout and is the only one that honours
+    *page_workers*.  *max_pages* / *max_chars* bound the extraction (see
+    ``extract_pages``).  With *layout* the per-page layout features are
+    measured on the pages the backend has open (``Extraction.layout``).
+    """
+    log: list[dict] = []
+    notes: list[str] = []
+    info: dict = {}
+    features: list[dict] | None = [] if layout else None
+    engine = resolve_engine(ocr)
+    if backend == "fast":
+        from .pdfium_parser import extract_pages as fast_extract_pages
+
+        pages = fast_extract_pages(
+            fp, ocr=engine, ocr_log=log, markdown=markdown, notes=notes, info=info,
+            layout=features, max_pages=max_pages, max_chars=max_chars,
+        )
+    elif backend == "layout":
+        pages = extract_pages(
+            fp, workers=page_workers, ocr=engine, ocr_log=log, markdown=markdown, notes=notes,
+            info=info, layout=features, max_pages=max_pages, max_chars=max_chars,
+        )
+    else:
+        raise ValueError(f"Unknown PDF backend: {backend!r} (expected 'fast' or 'layout')")
+    # the document's length, not the pages a limit let through (those are in the note)
+    return Extraction(pages, info["page_count"], checksum, log, notes, features)
+
+
+def _extract_open(
+    pages: list,
+    offset: int,
+    ocr,
+    markdown: bool = False,
+    max_chars: int | None = None,
+    layout: bool = False,
+) -> tuple[list[str], list[dict], list[dict]]:
+    """
+    Text of pdfplumber *pages*, OCR'ing pages that have none, and with
+    *layout* their ``layout.page_features`` (from the chars the text
+    extraction parsed already).
+    """
+    if markdown:
+        from .markdown_utils import page_to_markdown
+
+        extract = page_to_markdown
+    else:
+        extract = lambda page: page.extract_text() or ""  # noqa: E731
+    if layout:
+        from .layout import page_features
+    texts: list[str] = []
+    feats: list[dict] = []
+    chars = 0
+    for page in pages:
+        texts.append(extract(page))
+        if layout:
+            feats.append(page_features(page))
+        chars += len(texts[-1])
+        if max_chars is not None and chars >= max_chars:
+            break
+    if ocr is None:
+        return texts, [], feats
+    render = lambda i: pages[i].to_image(resolution=ocr.target_dpi).original  # noqa: E731
+    return texts, ocr_blank_pages(texts, render, offset, ocr), feats
+
+
+def ocr_blank_pages(texts: list[str], render, offset: int, ocr) -> list[dict]:
+    """
+    OCR the pages of *texts* that have no text, in place; ``render(i)`` gives
+    page *i* as a PIL image at ``ocr.target_dpi``.  Returns the timing log.
+    """
+    log: list[dict] = []
+    blank = [i for i, text in enumerate(texts) if not text.strip()]
+    batch = max(1, ocr.max_workers * 2)  # bound the number of rendered pages held at once
+    for k in range(0, len(blank), batch):
+        idx = blank[k:k + batch]
+        try:
+            images = [render(i) for i in idx]
+            results = ocr.ocr_many(images, source_dpi=ocr.target_dpi)
+        except Exception as exc:  # e.g. tesseract not installed: keep the empty pages
+            log.extend({"page": offset + i + 1, "error": f"{type(exc).__name__}: {exc}"} for i in idx)
+            continue
+        for i, res in zip(idx, results):
+            texts[i] = res.text
+            log.append({"page": offset + i + 1, "seconds": round(res.seconds, 4), "chars": len(res.text)})
+    return log
+
+
+def _extract_parallel(
+    src, n_pages: int, workers: int, ocr, markdown: bool, layout: bool = False
+) -> tuple[list[str], list[dict], list[dict]]:
+    # ~2 ranges per worker so one slow range doesn't leave the rest idle
+    step = max(1, math.ceil(n_pages / (workers * 2)))
+    ranges = [(start, min(start + step, n_pages)) for start in range(0, n_pages, step)]
+    texts: list[str] = []
+    log: list[dict] = []
+    feats: list[dict] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        for chunk, chunk_log, chunk_feats in pool.map(
+            _extract_range, *zip(*((src, a, b, ocr, markdown, layout) for a, b in ranges))
+        ):
+            texts.extend(chunk)
+            log.extend(chunk_log)
+            feats.extend(chunk_feats)
+    return texts, log, feats
+
+
+def _extract_range(
+    src, start: int, stop: int, ocr, markdown: bool, layout: bool = False
+) -> tuple[list[str], list[dict], list[dict]]:
+    source = io.BytesIO(src) if isinstance(src, bytes) else src
+    with pdfplumber.open(source, pages=range(start + 1, stop + 1)) as pdf:
+        return _extract_open(pdf.pages, start, ocr, markdown, layout=layout)
+
+
+def _reopenable(source):
+    """Something a worker process can open on its own: a path or the bytes."""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    name = getattr(source, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        return name
+    source.seek(0)
+    return source.read()
@@ -0,0 +1,197 @@
+"""
+Fast PDF text extraction on pypdfium2 (the "fast" backend).
+
+PDFium does the text extraction in C; Python only walks the character
+table once per page to put back word spaces (many PDFs position words
+without a space glyph, and PDFium's own text drops those gaps) and to
+collect the font sizes and weights ``markdown_utils.lines_to_markdown``
+needs.  Pages whose text looks degenerate are re-extracted with pdfplumber,
+and pages without any text go to OCR like in ``pdf_parser``.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import re
+
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+
+# gap between two glyph advance boxes, in font-size units, that counts as a space
+WORD_GAP = 0.03
+BOLD_WEIGHT = 600
+# degenerate-text heuristics, see ``degenerate``
+MAX_BAD_CHARS = 0.05
+LONG_TOKEN = 25
+MAX_LONG_TOKEN_SHARE = 0.2
+
+_BAD_CHARS_RE = re.compile("[\ufffd\ue000-\uf8ff\x00-\x08\x0b-\x1f]")  # U+FFFD, private use, C0
+_TOKEN_RE = re.compile(r"\S+")
+
+
+def page_lines(page, *, with_chars: bool = False, glyphs: list | None = None) -> list[dict]:
+    """
+    Lines of *page* as ``{"text", "x0"}`` dicts (plus ``"chars"`` with each
+    glyph's ``size`` and a bold marker as ``fontname`` when *with_chars*), the
+    shape ``lines_to_markdown`` takes.  *glyphs*, if given, gets the
+    ``(left, right, top, bottom, size)`` box of every visible character for
+    ``layout.pdfium_page_features``.
+    """
+    textpage = page.get_textpage()
+    raw = textpage.raw
+    rect = pdfium_c.FS_RECTF()
+    get_unicode, get_box = pdfium_c.FPDFText_GetUnicode, pdfium_c.FPDFText_GetLooseCharBox
+    get_size, get_weight = pdfium_c.FPDFText_GetFontSize, pdfium_c.FPDFText_GetFontWeight
+
+    lines: list[dict] = []
+    buf: list[str] = []
+    chars: list[dict] = []
+    x0 = None
+    prev_right = None  # right edge of the previous glyph on this line
+
+    def close_line():
+        text = "".join(buf).strip()
+        if text:
+            line = {"text": text, "x0": x0 or 0.0}
+            if with_chars:
+                line["chars"] = chars[:]
+            lines.append(line)
+        buf.clear()
+        chars.clear()
+
+    for i in range(pdfium_c.FPDFText_CountChars(raw)):
+        code = get_unicode(raw, i)
+        if code == 0x0A:  # PDFium ends lines with "\r\n"
+            close_line()
+            x0 = prev_right = None
+            continue
+        if code == 0x20:
+            if buf and buf[-1] != " ":
+                buf.append(" ")
+            prev_right = None
+            continue
+        if code < 0x20 or code == 0xFFFE:  # "\r", generated hyphens etc.
+            continue
+        get_box(raw, i, ctypes.byref(rect))
+        size = get_size(raw, i)
+        if prev_right is not None and rect.left - prev_right > size * WORD_GAP and buf[-1] != " ":
+            buf.append(" ")
+        if x0 is None:
+            x0 = rect.left
+        buf.append(chr(code))
+        prev_right = rect.right
+        if glyphs is not None:
+            glyphs.append((rect.left, rect.right, rect.top, rect.bottom, size))
+        if with_chars:
+            bold = get_weight(raw, i) >= BOLD_WEIGHT
+            chars.append({"size": size, "fontname": "bold" if bold else ""})
+    close_line()
+    textpage.close()
+    return lines
+
+
+def degenerate(text: str) -> str | None:
+    """Why *text* looks broken (undecodable glyphs, lost word spaces), or ``None``."""
+    visible = len(text) - text.count(" ") - text.count("\n")
+    if not visible:
+        return None  # blank pages are OCR's business, not the fallback's
+    if len(_BAD_CHARS_RE.findall(text)) > visible * MAX_BAD_CHARS:
+        return "undecodable glyphs"
+    long_chars = sum(len(t) for t in _TOKEN_RE.findall(text) if len(t) >= LONG_TOKEN)
+    if long_chars > visible * MAX_LONG_TOKEN_SHARE:
+        return "missing word spaces"
+    return None
+
+
+def extract_pages(
+    source,
+    *,
+    ocr=None,
+    ocr_log: list | None = None,
+    markdown: bool = False,
+    fallback: bool = True,
+    notes: list | None = None,
+    info: dict | None = None,
+    layout: list | None = None,
+    max_pages: int | None = None,
+    max_chars: int | None = None,
+) -> list[str]:
+    """
+    Text (or layout Markdown) of every page; *source* is a path or binary stream.
+
+    Pages that look ``degenerate`` are re-extracted with pdfplumber when
+    *fallback* is on; a note per fallback page is appended to *notes*.  OCR
+    works as in ``pdf_parser.extract_pages``, on pages rendered by PDFium.
+    Extraction stops after *max_pages* pages, or once *max_chars* characters
+    are in; the cut is noted in *notes*.  *info* gets the document's
+    ``page_count``, however many pages were read.  *layout*, if given, gets
+    the ``layout.pdfium_page_features`` of every page read.
+    """
+    from .document import page_limit_note
+    from .pdf_parser import ocr_blank_pages
+
+    if markdown:
+        from .markdown_utils import lines_to_markdown
+    if layout is not None:
+        from .layout import pdfium_page_features
+
+    pdf = pdfium.PdfDocument(source)
+    try:
+        total = len(pdf)
+        if info is not None:
+            info["page_count"] = total
+        n_pages = total if max_pages is None else min(total, max_pages)
+        texts: list[str] = []
+        chars = 0
+        stopped_by = "max_pages"  # unless the text limit comes first
+        for i in range(n_pages):
+            page = pdf[i]
+            glyphs = [] if layout is not None else None
+            lines = page_lines(page, with_chars=markdown, glyphs=glyphs)
+            if layout is not None:
+                layout.append(pdfium_page_features(page, glyphs))
+            page.close()
+            if markdown:
+                texts.append(lines_to_markdown(lines))
+            else:
+                texts.append("\n".join(ln["text"] for ln in lines))
+            chars += len(texts[-1])
+            if max_chars is not None and chars >= max_chars:
+                stopped_by = "max_chars"
+                break
+        if len(texts) < total and notes is not None:
+            notes.append(page_limit_note(len(texts), total, stopped_by))
+
+        bad = {}
+        if fallback:
+            bad = {i: why for i, text in enumerate(texts) if (why := degenerate(text))}
+        if bad:
+            _layout_fallback(source, texts, sorted(bad), markdown)
+            if notes is not None:
+                notes.extend(f"layout fallback on page {i + 1}: {why}" for i, why in bad.items())
+
+        log: list[dict] = []
+        if ocr is not None:
+            scale = ocr.target_dpi / 72
+            log = ocr_blank_pages(texts, lambda i: pdf[i].render(scale=scale).to_pil(), 0, ocr)
+    finally:
+        pdf.close()
+    if ocr_log is not None:
+        ocr_log.extend(log)
+    return texts
+
+
+def _layout_fallback(source, texts: list[str], pages: list[int], markdown: bool) -> None:
+    import pdfplumber
+
+    if hasattr(source, "seek"):
+        source.seek(0)
+    with pdfplumber.open(source, pages=[i + 1 for i in pages]) as pdf:
+        if markdown:
+            from .markdown_utils import page_to_markdown
+
+            redo = [page_to_markdown(page) for page in pdf.pages]
+        else:
+            redo = [page.extract_text() or "" for page in pdf.pages]
+    for i, text in zip(pages, redo):
+        texts[i] = text
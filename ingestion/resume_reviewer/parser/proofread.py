@@ -0,0 +1,484 @@
+"""
+Local spelling / grammar / language pre-analysis for the ``language``
+rubric dimension.
+
+One pass over the cleaned text, line by line, collects:
+
+* spelling — lower-case words (and a line's first word, where typos in
+  action verbs hide) that are not in the word list but are one edit away
+  from a common word, looked up in a symmetric-delete index.  Only slips
+  that rarely make another word are reported (see ``_typo_of``): a swap
+  ("recieve") or a lost vowel ("managment"), not a lost consonant
+  ("enviroment"), which is too often a real word ("though");
+* tense — bullets of one role whose leading verb is in the present tense
+  when the role has ended, or disagrees with the other bullets of the role;
+* passive voice — "was/were/been ... developed" style markers;
+* language — distinctive stop words of en/de/fr/es/it/nl/pt per line, for
+  the document language and lines that are not in it.
+
+The result goes to ``meta.proofread`` (see ``parse_resume(proofread=True)``):
+counts, plus the flagged spans as offsets into ``ParsedResume.text``::
+
+    {"language": {"detected": "en", "shares": {"en": 0.96, "de": 0.04}},
+     "counts": {"words": 812, "spelling": 2, "tense": 1, "passive": 1, "other_language": 1},
+     "findings": [{"kind": "spelling", "start": 310, "end": 319,
+                   "text": "managment", "suggestion": "management"}, ...]}
+
+The word list (``words_en.txt``: ``word count`` lines, count = number of
+documents) is built from a résumé corpus with ``build_word_counts``; its
+delete index is pickled under ``SPELL_CACHE`` the first time it is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import re
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+from .cache import DEFAULT_ROOT
+from .dates import normalize_date
+from .document import iter_lines
+from .structure import DATE_RANGE_RE, SECTION_RE
+
+WORDS_PATH = Path(__file__).with_name("words_en.txt")
+SPELL_CACHE = DEFAULT_ROOT.parent / "spell"  # next to the parse cache
+MAX_FINDINGS = 40  # flagged spans kept; counts are always complete
+MIN_WORD = 5  # one edit turns most shorter words into another word
+COMMON = 20  # a suggestion must occur in at least this many documents
+# PDF text loses the space after these often enough ("ofreports") that a
+# known word glued to one is an extraction artefact, not the candidate's typo
+GLUE = ("of", "off", "and", "the", "to", "in", "for", "with", "on", "at")
+
+WORD_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+DIGIT_RE = re.compile(r"\d")
+BULLET_RE = re.compile(r"\s*[-•*▪●◦]\s*")
+URLISH = set("@./_\\:")
+VOWELS = set("aeiouy")
+# suffix -> whether the stem drops a final "e" before it ("managed", not
+# "managely"); derivations like "-ment" keep it ("management")
+INFLECTIONS = {
+    "s": False, "es": False, "d": False, "ed": True, "ing": True, "ly": False,
+    "er": True, "ers": True, "ment": False, "ments": False,
+}
+
+# ---- grammar word lists -------------------------------------------------------
+_VERBS = """
+accelerate achieve acquire adapt administer advise advocate allocate analyse analyze answer
+apply approve arrange assemble assess assign assist attend audit automate balance book
+build calculate champion clean coach collaborate collect communicate compile complete
+conduct configure consolidate construct consult contribute control convert cook coordinate
+create customize debug decrease define delegate deliver demonstrate deploy design detect
+develop devise diagnose direct document draft drive edit educate eliminate engineer enhance
+ensure establish estimate evaluate examine execute expand expedite facilitate file finalize
+forecast formulate foster gather generate greet grow guide handle help hire identify
+implement improve increase influence initiate inspect install instruct integrate interview
+introduce investigate launch lead lift load lower maintain manage market measure mentor
+migrate model modernize monitor motivate negotiate obtain open operate optimize orchestrate
+order organise organize oversee own pack participate partner perform pioneer plan prepare
+present prioritize process procure produce program promote propose provide publish purchase
+recommend reconcile record recruit redesign reduce refactor remodel repair report represent
+research resolve respond restructure review revise run save schedule screen secure sell serve
+ship simplify solve spearhead standardize stock streamline strengthen structure submit
+supervise supply support teach test track train transform translate troubleshoot tutor update
+upgrade validate verify win work write
+""".split()
+_IRREGULAR_PAST = {
+    "build": "built", "drive": "drove", "grow": "grew", "lead": "led", "oversee": "oversaw",
+    "run": "ran", "sell": "sold", "teach": "taught", "win": "won", "write": "wrote",
+    "make": "made", "take": "took", "hold": "held", "give": "gave", "begin": "began",
+    "bring": "brought", "buy": "bought", "keep": "kept", "meet": "met", "find": "found",
+    "spend": "spent", "speak": "spoke", "send": "sent", "get": "got",
+}
+# bases that open noun phrases as often as bullets ("Research on ...", "Order
+# processing", "Marketing Manager"): only their "-ed" form says anything about tense
+_NOUNS = {
+    "book", "champion", "clean", "cook", "document", "engineer", "file", "help", "lift", "load",
+    "lower", "market", "model", "open", "order", "own", "pack", "partner", "plan", "present",
+    "process", "program", "record", "report", "research", "review", "schedule", "screen",
+    "stock", "structure", "support", "test", "track", "train", "work",
+}
+_DOUBLED = {"plan", "ship", "program", "control", "refer", "stop", "transfer", "commit", "submit"}
+_PARTICIPLES = {
+    "built", "led", "made", "held", "sold", "taught", "won", "written", "given", "taken", "done",
+    "driven", "grown", "overseen", "brought", "bought", "kept", "met", "found", "spent", "sent",
+    "chosen", "shown", "seen", "run", "begun", "paid", "told",
+}
+# "-ed" words after "is/was" that describe rather than report an action
+_ADJECTIVES = {
+    "based", "located", "interested", "skilled", "experienced", "dedicated", "motivated",
+    "qualified", "certified", "licensed", "detailed", "talented", "excited", "married",
+    "seasoned", "organized", "organised", "focused", "oriented", "advanced", "accustomed",
+    "committed", "concerned", "engaged", "limited", "needed", "required", "used", "listed",
+    "related", "tired", "pleased", "proud", "prepared", "involved", "registered",
+}
+BE = frozenset("am is are was were be been being".split())
+_PARTICIPLE = rf"[^\W\d_]{{3,}}ed|{'|'.join(sorted(_PARTICIPLES))}"
+PASSIVE_RE = re.compile(rf"\b(?:{'|'.join(BE)})\s+(?:\w+ly\s+)?(?P<verb>{_PARTICIPLE})\b", re.I)
+
+
+def _verb_forms() -> dict[str, str]:
+    """Leading-word → ``"past"`` / ``"present"`` for the action verbs above."""
+    forms: dict[str, str] = {}
+    for base in _VERBS:
+        stem = base + base[-1] if base in _DOUBLED else base
+        if base in _IRREGULAR_PAST:
+            past = _IRREGULAR_PAST[base]
+        elif base.endswith("e"):
+            past = base + "d"
+        elif base.endswith("y") and base[-2] not in "aeiou":
+            past = base[:-1] + "ied"
+        else:
+            past = stem + "ed"
+        if base.endswith("y") and base[-2] not in "aeiou":
+            third = base[:-1] + "ies"
+        elif base.endswith(("s", "sh", "ch", "x", "z", "o")):
+            third = base + "es"
+        else:
+            third = base + "s"
+        if base.endswith("e") and not base.endswith("ee"):
+            ing = base[:-1] + "ing"
+        else:
+            ing = stem + "ing"
+        for form in () if base in _NOUNS else (base, third, ing):
+            forms[form] = "present"
+        forms[past] = "past"
+    return forms
+
+
+VERB_TENSE = _verb_forms()
+
+# ---- language ID: stop words only one of these languages uses -------------------
+_STOPWORDS = {
+    "en": "the and of to with for is are was were this that from by have has been which "
+          "their our an at as be it on or not but who will would can",
+    "de": "der die das und mit für von ist sind wurde den dem des ein eine einer nicht "
+          "auf bei zur zum wir ich sie auch als oder über durch",
+    "fr": "le la les et des du une est sont pour avec dans sur par au aux ce cette nous "
+          "je qui pas ou été mes",
+    "es": "el los las del una es para con por su sus al como más pero fue este "
+          "esta yo nosotros",
+    "it": "il lo gli della delle dei una è sono con nel nella alla anche "
+          "questo questa io",
+    "nl": "het een en van met voor zijn ik wij niet aan bij ook naar dit deze "
+          "werd heeft",
+    "pt": "do da dos das uma é são para com na pelo pela como mais "
+          "também foi este esta eu",
+}
+_seen = Counter(w for words in _STOPWORDS.values() for w in set(words.split()))
+STOPWORDS = {
+    word: lang
+    for lang, words in _STOPWORDS.items()
+    for word in words.split()
+    if _seen[word] == 1  # "de", "en", "a", "in" ... prove nothing
+}
+del _seen
+MIN_VOTES = 3  # stop words a line needs before it gets a language ...
+MIN_SHARE = 0.2  # ... and the share of its words they must make up
+
+
+# ---- spelling index -----------------------------------------------------------
+def _deletes(word: str, distance: int) -> set[str]:
+    out, frontier = {word}, {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        out |= frontier
+    return out
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Damerau-Levenshtein (optimal string alignment), ``limit + 1`` once above *limit*."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2, prev = None, list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+class SpellIndex:
+    """
+    Symmetric-delete index: every word's deletions up to *max_distance* map
+    back to it, so a lookup only generates the deletions of the query
+    instead of every possible edit.
+    """
+
+    def __init__(self, counts: dict[str, int], *, max_distance: int = 1):
+        self.counts = counts
+        self.max_distance = max_distance
+        self.deletes: dict[str, list[str]] = {}
+        for word in counts:
+            for key in _deletes(word, max_distance):
+                self.deletes.setdefault(key, []).append(word)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.counts
+
+    def lookup(self, word: str, *, min_count: int = 1) -> tuple[str, int] | None:
+        """Closest known word (most frequent on ties) and its distance, or ``None``."""
+        if word in self.counts:
+            return word, 0
+        best = None
+        for key in _deletes(word, self.max_distance):
+            for cand in self.deletes.get(key, ()):
+                count = self.counts[cand]
+                if count < min_count:
+                    continue
+                dist = _edit_distance(word, cand, self.max_distance)
+                if dist <= self.max_distance and (
+                    best is None or (dist, -count) < (best[1], -self.counts[best[0]])
+                ):
+                    best = (cand, dist)
+        return best
+
+    @classmethod
+    def load(cls, path: str | Path = WORDS_PATH, *, max_distance: int = 1) -> "SpellIndex":
+        """The index for word list *path*, from its pickle in ``SPELL_CACHE`` if built before."""
+        path = Path(path)
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw + bytes([max_distance])).hexdigest()[:16]
+        cached = SPELL_CACHE / f"{path.stem}-{digest}.pkl"
+        try:
+            with open(cached, "rb") as fh:
+                return pickle.load(fh)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        index = cls(read_word_counts(raw.decode("utf-8")), max_distance=max_distance)
+        try:
+            SPELL_CACHE.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_suffix(".tmp")
+            with open(tmp, "wb") as fh:
+                pickle.dump(index, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(cached)
+        except OSError:
+            pass  # read-only home: rebuild next time
+        return index
+
+
+@lru_cache(maxsize=1)
+def default_spell_index() -> SpellIndex:
+    return SpellIndex.load(WORDS_PATH)
+
+
+def read_word_counts(text: str) -> dict[str, int]:
+    counts = {}
+    for line in text.splitlines():
+        word, _, count = line.partition(" ")
+        if word:
+            counts[word] = int(count or 1)
+    return counts
+
+
+def build_word_counts(
+    texts: Iterable[str], *, min_docs: int = 3, typo_ratio: int = 30
+) -> dict[str, int]:
+    """
+    Document frequencies of the ASCII words in *texts*, most frequent
+    first, minus likely typos: rare (under ``COMMON`` documents) words of
+    ``MIN_WORD`` letters or more that look like a slip (``_typo_of``) for a
+    word *typo_ratio* times as frequent, and words glued to a ``GLUE`` word.
+    Write it as ``word count`` lines for ``SpellIndex.load``.
+    """
+    df: Counter = Counter()
+    for text in texts:
+        df.update({w.lower() for w in WORD_RE.findall(text) if w.isascii()})
+    counts = {w: n for w, n in df.most_common() if n >= min_docs}
+    index = SpellIndex(counts)
+    drop = set()
+    for word, n in counts.items():
+        if _glued(word, counts):
+            drop.add(word)
+        if n >= COMMON or len(word) < MIN_WORD:
+            continue
+        for key in _deletes(word, 1):
+            for other in index.deletes.get(key, ()):
+                if counts[other] >= typo_ratio * n and _typo_of(word, other):
+                    drop.add(word)
+    return {w: n for w, n in counts.items() if w not in drop}
+
+
+# ---- the pass -----------------------------------------------------------------
+def proofread(
+    text: str | Iterable[str],
+    *,
+    spell: SpellIndex | None = None,
+    max_findings: int = MAX_FINDINGS,
+) -> dict:
+    """Counts and flagged spans for *text* (offsets into the lines joined with ``"\\n"``)."""
+    spell = spell or default_spell_index()
+    findings: list[dict] = []
+    counts = Counter(words=0, spelling=0, tense=0, passive=0, other_language=0)
+    votes: Counter = Counter()
+    voted = []  # (start, end, language, snippet) of lines with enough stop words
+    role = _Role()
+
+    def flag(kind: str, start: int, end: int, snippet: str, **extra) -> None:
+        counts[kind] += 1
+        if len(findings) < max_findings:
+            findings.append({"kind": kind, "start": start, "end": end, "text": snippet, **extra})
+
+    offset = 0
+    for line in iter_lines(text):
+        base, offset = offset, offset + len(line) + 1
+        stripped = line.strip()
+        bullet = BULLET_RE.match(line) if stripped[:1] in "-•*▪●◦" else None
+        if not stripped:
+            continue
+        if SECTION_RE.match(stripped):
+            role.close(flag)
+        elif not bullet and DIGIT_RE.search(line) and (m := DATE_RANGE_RE.search(line)):
+            role.close(flag)
+            role.ended = normalize_date(m.group("end")) != "present"
+
+        line_votes: Counter = Counter()
+        line_words, passive = 0, False
+        first = bullet.end() if bullet else len(line) - len(line.lstrip())
+        for m in WORD_RE.finditer(line):
+            word = m.group()
+            low = word.lower()
+            line_words += 1
+            passive = passive or low in BE
+            start, end = m.span()
+            if (line[start - 1] if start else " ") in URLISH or line[end : end + 1] in URLISH:
+                continue  # part of an e-mail address, URL or file name
+            lang = STOPWORDS.get(low)
+            if lang and word.islower():  # "LA", "OS", "Los Angeles" are names
+                line_votes[lang] += 1
+            # a bullet, or a line of a dated role that starts with a capital
+            # (PDF text often loses the bullet glyphs)
+            if start == first and (bullet or role.ended is not None and word.istitle()):
+                tense = VERB_TENSE.get(low)
+                if tense:
+                    role.bullets.append((tense, base + start, base + end, word))
+            if len(low) >= MIN_WORD and low not in spell.counts:
+                suggestion = _misspelled(word, low, start == first, spell)
+                if suggestion:
+                    flag("spelling", base + start, base + end, word, suggestion=suggestion)
+        counts["words"] += line_words
+        for m in PASSIVE_RE.finditer(line) if passive else ():
+            if m.group("verb").lower() not in _ADJECTIVES:
+                flag("passive", base + m.start(), base + m.end(), m.group())
+
+        if line_votes:
+            lang, n = line_votes.most_common(1)[0]
+            votes.update(line_votes)
+            if n >= MIN_VOTES and n >= MIN_SHARE * line_words:
+                voted.append((base, base + len(line), lang, _snippet(stripped)))
+    role.close(flag)
+
+    detected = votes.most_common(1)[0][0] if votes else None
+    run = None  # consecutive lines in the same other language make one finding
+    for start, end, lang, snippet in voted:
+        if lang == detected:
+            run = None
+        elif run is not None and run["language"] == lang:
+            run["end"] = end
+        else:
+            counts["other_language"] += 1
+            run = {"kind": "language", "start": start, "end": end, "text": snippet,
+                   "language": lang}
+            if len(findings) < max_findings:
+                findings.append(run)
+    findings.sort(key=lambda f: f["start"])
+    total = sum(votes.values())
+    return {
+        "language": {
+            "detected": detected,
+            "shares": {lang: round(n / total, 3) for lang, n in votes.most_common()},
+        },
+        "counts": dict(counts),
+        "findings": findings,
+    }
+
+
+class _Role:
+    """Leading verbs of the bullets of one dated role."""
+
+    def __init__(self):
+        self.ended: bool | None = None  # None: no date range seen
+        self.bullets: list[tuple[str, int, int, str]] = []
+
+    def close(self, flag) -> None:
+        bullets, ended = self.bullets, self.ended
+        self.bullets, self.ended = [], None
+        tenses = Counter(t for t, *_ in bullets)
+        if ended:
+            wrong, note = "present", "present tense in a role that has ended"
+        elif len(tenses) < 2:
+            return
+        else:
+            # the minority; on a tie, past in a current role and present otherwise
+            wrong = "past" if ended is False else "present"
+            if tenses["past"] != tenses["present"]:
+                wrong = min(tenses, key=tenses.__getitem__)
+            note = "tense differs from the other bullets of this role"
+        for tense, start, end, word in bullets:
+            if tense == wrong:
+                flag("tense", start, end, word, note=note)
+
+
+def _typo_of(word: str, other: str) -> bool:
+    """
+    Could *word* be a slip for *other* rather than a word of its own?  Slips
+    swap two letters ("recieve"), drop, add or double a letter next to its
+    twin ("dinning") or drop / add / change a vowel ("managment",
+    "calender"); a changed or missing consonant mostly makes another word
+    ("stake" / "state", "though" / "through").
+    """
+    if word[0] != other[0] or word[:-1] == other[:-1] or word[:-1] == other or other[:-1] == word:
+        return False  # "steam" / "team", "sale" / "sales": other words or inflections
+    for a, b in (("our", "or"), ("re", "er"), ("ll", "l")):  # "labour", "centre", "travelling"
+        if word.replace(a, b) == other.replace(a, b):
+            return False
+    if len(word) == len(other):
+        diff = [i for i, (x, y) in enumerate(zip(word, other)) if x != y]
+        if len(diff) == 2 and diff[1] == diff[0] + 1:
+            return word[diff[0]] == other[diff[1]] and word[diff[1]] == other[diff[0]]
+        return len(diff) == 1 and word[diff[0]] in VOWELS and other[diff[0]] in VOWELS
+    short, long = sorted((word, other), key=len)
+    if len(long) - len(short) != 1:
+        return False
+    i = next((i for i, (x, y) in enumerate(zip(short, long)) if x != y), len(short))
+    if short != long[:i] + long[i + 1:]:
+        return False
+    extra = long[i]
+    return extra in VOWELS or extra == long[i - 1 : i] or extra == long[i + 1 : i + 2]
+
+
+def _misspelled(word: str, low: str, first: bool, spell: SpellIndex) -> str | None:
+    """The suggested spelling if *word* looks like a typo, else ``None``."""
+    if not word.isascii():
+        return None
+    if "'" in word or not (word.islower() or (first and word[1:].islower())):
+        return None  # names, acronyms, product names
+    for suffix, drops_e in INFLECTIONS.items():
+        stem = low[: -len(suffix)]
+        if low.endswith(suffix) and (stem in spell or drops_e and stem + "e" in spell):
+            return None  # a regular inflection the list happens to lack
+    if _glued(low, spell.counts) or (first and low[0] == low[1]):
+        return None  # lost space, or a drop cap extracted twice ("Rrisk")
+    hit = spell.lookup(low, min_count=COMMON)
+    if hit is None or not _typo_of(low, hit[0]):
+        return None
+    return hit[0] if word.islower() else hit[0].capitalize()
+
+
+def _glued(word: str, counts: dict[str, int]) -> bool:
+    """``"ofreports"``: a ``GLUE`` word and a common word without the space."""
+    return any(
+        word.startswith(glue) and counts.get(word[len(glue):], 0) >= COMMON for glue in GLUE
+    )
+
+
+def _snippet(line: str, width: int = 60) -> str:
+    return line if len(line) <= width else line[: width - 1] + "…"
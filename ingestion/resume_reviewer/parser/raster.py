@@ -0,0 +1,178 @@
+"""
+Low-resolution page thumbnails for looking at a résumé rather than reading it.
+
+Pages are rendered with pypdfium2 (already installed with pdfplumber) at
+``DEFAULT_DPI``, in grayscale, and stored as 4-bit PNGs (16 gray levels:
+antialiased text stays legible, the files are about a quarter smaller
+than 8-bit ones, some 40 KB per A4 page at 72 DPI)::
+
+    images = page_thumbnails(pdf_bytes, cache=RasterCache())
+    urls = data_urls(images)   # for an image_url message part
+
+Thumbnails are cached per content hash, DPI and page in a size-bounded
+``RasterCache``, so a document is rendered once; only missing pages are
+rendered, in *workers* processes when there is more than one page to do
+(PDFium is not thread-safe).
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .cache import DEFAULT_ROOT
+from .document import checksum_bytes, checksum_file, discard_file
+
+RASTER_ROOT = DEFAULT_ROOT.parent / "raster"  # next to the parse cache
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DPI = 72
+MAX_PAGES = 4  # résumés rarely need more for a first impression
+GRAY_LEVELS = 16
+
+_LUT = [round(v * (GRAY_LEVELS - 1) / 255) for v in range(256)]
+_PALETTE = [round(g * 255 / (GRAY_LEVELS - 1)) for g in range(GRAY_LEVELS) for _ in range(3)]
+
+
+class RasterCache:
+    """Size-bounded LRU cache of encoded thumbnails, one file per page."""
+
+    def __init__(self, root: str | Path = RASTER_ROOT, *, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def get(self, checksum: str, page: int, dpi: int = DEFAULT_DPI) -> bytes | None:
+        path = self._path(checksum, page, dpi)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(path)  # bump recency for LRU eviction
+        except OSError:
+            pass
+        return data
+
+    def put(self, checksum: str, pages: dict[int, bytes], dpi: int = DEFAULT_DPI) -> None:
+        """Store the thumbnails of one document (page number -> PNG), then evict."""
+        import tempfile
+
+        for page, data in pages.items():
+            path = self._path(checksum, page, dpi)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                discard_file(tmp)
+                raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Drop least-recently-used pages until the cache fits ``max_bytes``."""
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*.png"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:  # evicted by another process
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total <= self.max_bytes:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            discard_file(path)
+            total -= size
+            if total <= self.max_bytes * 0.9:  # hysteresis: don't evict on every put
+                break
+
+    def _path(self, checksum: str, page: int, dpi: int) -> Path:
+        digest = checksum.split(":", 1)[-1]
+        return self.root / digest[:2] / f"{digest}-{dpi}-{page}.png"
+
+
+def page_thumbnails(
+    source: str | os.PathLike | bytes,
+    *,
+    checksum: str | None = None,
+    dpi: int = DEFAULT_DPI,
+    max_pages: int | None = MAX_PAGES,
+    cache: RasterCache | None = None,
+    workers: int = 0,
+) -> list[bytes]:
+    """
+    PNG thumbnails of the first *max_pages* pages of the PDF *source* (a
+    path or its bytes), from *cache* where present.  *checksum* saves
+    hashing *source* again when the caller has it (``meta.checksum``).
+    """
+    import pypdfium2 as pdfium
+
+    if not isinstance(source, bytes):
+        source = os.fspath(source)
+    if cache is not None and checksum is None:
+        checksum = checksum_bytes(source) if isinstance(source, bytes) else checksum_file(source)
+    doc = pdfium.PdfDocument(source)
+    try:
+        n_pages = len(doc) if max_pages is None else min(len(doc), max_pages)
+    finally:
+        doc.close()
+
+    images = {}
+    if cache is not None:
+        for page in range(n_pages):
+            hit = cache.get(checksum, page, dpi)
+            if hit is not None:
+                images[page] = hit
+    missing = [page for page in range(n_pages) if page not in images]
+    if missing:
+        rendered = dict(zip(missing, _render_parallel(source, missing, dpi, workers)))
+        images.update(rendered)
+        if cache is not None:
+            cache.put(checksum, rendered, dpi)
+    return [images[page] for page in range(n_pages)]
+
+
+def data_urls(images: list[bytes]) -> list[str]:
+    """``data:image/png;base64,...`` URLs for multimodal chat messages."""
+    return ["data:image/png;base64," + base64.b64encode(png).decode("ascii") for png in images]
+
+
+def _render_parallel(source, pages: list[int], dpi: int, workers: int) -> list[bytes]:
+    if workers <= 1 or len(pages) < 2:
+        return _render_pages(source, pages, dpi)
+    step = math.ceil(len(pages) / min(workers, len(pages)))
+    chunks = [pages[i : i + step] for i in range(0, len(pages), step)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        results = pool.map(_render_pages, [source] * len(chunks), chunks, [dpi] * len(chunks))
+        return [png for chunk in results for png in chunk]
+
+
+def _render_pages(source, pages: list[int], dpi: int) -> list[bytes]:
+    import pypdfium2 as pdfium
+    from PIL import Image
+
+    doc = pdfium.PdfDocument(source)
+    try:
+        out = []
+        for index in pages:
+            page = doc[index]
+            try:
+                gray = page.render(scale=dpi / 72, grayscale=True).to_pil()
+            finally:
+                page.close()
+            indexed = Image.frombytes("P", gray.size, gray.convert("L").point(_LUT).tobytes())
+            indexed.putpalette(_PALETTE)
+            buf = io.BytesIO()
+            indexed.save(buf, "PNG", bits=4)
+            out.append(buf.getvalue())
+        return out
+    finally:
+        doc.close()
@@ -0,0 +1,166 @@
+"""
+Compact record form of the ``to_schema`` dict, for holding many résumés in
+memory at once.
+
+Every level of the schema (meta, candidate, contact, sections, entries,
+skills) becomes a namedtuple with ``__slots__ = ()``: no per-object
+``__dict__`` and no per-object copy of the keys, lists stored as tuples,
+and repeated short strings (skill names, dates, titles, employers,
+locations, parser notes, the keys of unknown sub-dicts) passed through
+``sys.intern`` so ten thousand "Python" skills share one string::
+
+    rec = ResumeRecord.from_dict(result.structured)   # or result.record()
+    rec.sections.skills.hard                          # ('Python', 'SQL', ...)
+    rec.to_dict() == result.structured                # True
+
+Keys a record does not know (``meta.timings``, ``meta.layout`` ...) are kept
+in its ``extra`` dict and written back after the known ones, so
+``to_dict`` gives back the same dict and the same JSON for anything
+``to_schema`` / ``parse_resume`` produces.  Records are immutable; use
+``_replace`` to change a field.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import namedtuple
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class _Record:
+    """Dict round-trip shared by the record types below."""
+    __slots__ = ()
+
+    _records: dict = {}    # field -> record type of its dict value
+    _record_lists: dict = {}  # field -> record type of its list items
+    _lists: tuple = ()     # fields holding a list of plain values
+    _interned: tuple = ()  # string fields (list items, dict keys) worth interning
+    _optional: tuple = ()  # fields left out of ``to_dict`` while ``None``
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        values, extra = {}, {}
+        for key, value in data.items():
+            if key == "extra" or key not in cls._fields:
+                extra[sys.intern(key)] = value
+            elif key in cls._records and isinstance(value, dict):
+                values[key] = cls._records[key].from_dict(value)
+            elif key in cls._record_lists and isinstance(value, list):
+                values[key] = tuple(map(cls._record_lists[key].from_dict, value))
+            elif key in cls._lists and isinstance(value, list):
+                values[key] = tuple(map(_intern, value)) if key in cls._interned else tuple(value)
+            elif key in cls._records or key in cls._record_lists or key in cls._lists:
+                extra[key] = value  # unexpected shape: kept verbatim, wins in to_dict
+            elif key in cls._interned and isinstance(value, dict):
+                values[key] = {sys.intern(k): v for k, v in value.items()}
+            else:
+                values[key] = _intern(value) if key in cls._interned else value
+        return cls(**values, extra=extra or None)
+
+    def to_dict(self) -> dict:
+        out = {}
+        for key, value in zip(self._fields[:-1], self):
+            if value is None and key in self._optional:
+                continue
+            if isinstance(value, _Record):
+                value = value.to_dict()
+            elif isinstance(value, tuple):
+                value = [v.to_dict() if isinstance(v, _Record) else v for v in value]
+            out[key] = value
+        if self.extra:
+            out.update(self.extra)
+        return out
+
+
+class Contact(
+    _Record,
+    namedtuple(
+        "Contact",
+        ["email", "phone", "location", "linkedin", "github", "extra"],
+        defaults=("", "", "", "", "", None),
+    ),
+):
+    __slots__ = ()
+    _interned = ("location",)
+
+
+class Candidate(
+    _Record,
+    namedtuple(
+        "Candidate", ["full_name", "contact", "summary", "extra"], defaults=("", Contact(), "", None)
+    ),
+):
+    __slots__ = ()
+    _records = {"contact": Contact}
+
+
+class Entry(
+    _Record,
+    namedtuple(
+        "Entry",
+        ["title", "employer", "location", "start_date", "end_date", "bullets", "extra"],
+        defaults=("", "", "", "", "", None, None),
+    ),
+):
+    """An experience or education entry; ``bullets`` is ``None`` for education."""
+    __slots__ = ()
+    _lists = ("bullets",)
+    _interned = ("title", "employer", "location", "start_date", "end_date")
+    _optional = ("bullets",)
+
+
+class Skills(
+    _Record, namedtuple("Skills", ["hard", "soft", "other", "extra"], defaults=((), (), None, None))
+):
+    """Canonical lexicon skills by label; ``other`` as listed in a skills section."""
+    __slots__ = ()
+    _lists = _interned = ("hard", "soft", "other")
+    _optional = ("other",)  # not in results of parser versions before 0.10
+
+
+class Sections(
+    _Record,
+    namedtuple(
+        "Sections",
+        ["experience", "education", "skills", "certifications", "languages", "awards", "extra"],
+        defaults=((), (), Skills(), (), (), (), None),
+    ),
+):
+    __slots__ = ()
+    _records = {"skills": Skills}
+    _record_lists = {"experience": Entry, "education": Entry}
+    _lists = _interned = ("certifications", "languages", "awards")
+
+
+class Meta(
+    _Record,
+    namedtuple(
+        "Meta",
+        ["checksum", "parsed_at", "file_name", "page_count", "parser_version", "extra"],
+        defaults=("", "", "", 0, "", None),
+    ),
+):
+    __slots__ = ()
+    _interned = ("parser_version",)
+
+
+class ResumeRecord(
+    _Record,
+    namedtuple(
+        "ResumeRecord",
+        [
+            "meta", "candidate", "sections", "parser_notes", "media_refs", "target_role",
+            "skill_offsets", "extra",
+        ],
+        defaults=(Meta(), Candidate(), Sections(), (), (), None, None, None),
+    ),
+):
+    """The whole ``structured`` dict of a ``ParsedResume``."""
+    __slots__ = ()
+    _records = {"meta": Meta, "candidate": Candidate, "sections": Sections}
+    _lists = ("parser_notes", "media_refs")
+    _interned = ("parser_notes", "target_role", "skill_offsets")
+    _optional = ("skill_offsets",)
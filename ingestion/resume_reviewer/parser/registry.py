@@ -0,0 +1,90 @@
+"""
+Extractor registry keyed by file type.
+
+Backends are registered as ``"module:function"`` strings and imported on
+first lookup, so importing the parser package never pulls in pdfplumber,
+PIL or pytesseract; a worker that only sees PDFs never imports the image
+stack.  An extractor is called as ``fn(fp, checksum, **options)`` and
+returns an ``Extraction``; it should ignore options it does not know.
+
+Third-party backends can call ``register`` directly (also usable as a
+decorator) or advertise an entry point in the ``resume_reviewer.extractors``
+group, named after the file type::
+
+    [project.entry-points."resume_reviewer.extractors"]
+    odt = "my_pkg.odt:extract_file"
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Callable, Iterable
+
+ENTRY_POINT_GROUP = "resume_reviewer.extractors"
+
+_TARGETS: dict[str, str | Callable] = {}
+_LOADED: dict[str, Callable] = {}
+_entry_points_loaded = False
+
+
+def register(filetypes: str | Iterable[str], target: str | Callable | None = None, *, replace: bool = True):
+    """
+    Map one or more file types to an extractor (callable or ``"module:attr"``).
+    Without *target* this returns a decorator.
+    """
+    if target is None:
+        def deco(fn: Callable) -> Callable:
+            register(filetypes, fn, replace=replace)
+            return fn
+        return deco
+
+    for ft in [filetypes] if isinstance(filetypes, str) else filetypes:
+        ft = ft.lower().lstrip(".")
+        if not replace and ft in _TARGETS:
+            continue
+        _TARGETS[ft] = target
+        _LOADED.pop(ft, None)
+    return target
+
+
+def get_extractor(filetype: str) -> Callable:
+    """Resolve (importing on first use) the extractor for *filetype*."""
+    filetype = filetype.lower()
+    fn = _LOADED.get(filetype)
+    if fn is not None:
+        return fn
+    if filetype not in _TARGETS:
+        _load_entry_points()
+    try:
+        target = _TARGETS[filetype]
+    except KeyError:
+        raise ValueError(f"Unsupported file type: {filetype}") from None
+    if isinstance(target, str):
+        module, _, attr = target.partition(":")
+        target = getattr(importlib.import_module(module), attr)
+    _LOADED[filetype] = target
+    return target
+
+
+def filetypes() -> frozenset[str]:
+    """Every file type with a registered extractor."""
+    _load_entry_points()
+    return frozenset(_TARGETS)
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    from importlib.metadata import entry_points
+
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        # built-ins win unless the plugin registers explicitly
+        register(ep.name, ep.value, replace=False)
+
+
+# ---- built-in backends ------------------------------------------------------
+register("pdf", f"{__package__}.pdf_parser:extract_file")
+register("docx", f"{__package__}.docx_parser:extract_file")
+register(("jpg", "jpeg", "png", "tiff"), f"{__package__}.image_parser:extract_file")
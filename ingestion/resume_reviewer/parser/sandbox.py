@@ -0,0 +1,198 @@
+"""
+Resource-bounded parsing for untrusted uploads.
+
+``parse_resume_sandboxed`` runs the whole parse in a child process whose
+CPU time and address space are capped with ``setrlimit``, with PIL's
+decompression-bomb guard tightened, and kills it when the wall-clock budget
+runs out.  Extraction itself stops after ``max_pages`` pages or ``max_chars``
+characters.  Whatever limit is hit, the caller gets a ``ParsedResume`` back
+(partial, or empty when the child died) whose ``parser_notes`` say which
+limit it was, so one pathological file costs at most one bounded process.
+With a ``cache`` option a hit is answered in the caller, without a child::
+
+    res = parse_resume_sandboxed(upload_bytes, filename="cv.pdf")
+    [n for n in res.structured["parser_notes"] if n.startswith("limit: ")]
+
+``resource`` is POSIX-only; elsewhere only the wall clock and the
+page / text limits apply.
+"""
+
+from __future__ import annotations
+
+import errno
+import signal
+import warnings
+from collections import namedtuple
+from pathlib import Path
+
+from .cache import cache_variant
+from .core import ParsedResume, _rebind, parse_resume, parse_resume_bytes
+from .detector import detect, detect_bytes
+from .document import LIMIT_NOTE, checksum_bytes, checksum_file
+from .structure import to_schema
+
+
+class Limits(
+    namedtuple(
+        "Limits",
+        ["cpu_seconds", "memory_mb", "wall_seconds", "max_pages", "max_chars", "max_image_pixels"],
+        defaults=(20, 1024, 30.0, 20, 100_000, 40_000_000),
+    )
+):
+    """Budget for one sandboxed parse; ``None`` disables a limit."""
+    __slots__ = ()
+
+
+DEFAULT_LIMITS = Limits()
+
+
+def parse_resume_sandboxed(
+    source: str | Path | bytes,
+    *,
+    filename: str | None = None,
+    limits: Limits = DEFAULT_LIMITS,
+    **options,
+) -> ParsedResume:
+    """
+    ``parse_resume`` (for a path) or ``parse_resume_bytes`` (for bytes) in a
+    resource-limited child process.
+
+    *options* are passed through (``convert_to_md``, ``backend``, ``ocr``,
+    ``layout``, ``proofread``, ``cache`` ...); ``max_pages`` / ``max_chars`` come from
+    *limits*.  Errors the parser raises on its own (unsupported file type,
+    corrupt file) are re-raised here; running out of time or memory gives an
+    empty result with a ``"limit: ..."`` note instead.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = bytes(source)
+    else:
+        source = Path(source).expanduser().resolve()
+    options.update(max_pages=limits.max_pages, max_chars=limits.max_chars)
+    cache = options.get("cache")
+    if cache is not None:
+        # reruns of the same upload (every Streamlit widget change) need no child
+        _, checksum, name, label = _identify(source, filename)
+        variant = cache_variant(
+            **{k: options[k] for k in ("convert_to_md", "backend", "layout", "proofread", "ocr")
+               if k in options}
+        )
+        hit = cache.get(checksum, **variant)
+        if hit is not None:
+            return _rebind(ParsedResume.from_dict(hit), label, Path(name).name)
+
+    import multiprocessing as mp  # not on the import path of plain parsing
+
+    # forkserver children start from a small clean process instead of a copy
+    # of the caller (Streamlit and its threads); spawn where it doesn't exist
+    ctx = mp.get_context("forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn")
+    recv, send = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_child, args=(send, source, filename, limits, options), daemon=True)
+    proc.start()
+    send.close()  # only the child writes; EOF on recv means it is gone
+    try:
+        if recv.poll(limits.wall_seconds):
+            status, payload = recv.recv()
+        else:
+            status, payload = "limit", f"wall-clock limit of {limits.wall_seconds:g}s"
+    except EOFError:  # died without a word: SIGXCPU, SIGKILL, a crash in C code
+        proc.join(1)
+        status, payload = "limit", _exit_reason(proc.exitcode, limits)
+    finally:
+        recv.close()
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
+
+    if status == "ok":
+        return ParsedResume.from_dict(payload)
+    if status == "error":
+        raise payload
+    return _empty_result(source, filename, f"{LIMIT_NOTE}{payload} exceeded, nothing parsed")
+
+
+def apply_limits(limits: Limits, *, cpu: bool = True) -> None:
+    """
+    Cap this process: address space, CPU time (with *cpu*) and the pixel
+    count PIL accepts.  Images above ``max_image_pixels`` raise instead of
+    only warning.
+    """
+    try:
+        import resource
+    except ImportError:  # not POSIX
+        resource = None
+    if resource is not None:
+        if limits.memory_mb is not None:
+            cap = limits.memory_mb * 2**20
+            resource.setrlimit(resource.RLIMIT_AS, (cap, cap))
+        if cpu and limits.cpu_seconds is not None:
+            # soft limit sends SIGXCPU, the hard one a second later SIGKILL
+            resource.setrlimit(resource.RLIMIT_CPU, (limits.cpu_seconds, limits.cpu_seconds + 1))
+    if limits.max_image_pixels is not None:
+        from PIL import Image
+
+        Image.MAX_IMAGE_PIXELS = limits.max_image_pixels
+        warnings.simplefilter("error", Image.DecompressionBombWarning)
+
+
+def _child(conn, source, filename: str | None, limits: Limits, options: dict) -> None:
+    try:
+        apply_limits(limits)
+        if isinstance(source, bytes):
+            result = parse_resume_bytes(source, filename=filename, **options)
+        else:
+            result = parse_resume(source, **options)
+        conn.send(("ok", result.to_dict()))
+    except Exception as exc:  # noqa: BLE001 - handed to the parent
+        hit = _limit_hit(exc, limits)
+        if hit:
+            conn.send(("limit", hit))
+        else:
+            try:
+                conn.send(("error", exc))
+            except Exception:  # noqa: BLE001 - not picklable
+                conn.send(("error", RuntimeError(f"{type(exc).__name__}: {exc}")))
+    finally:
+        conn.close()
+
+
+def _limit_hit(exc: BaseException | None, limits: Limits) -> str | None:
+    """Which limit *exc* (or what caused it) comes from, if any."""
+    while exc is not None:
+        if isinstance(exc, MemoryError) or (
+            # mmap of a shared library or a big buffer refused under RLIMIT_AS
+            isinstance(exc, OSError)
+            and (exc.errno == errno.ENOMEM or "failed to map" in str(exc))
+        ):
+            return f"memory limit of {limits.memory_mb} MiB"
+        if type(exc).__name__ in ("DecompressionBombError", "DecompressionBombWarning"):
+            return f"image size limit of {limits.max_image_pixels} pixels"
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+def _exit_reason(exitcode: int | None, limits: Limits) -> str:
+    killed = {-getattr(signal, name) for name in ("SIGXCPU", "SIGKILL") if hasattr(signal, name)}
+    if exitcode in killed and limits.cpu_seconds is not None:
+        # SIGKILL is also what the OOM killer sends; the CPU cap is the usual cause
+        return f"CPU-time limit of {limits.cpu_seconds}s"
+    return f"parser process limit (exit code {exitcode})"
+
+
+def _empty_result(source, filename: str | None, note: str) -> ParsedResume:
+    """What the caller gets when the child produced nothing."""
+    filetype, checksum, name, label = _identify(source, filename)
+    structured = to_schema("", filepath=Path(name), checksum=checksum, normalized=True)
+    structured["meta"]["page_count"] = 0
+    structured["parser_notes"].append(note)
+    return ParsedResume(
+        text="", metadata={"filetype": filetype, "source": label}, structured=structured
+    )
+
+
+def _identify(source, filename: str | None) -> tuple[str, str, str, str]:
+    """``(filetype, checksum, file name, source label)`` as the parse would set them."""
+    if isinstance(source, bytes):
+        filetype = detect_bytes(source)
+        name = filename or f"upload.{filetype}"
+        return filetype, checksum_bytes(source), name, filename or "<bytes>"
+    return detect(source), checksum_file(source), source.name, str(source)
@@ -0,0 +1,215 @@
+"""
+Dictionary skill extraction: an Aho-Corasick automaton over the tokens of a
+skill lexicon, run once over the whole résumé text.
+
+The lexicon maps canonical skill names, each labelled ``hard`` or ``soft``,
+to their synonyms (``skills.json`` next to this module; the same shape in
+JSON or YAML for a custom one)::
+
+    {"hard": [["Kubernetes", "k8s"], ["CI/CD", "continuous integration"]],
+     "soft": [["Communication", "communication skills"]],
+     "case_sensitive": ["Go"]}
+
+Patterns are matched on lower-cased word tokens, so "CI/CD", "ci cd" and
+"Problem-solving" / "problem solving" are the same pattern and "go" never
+matches inside "Google".  Forms listed under ``case_sensitive`` only match
+in exactly that spelling ("Go", not "go to market").  Where matches
+overlap, the leftmost-longest one wins ("Lean Six Sigma" over "Lean").
+The scan is linear in the number of tokens and allocates nothing for
+tokens that start no pattern::
+
+    default_lexicon().extract(text)
+    # ({"hard": ["Python", "SQL"], "soft": ["Leadership"]},
+    #  {"Python": [[120, 126]], "SQL": [[128, 131], [540, 543]], ...})
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import deque, namedtuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .document import iter_lines
+
+LEXICON_PATH = Path(__file__).with_name("skills.json")
+LABELS = ("hard", "soft")
+# words, "c++", "c#", ".net", "node.js"; "-" and "/" separate tokens
+TOKEN_RE = re.compile(r"\.?\w+(?:\.\w+)*(?:[+#]+(?!\w))?")
+
+SkillMatch = namedtuple("SkillMatch", ["skill", "label", "start", "end"])
+
+
+def skill_tokens(phrase: str) -> list[str]:
+    return [m.group().lower() for m in TOKEN_RE.finditer(phrase)]
+
+
+class SkillLexicon:
+    """A compiled lexicon; build once and share (``default_lexicon`` is cached)."""
+
+    def __init__(self, lexicon: dict):
+        self.skills: list[tuple[str, str]] = []  # (canonical name, label)
+        # pattern id -> (skill id, token count, exact-case tokens or None)
+        self._patterns: list[tuple[int, int, tuple[str, ...] | None]] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[list[int]] = [[]]
+        exact = {form.lower(): form for form in lexicon.get("case_sensitive", ())}
+        for label in LABELS:
+            for forms in lexicon.get(label, ()):
+                self.skills.append((forms[0], label))
+                for form in dict.fromkeys(forms):
+                    self._add(form, len(self.skills) - 1, exact.get(form.lower()))
+        self._fail = self._link()
+        self.max_tokens = max((n for _, n, _ in self._patterns), default=0)
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "SkillLexicon":
+        """A lexicon from JSON, or YAML (``.yaml`` / ``.yml``, needs ``pyyaml``)."""
+        path = Path(path)
+        raw = path.read_text("utf-8")
+        if path.suffix in (".yaml", ".yml"):
+            import yaml
+
+            return cls(yaml.safe_load(raw))
+        return cls(json.loads(raw))
+
+    # ---- building ------------------------------------------------------------
+    def _add(self, form: str, skill: int, exact: str | None) -> None:
+        tokens = skill_tokens(form)
+        if not tokens:
+            return
+        node = 0
+        for tok in tokens:
+            nxt = self._goto[node].get(tok)
+            if nxt is None:
+                nxt = self._goto[node][tok] = len(self._goto)
+                self._goto.append({})
+                self._out.append([])
+            node = nxt
+        cased = tuple(m.group() for m in TOKEN_RE.finditer(exact)) if exact else None
+        self._out[node].append(len(self._patterns))
+        self._patterns.append((skill, len(tokens), cased))
+
+    def _link(self) -> list[int]:
+        """Failure links (breadth first); outputs inherit their fallback's."""
+        fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for tok, child in self._goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and tok not in self._goto[f]:
+                    f = fail[f]
+                fail[child] = self._goto[f].get(tok, 0) if node else 0
+                self._out[child] = self._out[child] + self._out[fail[child]]
+        return fail
+
+    # ---- matching ------------------------------------------------------------
+    def scanner(self) -> "SkillScanner":
+        return SkillScanner(self)
+
+    def scan(self, text: str | Iterable[str]) -> list[SkillMatch]:
+        """Non-overlapping skill mentions in *text* (a string or its lines)."""
+        scanner = self.scanner()
+        for line in iter_lines(text):
+            scanner.feed(line)
+        return scanner.matches()
+
+    def extract(self, text: str | Iterable[str]) -> tuple[dict, dict]:
+        """Skills by label and their offsets; see ``SkillScanner.result``."""
+        scanner = self.scanner()
+        for line in iter_lines(text):
+            scanner.feed(line)
+        return scanner.result()
+
+
+@lru_cache(maxsize=1)
+def default_lexicon() -> SkillLexicon:
+    """The bundled ``skills.json``, compiled once per process."""
+    return SkillLexicon.from_file(LEXICON_PATH)
+
+
+class SkillScanner:
+    """
+    Streaming scan: ``feed`` lines in order; offsets are into the lines
+    joined with ``"\\n"`` (the ``ParsedResume.text`` they came from).  The
+    automaton state carries across lines, so a skill may wrap.
+    """
+
+    def __init__(self, lexicon: SkillLexicon):
+        self.lexicon = lexicon
+        self.offset = 0
+        self._state = 0
+        self._recent: deque = deque(maxlen=max(lexicon.max_tokens, 1))  # (start, end, token)
+        self._hits: list[tuple[int, int, int]] = []  # (start, -end, skill)
+
+    def feed(self, line: str) -> None:
+        goto, fail, out = self.lexicon._goto, self.lexicon._fail, self.lexicon._out
+        root, patterns = goto[0], self.lexicon._patterns
+        state, recent, base = self._state, self._recent, self.offset
+        self.offset = base + len(line) + 1
+        if not root:  # empty lexicon: nothing to find
+            return
+        low = line.lower()
+        folded = len(low) == len(line)  # offsets into low are offsets into line
+        for m in TOKEN_RE.finditer(low if folded else line):
+            tok = m.group() if folded else m.group().lower()
+            if not state and tok not in root:
+                recent.clear()  # nothing in flight can use older tokens
+                continue
+            start, end = m.span()
+            recent.append((base + start, base + end, line[start:end]))
+            while state and tok not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(tok, 0)
+            for pid in out[state]:
+                skill, n, cased = patterns[pid]
+                window = list(recent)[-n:]
+                if cased is not None and tuple(t for _, _, t in window) != cased:
+                    continue
+                self._hits.append((window[0][0], -window[-1][1], skill))
+        self._state = state
+
+    def tap(self, chunks: Iterable[list[str]]) -> Iterator[list[str]]:
+        """
+        *chunks* of lines (``document.line_chunks``), each fed to the scanner
+        as it passes (for ``to_schema``): no token spans a newline, so feeding
+        a chunk joined matches feeding its lines one by one.
+        """
+        for lines in chunks:
+            self.feed("\n".join(lines))
+            yield lines
+
+    def matches(self) -> list[SkillMatch]:
+        """
+        Leftmost-longest, non-overlapping mentions in text order.  Call it,
+        or ``result``, once, after the last ``feed``.
+        """
+        return list(self._iter_matches())
+
+    def _iter_matches(self) -> Iterator[SkillMatch]:
+        # consumes the hits, each freed as its match is made: sorted in place
+        # and popped from the end, so no second list of them is ever built
+        skills, hits = self.lexicon.skills, self._hits
+        hits.sort(reverse=True)
+        end = -1
+        while hits:
+            start, neg_end, skill = hits.pop()
+            if start >= end:
+                yield SkillMatch(*skills[skill], start, -neg_end)
+                end = -neg_end
+
+    def result(self) -> tuple[dict, dict]:
+        """``({"hard": [...], "soft": [...]}, {skill: [[start, end], ...]})``."""
+        by_label: dict[str, list[str]] = {label: [] for label in LABELS}
+        offsets: dict[str, list[list[int]]] = {}
+        for match in self._iter_matches():
+            spans = offsets.get(match.skill)
+            if spans is None:
+                spans = offsets[match.skill] = []
+                by_label[match.label].append(match.skill)
+            spans.append([match.start, match.end])
+        return by_label, offsets
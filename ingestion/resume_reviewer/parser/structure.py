@@ -1,85 +1,330 @@
 # resume_reviewer/parser/structure.py
 from __future__ import annotations
-import hashlib, re, datetime as dt, unicodedata, yaml
+import re, datetime as dt, string, unicodedata
 from pathlib import Path
-from collections import defaultdict
-from dateutil import parser as date_parse
+from typing import Container, Iterable, Iterator
 
-SECTION_RE = re.compile(r"^(experience|work history|education|skills?)[:\s]*$", re.I)
-DATE_RANGE_RE = re.compile(r"(\w+\s+\d{4})\s*[-–]\s*(present|\w+\s+\d{4})", re.I)
+from .dates import PRESENT, normalize_date
+from .document import checksum_file, line_chunks
+from .skills import SkillLexicon, default_lexicon
+
+PARSER_VERSION = "0.10.0"
+
+SECTIONS = r"experience|work history|education|skills?"
+SECTION_RE = re.compile(rf"^(?:#{{1,6}}\s*)?({SECTIONS})[:\s]*$", re.I)  # plain or "## Skills"
+# "Mar 2019", "März 2019", "03/2019", "2019" — month words are checked later
+_DATE = r"(?:[^\W\d_]{3,}\.?\s+|\d{1,2}\s*[./]\s*)?(?:19|20)\d{2}(?!\d)"
+_PRESENT = "|".join(sorted(PRESENT, key=len, reverse=True))
+DATE_RANGE_RE = re.compile(
+    rf"(?P<start>{_DATE})\s*(?:[-–—]|\b(?:to|bis|until)\b)\s*(?P<end>(?:{_PRESENT})\b|{_DATE})",
+    re.I,
+)
 EMAIL_RE = re.compile(r"[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}", re.I)
 PHONE_RE = re.compile(r"\+?\d[\d ()-]{7,}")
 
+# ``iter_events`` settles most lines with prefix and substring checks and
+# runs these only on lines that can match: a date range needs a "19" or "20"
+# year, a phone number a digit, an email an "@".
+DATE_SEARCH_RE = re.compile(rf"\b(?:{DATE_RANGE_RE.pattern})", re.I)
+CONTACT_EMAIL_RE = re.compile(rf"(?<![\w.%+-]){EMAIL_RE.pattern}", re.I)
+_DIGIT_RE = re.compile(r"[0-9]")  # NFKC folds full-width digits to these
+_SECTION_NAMES = frozenset({"experience", "work history", "education", "skill", "skills"})
+_HEADING_START = frozenset("#EeWwSs")  # first characters of a ``SECTION_RE`` match
+_HEADING_TAIL = ":" + string.whitespace
+_HEADING_MAX = 40  # no longer line is a heading
+_MONTH_SPAN = 20  # "September. 2019": month word and spacing before the year
+_LOCAL_PART_MAX = 64  # an email's user name, before the "@" (RFC 5321)
+SECTION_ALIASES = {"work history": "experience", "skill": "skills"}
+CONTACT_LINES = 15  # heuristic: contact details sit in the first lines
+DATED_SECTIONS = ("experience", "education")  # where ``to_schema`` reads date ranges
+
+# One classified line: ``(section, kind, line, match)`` with kind one of
+# heading|bullet|date|contact|text|blank; match is the date range or contact
+# detail.  Plain tuples: a namedtuple costs more per line than the checks.
+Event = tuple
+
+
 def _normalize(s: str) -> str:
     return unicodedata.normalize("NFKC", s)
 
-def _checksum(path: Path) -> str:
-    h = hashlib.sha256()
-    h.update(path.read_bytes())
-    return f"sha256:{h.hexdigest()}"
+
+def iter_events(
+    text: str | Iterable[str],
+    *,
+    normalized: bool = False,
+    sections: Container[str] | None = None,
+) -> Iterator[Event]:
+    """
+    Classify each line once and tag it with the section it belongs to.
+    Pass ``normalized=True`` when the text already went through NFKC, and
+    *sections* to look for dates and contacts only there (other lines are
+    ``text``).
+    """
+    return _events(line_chunks(text), normalized, sections)
+
+
+def _events(
+    chunks: Iterable[list[str]], normalized: bool, sections: Container[str] | None
+) -> Iterator[Event]:
+    section = "misc"
+    classify = sections is None or section in sections
+    heading_start, digit = _HEADING_START, _DIGIT_RE.search  # locals: read once per line
+    for lines in chunks:
+        for raw in lines:
+            if not (normalized or raw.isascii()):  # ASCII is NFKC already
+                raw = _normalize(raw)
+            line = raw.strip()
+            if not line:
+                yield (section, "blank", "", None)
+                continue
+            first = line[0]
+            if first == "-" or first == "•":
+                yield (section, "bullet", line, None)
+                continue
+            if first in heading_start and len(line) <= _HEADING_MAX:
+                name = _section_name(line)
+                if name is not None:
+                    section = name
+                    classify = sections is None or section in sections
+                    yield (section, "heading", line, None)
+                    continue
+            if not classify:
+                yield (section, "text", line, None)
+                continue
+            m = None
+            if "19" in line or "20" in line:
+                m = _date_range(line)
+                if m is not None:
+                    yield (section, "date", line, m)
+                    continue
+            if "@" in line:
+                at = line.find("@")
+                m = CONTACT_EMAIL_RE.search(line, at - _LOCAL_PART_MAX if at > _LOCAL_PART_MAX else 0)
+            if m is None and digit(line):
+                m = PHONE_RE.search(line)
+            yield (section, "text" if m is None else "contact", line, m)
+
+
+def _section_name(line: str) -> str | None:
+    """Section a stripped heading line opens: ``SECTION_RE.match`` without the regex."""
+    name = line.lstrip("#")
+    if len(line) - len(name) > 6:
+        return None
+    name = name.lstrip().rstrip(_HEADING_TAIL).lower()
+    if name not in _SECTION_NAMES:
+        return None
+    return SECTION_ALIASES.get(name, name)
+
+
+def _date_range(line: str) -> re.Match | None:
+    """``DATE_RANGE_RE`` match on a line, searched from its first "19"/"20"."""
+    year = line.find("19")
+    other = line.find("20")
+    if other >= 0 and (year < 0 or other < year):
+        year = other
+    if year < 0:
+        return None
+    # the range usually starts a word before its year: "Jan 2019 - ..."
+    return DATE_SEARCH_RE.match(line, line.rfind(" ", 0, year - 1) + 1) or DATE_SEARCH_RE.search(
+        line, year - _MONTH_SPAN if year > _MONTH_SPAN else 0
+    )
+
 
 # -------------------------------------------------
-def to_schema(text: str, *, filepath: Path, parser_version="0.4.0") -> dict:
-    lines = [_normalize(l).strip() for l in text.splitlines() if l.strip()]
-    sections = defaultdict(list)
-
-    current = "misc"
-    for ln in lines:
-        m = SECTION_RE.match(ln)
-        if m:
-            current = m.group(1).lower()
-            continue
-        sections[current].append(ln)
-
-    # --- candidate block ---------------------------------------------------
-    contact_block = "\n".join(sections["misc"][:15])  # heuristic: first lines
-    email = EMAIL_RE.search(contact_block)
-    phone = PHONE_RE.search(contact_block)
-    full_name = lines[0] if len(lines[0].split()) <= 5 else ""
-    candidate = {
-        "full_name": full_name,
-        "contact": {
-            "email": email.group(0) if email else "",
-            "phone": phone.group(0) if phone else "",
-            "location": "",
-            "linkedin": "",
-            "github": "",
-        },
-        "summary": "",
+class _CandidateBuilder:
+    def __init__(self):
+        self.full_name = None
+        self.email = self.phone = ""
+        self.seen_misc = 0
+
+    def feed(self, section: str, line: str, heading: bool = False) -> None:
+        """One non-blank line (``to_schema`` stops once the name is set and
+        the misc section is over)."""
+        if self.full_name is None:
+            name = line.lstrip("# ")  # "# Jane Doe" from layout Markdown
+            self.full_name = name if len(name.split()) <= 5 else ""
+        if section != "misc" or heading or self.seen_misc >= CONTACT_LINES:
+            return
+        self.seen_misc += 1
+        if not self.email and (m := EMAIL_RE.search(line)):
+            self.email = m.group(0)
+        if not self.phone and (m := PHONE_RE.search(line)):
+            self.phone = m.group(0)
+
+    def result(self) -> dict:
+        return {
+            "full_name": self.full_name or "",
+            "contact": {
+                "email": self.email,
+                "phone": self.phone,
+                "location": "",
+                "linkedin": "",
+                "github": "",
+            },
+            "summary": "",
+        }
+
+
+def _new_entry(section: str, line: str, m: re.Match | None) -> dict:
+    """
+    Entry opened by *line*.  Experience entries collect bullets; education
+    entries take their title from the line, minus the date range *m*.
+    """
+    entry = {
+        "title": "",
+        "employer": "",
+        "location": "",
+        "start_date": "",
+        "end_date": "",
     }
+    if section == "experience":
+        entry["bullets"] = []
+    else:
+        if m is not None:
+            line = line[: m.start()] + line[m.end():]
+        entry["title"] = line.lstrip("-•# ").strip(" ,;|-–()")
+    return entry
+
+
+class _SkillsBuilder:
+    """
+    Items of the skills section (split on "," ";" and a free-standing "/",
+    a token may continue on the next line) that the lexicon does not know;
+    the lexicon scan of the whole text finds the rest.
+    """
+
+    SLASH_RE = re.compile(r"/(?!\w)|(?<!\w)/")  # "CI/CD", "A/B" stay whole
+    MAX_WORDS = 4  # longer items are sentences, not skill names
+
+    def __init__(self, lexicon: SkillLexicon):
+        self.lexicon = lexicon
+        self.other: list[str] = []
+        self._seen: set[str] = set()
+        self.lines: list[str] = []  # non-blank lines of the section, filled by ``to_schema``
+
+    def _add(self, tokens) -> None:
+        for token in tokens:
+            if not token or token in self._seen or len(token.split()) > self.MAX_WORDS:
+                continue
+            self._seen.add(token)
+            if not self.lexicon.scan(token):
+                self.other.append(token)
+
+    def result(self) -> list[str]:
+        # the lines joined, as an item may continue on the next one; string
+        # splits first, the slash pattern only on the items that have one
+        items = " ".join(self.lines).replace(";", ",").split(",")
+        self.lines.clear()
+        split = self.SLASH_RE.split
+        tokens = [
+            token.strip(" .:-•*")
+            for item in items
+            for token in (split(item) if "/" in item else (item,))
+        ]
+        self._add(dict.fromkeys(tokens))  # repeats dropped before the per-token checks
+        return self.other
+
+
+# -------------------------------------------------
+def to_schema(
+    text: str | Iterable[str],
+    *,
+    filepath: Path,
+    parser_version=PARSER_VERSION,
+    checksum: str | None = None,
+    normalized: bool = False,
+    lexicon: SkillLexicon | None = None,
+) -> dict:
+    """
+    Build the résumé schema from cleaned text (a string or an iterable of
+    lines).  One pass classifies each line as ``iter_events`` does and files
+    it as it streams past: dated entries of experience and education (split
+    on blank lines or on a second date range), the lines of the skills
+    section, name and contact details from the first lines.  Peak memory
+    tracks the largest section rather than copies of the whole document.
+
+    Skills come from one scan of every line with *lexicon* (default: the
+    bundled ``skills.json``): canonical names under ``hard`` / ``soft``,
+    unknown items of a skills section under ``other``, and the character
+    offsets of every mention in ``skill_offsets``.
+    """
+    lexicon = lexicon or default_lexicon()
+    scanner = lexicon.scanner()
+    candidate_b, skills_b = _CandidateBuilder(), _SkillsBuilder(lexicon)
+    dated = {section: [] for section in DATED_SECTIONS}
+    skill_lines = skills_b.lines
+    section, entries, entry = "misc", None, None
+    open_entry: dict[str, dict | None] = {}
+    heading_start, to_candidate = _HEADING_START, True
+    # the classification of ``iter_events``, inlined: a generator and a
+    # builder call per line cost more than the checks themselves
+    for lines in scanner.tap(line_chunks(text)):
+        for raw in lines:
+            if not (normalized or raw.isascii()):  # ASCII is NFKC already
+                raw = _normalize(raw)
+            line = raw.strip()
+            if not line:  # a blank line ends the entry
+                if entry is not None:
+                    entries.append(entry)
+                    entry = None
+                continue
+            first = line[0]
+            if first in heading_start and len(line) <= _HEADING_MAX:
+                name = line.lstrip("#")  # ``_section_name``, inlined
+                name = name.lstrip().rstrip(_HEADING_TAIL).lower() if len(line) - len(name) <= 6 else ""
+                if name in _SECTION_NAMES:
+                    name = SECTION_ALIASES.get(name, name)
+                    if to_candidate:
+                        candidate_b.feed(section, line, heading=True)
+                        to_candidate = False  # sets the name; no heading leads back to misc
+                    # an open entry resumes when its section comes back
+                    open_entry[section] = entry
+                    section, entries = name, dated.get(name)
+                    entry = open_entry.get(section)
+                    continue
+            if to_candidate:
+                candidate_b.feed(section, line)
+                to_candidate = section == "misc" and candidate_b.seen_misc < CONTACT_LINES
+            if entries is None:
+                if section == "skills":
+                    skill_lines.append(line)
+                continue
+            if first == "-" or first == "•":
+                if entry is None:
+                    entry = _new_entry(section, line, None)
+                if not entry["start_date"] and ("19" in line or "20" in line):
+                    m = DATE_RANGE_RE.search(line)  # date inside a bullet line
+                    if m is not None:
+                        entry["start_date"] = normalize_date(m.group("start"))
+                        entry["end_date"] = normalize_date(m.group("end"))
+                if section == "experience":
+                    entry["bullets"].append(line.lstrip("-• "))
+                continue
+            m = _date_range(line) if "19" in line or "20" in line else None
+            if m is not None and entry is not None and entry["start_date"]:
+                entries.append(entry)  # a second date range starts the next entry
+                entry = None
+            if entry is None:
+                entry = _new_entry(section, line, m)
+            if m is not None and not entry["start_date"]:
+                entry["start_date"] = normalize_date(m.group("start"))
+                entry["end_date"] = normalize_date(m.group("end"))
+    open_entry[section] = entry
+    for section, entry in open_entry.items():
+        if entry is not None:
+            dated[section].append(entry)
 
-    # --- experience (very naive) ------------------------------------------
-    exp_entries = []
-    chunks = "\n".join(sections["experience"]).split("\n\n")
-    for blk in chunks:
-        if not blk.strip(): continue
-        start, end = None, None
-        dmatch = DATE_RANGE_RE.search(blk)
-        if dmatch:
-            start = _date_norm(dmatch.group(1))
-            end   = _date_norm(dmatch.group(2))
-        bullets = [l.lstrip("-• ") for l in blk.splitlines() if l.startswith(("-", "•"))]
-        exp_entries.append({
-            "title": "",
-            "employer": "",
-            "location": "",
-            "start_date": start or "",
-            "end_date": end or "",
-            "bullets": bullets,
-        })
-
-    # --- skills ------------------------------------------------------------
-    skills = {"hard": [], "soft": []}
-    skills_txt = " ".join(sections["skills"])
-    for token in re.split(r"[,/;]", skills_txt):
-        token = token.strip()
-        if token:
-            skills["hard"].append(token)   # todo: classify later
+    candidate = candidate_b.result()
+    exp_entries = dated["experience"]
+    edu_entries = dated["education"]
+    other = skills_b.result()  # before the scanner's result: one peak at a time
+    skills, skill_offsets = scanner.result()
+    skills["other"] = other
 
     # --- compose schema ----------------------------------------------------
     schema = {
         "meta": {
-            "checksum": _checksum(filepath),
+            "checksum": checksum or checksum_file(filepath),
             "parsed_at": dt.datetime.utcnow().isoformat(timespec="seconds") + "Z",
             "file_name": filepath.name,
             "page_count": 0,  # filled outside if pdfplumber already open
@@ -88,7 +333,7 @@ def to_schema(text: str, *, filepath: Path, parser_version="0.4.0") -> dict:
         "candidate": candidate,
         "sections": {
             "experience": exp_entries,
-            "education": [],        # TODO: parse
+            "education": edu_entries,
             "skills": skills,
             "certifications": [],
             "languages": [],
@@ -97,13 +342,9 @@ def to_schema(text: str, *, filepath: Path, parser_version="0.4.0") -> dict:
         "parser_notes": [],
         "media_refs": [],
         "target_role": None,
+        "skill_offsets": skill_offsets,
     }
     return schema
 
 def _date_norm(raw: str) -> str:
-    if not raw or raw.lower() == "present":
-        return "present"
-    try:
-        return date_parse.parse(raw).strftime("%Y-%m")
-    except ValueError:
-        return ""
+    return normalize_date(raw)
@@ -0,0 +1,20 @@
+# tests/test_batch.py
+from resume_reviewer.parser.batch import iter_inputs, parse_many
+
+
+def test_iter_inputs_expands_dirs_and_globs(tmp_path):
+    (tmp_path / "A").mkdir()
+    (tmp_path / "A" / "1.pdf").write_bytes(b"x")
+    (tmp_path / "A" / "notes.txt").write_text("x")
+    (tmp_path / "2.docx").write_bytes(b"x")
+    assert [p.name for p in iter_inputs([tmp_path / "A"])] == ["1.pdf"]
+    assert [p.name for p in iter_inputs([str(tmp_path / "*.docx")])] == ["2.docx"]
+
+
+def test_failure_becomes_error_record(tmp_path):
+    bad = tmp_path / "broken.pdf"
+    bad.write_bytes(b"not a pdf")
+    (record,) = parse_many([bad], workers=1)
+    assert record["ok"] is False
+    assert record["source"] == str(bad)
+    assert record["error"]
@@ -0,0 +1,66 @@
+# tests/test_cache.py
+from resume_reviewer.parser.cache import ParseCache, cache_variant
+
+
+def test_roundtrip_and_flag_in_key(tmp_path):
+    cache = ParseCache(tmp_path)
+    cache.put("sha256:abc", {"text": "hi"}, convert_to_md=True)
+    assert cache.get("sha256:abc", convert_to_md=True) == {"text": "hi"}
+    assert cache.get("sha256:abc", convert_to_md=False) is None
+
+
+def test_version_bump_invalidates(tmp_path):
+    ParseCache(tmp_path, parser_version="1").put("sha256:abc", {}, convert_to_md=True)
+    cache = ParseCache(tmp_path, parser_version="2")
+    assert cache.get("sha256:abc", convert_to_md=True) is None
+    assert not (tmp_path / "versions" / "1").exists()
+
+
+def test_open_leaves_other_directories_alone(tmp_path):
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes" / "keep.txt").write_text("mine")
+    (tmp_path / "versions" / "0.1").mkdir(parents=True)  # no marker: not ours
+    ParseCache(tmp_path, parser_version="2").put("sha256:abc", {}, convert_to_md=True)
+    ParseCache(tmp_path, parser_version="1")  # an older deployment on the same root
+    assert (tmp_path / "notes" / "keep.txt").read_text() == "mine"
+    assert (tmp_path / "versions" / "0.1").is_dir()
+    assert ParseCache(tmp_path, parser_version="2").get("sha256:abc", convert_to_md=True) == {}
+
+
+def test_lru_eviction(tmp_path):
+    import os
+    cache = ParseCache(tmp_path, max_bytes=250)
+    for i in range(3):
+        cache.put(f"sha256:{i}", {"text": "x" * 80}, convert_to_md=True)
+        path = cache._path(cache.key(f"sha256:{i}", convert_to_md=True))
+        os.utime(path, (i, i))  # deterministic recency
+    cache.put("sha256:new", {"text": "x" * 80}, convert_to_md=True)
+    assert cache.get("sha256:0", convert_to_md=True) is None
+    assert cache.get("sha256:new", convert_to_md=True) is not None
+
+
+def test_puts_below_the_limit_do_not_list_the_cache(tmp_path, monkeypatch):
+    cache = ParseCache(tmp_path, max_bytes=10_000)
+    scans = []
+    evict = cache.evict
+    monkeypatch.setattr(cache, "evict", lambda: scans.append(1) or evict())
+    for i in range(20):
+        cache.put(f"sha256:{i}", {"text": "x" * 80}, convert_to_md=True)
+    assert len(scans) == 1  # the first put learns the size on disk
+    for i in range(100):
+        cache.put(f"sha256:more{i}", {"text": "x" * 80}, convert_to_md=True)
+    assert 1 < len(scans) < 20
+    assert sum(p.stat().st_size for p in cache.dir.glob("*/*.json")) <= 10_000
+
+
+def test_ocr_setting_is_part_of_the_key(tmp_path):
+    from resume_reviewer.parser.ocr import OcrEngine
+
+    cache = ParseCache(tmp_path)
+    cache.put("sha256:abc", {"text": "no ocr"}, **cache_variant(ocr=False))
+    assert cache.get("sha256:abc", **cache_variant(ocr=True)) is None
+    assert cache.get("sha256:abc", **cache_variant(ocr=False)) == {"text": "no ocr"}
+    deu = cache_variant(ocr=OcrEngine(lang="deu"))
+    assert cache.key("sha256:abc", **deu) != cache.key("sha256:abc", **cache_variant())
+    # the default engine keeps the keys of existing entries
+    assert cache.key("sha256:abc", **cache_variant()) == cache.key("sha256:abc", convert_to_md=True)
@@ -0,0 +1,21 @@
+# tests/test_cleanup.py
+from resume_reviewer.parser.cleanup import (
+    STAGES, normalize, normalize_whitespace, strip_headers_footers,
+)
+
+RAW = "  \n\nPage 1\nCurriculum Vitae\nJane  \n\n\n\nExperience\t\n   \n\nﬁnance\n\n"
+
+
+def test_single_stage_wrappers_keep_old_behaviour():
+    assert strip_headers_footers("a\nPage 2\nb") == "a\nb"
+    assert normalize_whitespace("  a  \n\n\n\nb\n\n") == "a\n\nb"
+
+
+def test_fused_pass_with_markdown_headings():
+    assert normalize(RAW, markdown=True) == "Jane\n\n## Experience\n\nfinance"
+
+
+def test_timings_cover_every_stage():
+    timings = {}
+    normalize(RAW, markdown=True, timings=timings)
+    assert set(timings) == set(STAGES)
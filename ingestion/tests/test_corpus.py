@@ -0,0 +1,140 @@
+# tests/test_corpus.py
+import os
+import pathlib
+import shutil
+
+from resume_reviewer.corpus import Catalog
+
+SAMPLES = pathlib.Path(__file__).parents[1] / "sample ingestion"
+
+
+def _corpus(tmp_path):
+    root = tmp_path / "data"
+    for category, pdf in zip(("ACCOUNTANT", "ADVOCATE"), sorted(SAMPLES.glob("*.pdf"))):
+        (root / category).mkdir(parents=True)
+        shutil.copy(pdf, root / category / pdf.name)
+    return root
+
+
+def test_update_parses_only_new_changed_and_stale(tmp_path):
+    root = _corpus(tmp_path)
+    db, cache = tmp_path / "corpus.sqlite", tmp_path / "cache"
+    with Catalog(db, cache_root=cache, parser_version="0.0.1") as cat:
+        assert cat.update(root, workers=1)["parsed"] == 2
+        rows = list(cat.rows())
+        assert [r["category"] for r in rows] == ["ACCOUNTANT", "ADVOCATE"]
+        assert all(r["status"] == "ok" and r["checksum"] and r["page_count"] for r in rows)
+        assert cat.update(workers=1)["parsed"] == 0  # root remembered, nothing to do
+        assert len(list(cat.results())) == 2  # stored under the catalog's parser version
+
+    with Catalog(db, cache_root=cache) as cat:  # newer parser: everything is stale
+        counts = cat.update(workers=1)
+        assert (counts["stale"], counts["parsed"]) == (2, 2)
+
+        acc = next((root / "ACCOUNTANT").iterdir())
+        os.utime(acc, ns=(0, 0))  # same bytes, new mtime: re-hashed, not re-parsed
+        counts = cat.update(workers=1)
+        assert (counts["touched"], counts["parsed"]) == (1, 0)
+
+        acc.write_bytes(acc.read_bytes() + b"\n%% edited\n")
+        next((root / "ADVOCATE").iterdir()).unlink()
+        counts = cat.update(workers=1)
+        assert (counts["changed"], counts["removed"], counts["parsed"]) == (1, 1, 1)
+        assert cat.stats()["categories"].keys() == {"ACCOUNTANT"}
+        assert cat.result(f"ACCOUNTANT/{acc.name}").text
+
+        cat._cache().clear()  # evicted: reported, then parsed again
+        missing = []
+        assert list(cat.results(missing=missing)) == []
+        assert [r["path"] for r in missing] == [f"ACCOUNTANT/{acc.name}"]
+        assert cat.update(workers=1)["stale"] == 1
+        assert [row["path"] for row, _ in cat.results()] == [f"ACCOUNTANT/{acc.name}"]
+
+
+def test_packed_store_round_trip_and_torn_tail(tmp_path):
+    from resume_reviewer.corpus import PackedStore
+    from resume_reviewer.parser import parse_resume
+
+    results = [parse_resume(pdf) for pdf in sorted(SAMPLES.glob("*.pdf"))]
+    with PackedStore(tmp_path / "pack", mode="a") as store:
+        assert store.add_many(results + results[:1]) == 2  # duplicate checksum skipped
+    with open(tmp_path / "pack" / "index.bin", "ab") as fh:
+        fh.write(b"\x00" * 7)  # half-written entry from a crashed writer
+
+    with PackedStore(tmp_path / "pack", mode="a") as store:
+        res = results[0]._replace(text="edited")
+        assert store.add(res, replace=True)
+    with PackedStore(tmp_path / "pack") as store:
+        first, second = (r.structured["meta"]["checksum"] for r in results)
+        assert list(store) == [first, second]
+        assert bytes(store.text_view(second)) == results[1].text.encode()
+        assert store.get(second) == results[1]
+        assert store.text(first) == "edited"
+
+
+def _resume(n, text, skills=(), bullets=()):
+    from resume_reviewer.parser import ParsedResume
+
+    structured = {
+        "meta": {"checksum": f"sha256:{n:064x}"},
+        "sections": {"skills": {"hard": list(skills)}, "experience": [{"bullets": list(bullets)}]},
+    }
+    return ParsedResume(text, {}, structured)
+
+
+def test_search_boolean_phrase_category_and_updates(tmp_path):
+    from resume_reviewer.corpus import SearchIndex
+
+    index = SearchIndex()
+    it = _resume(1, "Platform engineer. Kubernetes and Terraform on AWS.")
+    index.add("it/1", it, category="IT")
+    index.add("it/2", _resume(2, "Kubernetes operator", skills=["Kubernetes", "Go"]), category="IT")
+    hr = _resume(3, "Recruiter who knows terraform basics", bullets=["Hired 40 engineers"])
+    index.add("hr/3", hr, category="HR")
+
+    assert {h.key for h in index.search("kubernetes terraform")} == {"it/1"}
+    # a skills-field match weighs more than the same term in the text
+    assert [h.key for h in index.search("kubernetes")] == ["it/2", "it/1"]
+    assert {h.key for h in index.search("terraform", category="HR")} == {"hr/3"}
+    assert {h.key for h in index.search("terraform OR go AND NOT aws")} == {"it/1", "it/2", "hr/3"}
+    assert {h.key for h in index.search("(terraform OR go) AND NOT aws")} == {"it/2", "hr/3"}
+    assert {h.key for h in index.search('"kubernetes and terraform"')} == {"it/1"}
+    assert index.search('"terraform and kubernetes"') == []
+    assert {h.key for h in index.search("bullets:engineers")} == {"hr/3"}
+
+    index.add("it/1", _resume(4, "Now a data analyst"), category="IT")  # re-parsed
+    index.remove("hr/3")
+    index.save(tmp_path / "index.pkl")
+    index = SearchIndex.load(tmp_path / "index.pkl")
+    assert index.search("terraform") == []
+    assert [(h.key, h.checksum) for h in index.search("analyst")] == [("it/1", f"sha256:{4:064x}")]
+
+
+def test_near_duplicates_match_edited_copies_only(tmp_path):
+    from resume_reviewer.corpus import NearDuplicateIndex
+
+    words = " ".join(f"word{i}" for i in range(300))
+    base = f"Jane Doe. Senior accountant. {words}. Managed month-end close for 12 entities."
+    edited = base.replace("12 entities", "14 entities")
+    other = " ".join(f"term{i}" for i in range(300))
+
+    index = NearDuplicateIndex(threshold=0.8)
+    index.add("a", base, payload={"report": 1})
+    index.add("b", other)
+    [match] = index.query(edited)
+    assert match.key == "a" and match.payload == {"report": 1} and match.similarity >= 0.8
+    assert index.query("Completely unrelated text about cooking pasta") == []
+
+    index.add("c", edited)
+    assert sorted(map(sorted, index.duplicates())) == [["a", "c"]]
+    index.remove("a")
+    index.save(tmp_path / "dedupe.pkl")
+    index = NearDuplicateIndex.load(tmp_path / "dedupe.pkl")
+    assert index.keys == ["b", "c"] and index.get("a") is None  # the removed slot is gone
+    assert [m.key for m in index.query(base)] == ["c"]
+    assert list(index.duplicates()) == []
+
+    # text without words (a failed OCR) is never indexed or matched
+    index.add("blank", "  ")
+    assert "blank" not in index
+    assert index.query("") == [] and index.query("\n") == []
@@ -0,0 +1,20 @@
+# tests/test_dates.py
+import pytest
+
+from resume_reviewer.parser.dates import normalize_date
+
+
+@pytest.mark.parametrize("raw,expected", [
+    ("Mar 2019", "2019-03"),
+    ("März 2019", "2019-03"),
+    ("janv. 2018", "2018-01"),
+    ("03/2019", "2019-03"),
+    ("2019", "2019-01"),
+    ("Jan '19", "2019-01"),
+    ("Current", "present"),
+    ("heute", "present"),
+    ("15 March 2019", "2019-03"),   # dateutil fallback
+    ("no date here", ""),
+])
+def test_normalize_date(raw, expected):
+    assert normalize_date(raw) == expected
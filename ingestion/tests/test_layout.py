@@ -0,0 +1,29 @@
+import pathlib
+
+import pytest
+
+from resume_reviewer.parser import parse_resume
+from resume_reviewer.parser.layout import analyze_pdf
+
+REPORT_PDF = pathlib.Path(__file__).parents[2] / "LingoMate_FInal_Report_DS_CV_reviewer.pdf"
+
+
+def test_layout_features():
+    feats = analyze_pdf(REPORT_PDF)
+    assert feats["pages"] == 5
+    assert feats["columns"] == 2  # the body pages are set in two columns
+    assert feats["body_size"] == 10.0
+    assert 0.99 <= sum(feats["font_sizes"].values()) <= 1.01
+    assert 0 < feats["whitespace_ratio"] < 1
+    assert len(feats["chars_per_page"]) == 5
+
+
+@pytest.mark.parametrize("backend", ["fast", "layout"])
+def test_layout_is_opt_in_and_measured_during_extraction(backend):
+    assert "layout" not in parse_resume(REPORT_PDF, ocr=False, backend=backend).structured["meta"]
+    meta = parse_resume(REPORT_PDF, ocr=False, layout=True, backend=backend).structured["meta"]
+    assert "layout" in meta["timings"]
+    # the extractor's own pages give what a separate pdfplumber pass does
+    alone = analyze_pdf(REPORT_PDF)
+    for key in ("pages", "columns", "body_size", "font_families", "tables", "images"):
+        assert meta["layout"][key] == alone[key], key
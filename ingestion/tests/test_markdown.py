@@ -0,0 +1,35 @@
+from resume_reviewer.parser.markdown_utils import lines_to_markdown
+
+
+def _line(text, x0, size=10.0, font="Helvetica"):
+    chars = [{"text": ch, "size": size, "fontname": font} for ch in text if ch != " "]
+    return {"text": text, "x0": x0, "chars": chars}
+
+
+def test_font_size_and_weight_become_headings():
+    lines = [
+        _line("Jane Doe", 50, size=20),
+        _line("Experience", 50, size=13),
+        _line("Acme Corp", 50, font="Helvetica-Bold"),
+        _line("Built the billing pipeline end to end for three markets", 50),
+        _line("Reduced churn by twelve percent over two years of work", 50),
+    ]
+    assert lines_to_markdown(lines).splitlines()[:3] == [
+        "# Jane Doe", "## Experience", "### Acme Corp",
+    ]
+
+
+def test_glyph_bullets_nest_by_indent_and_fold_wraps():
+    lines = [
+        _line("Skills overview for the position applied for", 50),
+        _line("• Python", 60),
+        _line("◦ asyncio and typing", 80),
+        _line("• Led a migration that took the team", 60),
+        _line("most of a year", 67),
+    ]
+    assert lines_to_markdown(lines).splitlines() == [
+        "Skills overview for the position applied for",
+        "- Python",
+        "  - asyncio and typing",
+        "- Led a migration that took the team most of a year",
+    ]
@@ -0,0 +1,28 @@
+# tests/test_ocr.py
+from PIL import Image
+
+from resume_reviewer.parser import parse_resume
+from resume_reviewer.parser.image_parser import OCR_OFF_NOTE
+from resume_reviewer.parser.ocr import OcrEngine, _otsu_threshold
+
+
+def test_preprocess_downscales_and_binarises():
+    img = Image.new("RGB", (1200, 600), "white")
+    img.paste((20, 20, 20), (100, 100, 400, 200))
+    out = OcrEngine(target_dpi=300).preprocess(img, source_dpi=600)
+    assert out.size == (600, 300)
+    assert out.mode == "1"
+
+
+def test_otsu_splits_bimodal_histogram():
+    hist = [0] * 256
+    hist[30], hist[220] = 500, 1500
+    assert 30 <= _otsu_threshold(hist) < 220
+
+
+def test_images_are_not_read_with_ocr_off(tmp_path):
+    path = tmp_path / "scan.png"
+    Image.new("RGB", (200, 100), "white").save(path)
+    parsed = parse_resume(path, ocr=False)
+    assert parsed.text == ""
+    assert OCR_OFF_NOTE in parsed.structured["parser_notes"]
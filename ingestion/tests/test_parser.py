@@ -12,4 +12,221 @@ SAMPLES = pathlib.Path(__file__).parent / "samples"
 def test_parse(fname, ftype):
     res = parse_resume(SAMPLES / fname)
     assert res.metadata["filetype"] == ftype
-    assert len(res.text) > 100
\ No newline at end of file
+    assert len(res.text) > 100
+
+def test_checksum_stream_rewinds():
+    import hashlib, io
+    from resume_reviewer.parser.document import checksum_stream
+
+    data = b"%PDF-1.4 " * 100_000
+    fp = io.BytesIO(data)
+    assert checksum_stream(fp, chunk_size=4096) == "sha256:" + hashlib.sha256(data).hexdigest()
+    assert fp.tell() == 0
+
+
+def test_page_parallel_matches_serial():
+    from resume_reviewer.parser.pdf_parser import extract_pages
+
+    pdf = pathlib.Path(__file__).parents[2] / "LingoMate_FInal_Report_DS_CV_reviewer.pdf"
+    serial = extract_pages(pdf)
+    with open(pdf, "rb") as fp:
+        assert extract_pages(fp, workers=2, min_pages=2) == serial
+
+
+def test_parse_resume_bytes_matches_path():
+    from resume_reviewer.parser import parse_resume_bytes
+
+    pdf = pathlib.Path(__file__).parents[1] / "sample ingestion" / "12763627.pdf"
+    by_path = parse_resume(pdf)
+    by_bytes = parse_resume_bytes(pdf.read_bytes(), filename="upload.pdf")
+    assert by_bytes.metadata == {"filetype": "pdf", "source": "upload.pdf"}
+    assert by_bytes.text == by_path.text
+    assert by_bytes.structured["meta"]["checksum"] == by_path.structured["meta"]["checksum"]
+
+
+def test_detect_bytes_from_magic():
+    import io
+    from docx import Document
+    from resume_reviewer.parser.detector import detect_bytes
+
+    buf = io.BytesIO()
+    Document().save(buf)
+    assert detect_bytes(buf.getvalue()) == "docx"
+    assert detect_bytes(b"\x89PNG\r\n\x1a\n" + b"\0" * 16) == "png"
+    assert detect_bytes(b"%PDF-1.7\n") == "pdf"
+
+
+def test_docx_streams_in_document_order():
+    import io
+    from docx import Document
+    from resume_reviewer.parser.docx_parser import extract_document
+
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "Header"
+    doc.add_paragraph("Before")
+    doc.add_table(rows=1, cols=2).cell(0, 1).text = "Cell"
+    doc.add_paragraph("After")
+    buf = io.BytesIO()
+    doc.save(buf)
+    assert extract_document(buf) == ("Header\nBefore\nCell\nAfter", 1)
+
+
+def test_docx_text_box_read_once_and_parts_in_numeric_order():
+    import io
+    import zipfile
+    from resume_reviewer.parser.docx_parser import extract_document
+
+    ns = (
+        'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+        'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+        'xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape" '
+        'xmlns:v="urn:schemas-microsoft-com:vml"'
+    )
+    box = "<w:p><w:r><w:t>{}</w:t></w:r></w:p>"
+    body = (
+        f"<w:document {ns}><w:body><w:p><w:r><w:t>Jane Doe</w:t></w:r><w:r><mc:AlternateContent>"
+        f"<mc:Choice><w:drawing><wps:txbx><w:txbxContent>{box.format('Boxed')}"
+        "</w:txbxContent></wps:txbx></w:drawing></mc:Choice>"
+        f"<mc:Fallback><w:pict><v:textbox><w:txbxContent>{box.format('Boxed')}"
+        "</w:txbxContent></v:textbox></w:pict></mc:Fallback>"
+        f"</mc:AlternateContent></w:r></w:p>{box.format('After')}</w:body></w:document>"
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("word/document.xml", body)
+        for n in (10, 2):
+            zf.writestr(f"word/header{n}.xml", f"<w:hdr {ns}>{box.format(f'Header {n}')}</w:hdr>")
+    assert extract_document(buf) == ("Header 2\nHeader 10\nBoxed\nJane Doe\nAfter", 1)
+
+
+def test_import_is_lazy():
+    import subprocess, sys
+
+    heavy = ("pdfplumber", "PIL", "pytesseract", "dateutil", "docx")
+    code = (
+        "import sys, resume_reviewer.parser\n"
+        f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=pathlib.Path(__file__).parents[1],
+                         capture_output=True, text=True, check=True).stdout.strip()
+    assert out == ""
+
+
+def test_register_custom_extractor(tmp_path):
+    from resume_reviewer.parser import register
+    from resume_reviewer.parser.document import Extraction
+    from resume_reviewer.parser.registry import _TARGETS, _LOADED
+
+    @register("txt")
+    def extract_txt(fp, checksum, **_):
+        return Extraction([fp.read().decode()], 1, checksum)
+
+    try:
+        f = tmp_path / "cv.txt"
+        f.write_text("Jane Doe\nSkills\nPython, Go\n")
+        res = parse_resume(f, convert_to_md=False, ocr=False)
+        assert res.structured["sections"]["skills"]["hard"] == ["Python", "Go"]
+    finally:
+        _TARGETS.pop("txt", None)
+        _LOADED.pop("txt", None)
+
+
+def test_msgpack_and_parquet_round_trip(tmp_path):
+    pytest.importorskip("msgpack")
+    pytest.importorskip("pyarrow")
+    from resume_reviewer.parser.core import ParsedResume
+    from resume_reviewer.parser.export import read_parquet, read_tables, write_parquet
+    from resume_reviewer.parser.structure import to_schema
+
+    text = (
+        "Jane Doe\njane@example.com\nExperience\nAcme, Engineer Jan 2019 - Present\n- Shipped it\n"
+        "\nEducation\nB.Sc. Physics 2012 - 2015\nSkills\nPython, Go\n"
+    )
+    results = [
+        ParsedResume(text, {"filetype": "pdf", "source": f"cv{i}.pdf"},
+                     to_schema(text, filepath=pathlib.Path(f"cv{i}.pdf"), checksum=f"sha256:{i}"))
+        for i in range(3)
+    ]
+    assert ParsedResume.from_msgpack(results[0].to_msgpack()) == results[0]
+
+    write_parquet(results, tmp_path, batch_size=2)
+    assert list(read_parquet(tmp_path)) == results
+    tables = read_tables(tmp_path, columns={"skills": ["resume_id", "skill"]})
+    assert tables["skills"].num_rows == 6
+    assert tables["experience"].column("bullets").to_pylist()[0] == ["Shipped it"]
+
+
+REPORT_PDF = pathlib.Path(__file__).parents[2] / "LingoMate_FInal_Report_DS_CV_reviewer.pdf"
+
+
+def test_fast_backend_close_to_layout():
+    from collections import Counter
+    from resume_reviewer.parser import pdf_parser, pdfium_parser
+
+    corpus = pathlib.Path(__file__).parents[2] / "data" / "data" / "data"
+    pdfs = sorted(corpus.glob("ACCOUNTANT/*.pdf"))[:3]
+    if not pdfs:
+        pytest.skip("résumé corpus not downloaded")
+    for pdf in pdfs:
+        fast = Counter(" ".join(pdfium_parser.extract_pages(str(pdf))).split())
+        layout = Counter(" ".join(pdf_parser.extract_pages(str(pdf))).split())
+        assert sum((fast & layout).values()) / sum((fast | layout).values()) > 0.85
+
+
+def test_degenerate_pages_fall_back_to_layout(monkeypatch):
+    from resume_reviewer.parser import pdf_parser, pdfium_parser
+
+    assert pdfium_parser.degenerate("x" * 40 + " ok") == "missing word spaces"
+    assert pdfium_parser.degenerate("�� ab") == "undecodable glyphs"
+    assert pdfium_parser.degenerate("plain words only") is None
+
+    monkeypatch.setattr(pdfium_parser, "degenerate", lambda text: "forced" if "Abstract" in text else None)
+    notes = []
+    pages = pdfium_parser.extract_pages(str(REPORT_PDF), notes=notes)
+    layout = pdf_parser.extract_pages(str(REPORT_PDF))
+    assert notes == ["layout fallback on page 1: forced"]
+    assert pages[0] == layout[0] and pages[1] != layout[1]
+
+
+@pytest.mark.parametrize("backend", ["fast", "layout"])
+def test_page_and_text_limits_give_partial_result(backend):
+    full = parse_resume(REPORT_PDF, backend=backend)
+    res = parse_resume(REPORT_PDF, backend=backend, max_pages=1)
+    pages = full.structured["meta"]["page_count"]
+    assert pages > 1 and res.structured["meta"]["page_count"] == pages  # the document's
+    assert res.structured["parser_notes"][0] == f"limit: stopped after 1 of {pages} pages (max_pages)"
+    assert full.text.startswith(res.text[:200])
+
+    res = parse_resume(REPORT_PDF, backend=backend, max_chars=300, convert_to_md=False)
+    assert len(res.text) <= 300
+    assert "limit: text cut at 300 characters (max_chars)" in res.structured["parser_notes"]
+
+    # both limits: the note names the one that stopped extraction
+    res = parse_resume(REPORT_PDF, backend=backend, max_pages=1, max_chars=100)
+    assert res.structured["parser_notes"][0] == f"limit: stopped after 1 of {pages} pages (max_chars)"
+
+
+def test_sandboxed_parse_reports_limits():
+    from resume_reviewer.parser import Limits, parse_resume_sandboxed
+
+    res = parse_resume_sandboxed(REPORT_PDF.read_bytes(), filename="r.pdf", limits=Limits(max_pages=1))
+    assert res.metadata == {"filetype": "pdf", "source": "r.pdf"}
+    assert res.structured["meta"]["page_count"] > 1
+    assert res.structured["parser_notes"][0].startswith("limit: stopped after 1 of ")
+
+    res = parse_resume_sandboxed(REPORT_PDF, limits=Limits(wall_seconds=0.001))
+    assert res.text == ""
+    assert res.structured["parser_notes"] == ["limit: wall-clock limit of 0.001s exceeded, nothing parsed"]
+    with pytest.raises(ValueError):
+        parse_resume_sandboxed(b"plain text", filename="cv.txt")
+
+
+def test_sandboxed_parse_answers_cache_hits_without_a_child(tmp_path):
+    from resume_reviewer.parser import Limits, ParseCache, parse_resume_bytes, parse_resume_sandboxed
+
+    cache, data = ParseCache(tmp_path), REPORT_PDF.read_bytes()
+    parse_resume_bytes(data, filename="a.pdf", cache=cache)
+    # no child could finish in a millisecond: this comes from the cache
+    res = parse_resume_sandboxed(data, filename="b.pdf", cache=cache, limits=Limits(wall_seconds=0.001))
+    assert res.text and res.metadata["source"] == "b.pdf"
+    assert res.structured["meta"]["file_name"] == "b.pdf"
@@ -0,0 +1,41 @@
+from resume_reviewer.parser.proofread import SpellIndex, default_spell_index, proofread
+
+TEXT = (
+    "Jane Doe\n"
+    "Experience\n"
+    "Analyst, Acme Corp 03/2016 - 05/2019\n"
+    "- Managed the budget of the team\n"
+    "- Prepare weekly reports for the managment\n"
+    "- Reports were reviewed by the board\n"
+    "Assistant, Initech 2019 - Present\n"
+    "- Organize the schedule and the mail for the office\n"
+    "Diese Zeile ist auf Deutsch und nicht auf Englisch\n"
+    "Contact: jane@managment.example\n"
+)
+
+
+def test_proofread_findings():
+    spell = SpellIndex({"management": 500, "managed": 300, "weekly": 100, "reports": 200})
+    assert spell.lookup("managment") == ("management", 1)
+    assert spell.lookup("mangement", min_count=1000) is None
+
+    out = proofread(TEXT, spell=spell)
+    assert out["language"]["detected"] == "en"
+    found = {(f["kind"], TEXT[f["start"]:f["end"]]): f for f in out["findings"]}
+    assert found["spelling", "managment"]["suggestion"] == "management"  # not in the e-mail
+    assert "present tense" in found["tense", "Prepare"]["note"]  # a role that ended in 2019
+    assert ("tense", "Organize") not in found  # the current role
+    assert ("passive", "were reviewed") in found
+    assert found["language", "Diese Zeile ist auf Deutsch und nicht auf Englisch"]["language"] == "de"
+    assert out["counts"] == {
+        "words": out["counts"]["words"], "spelling": 1, "tense": 1, "passive": 1,
+        "other_language": 1,
+    }
+
+
+def test_shipped_word_list_flags_common_slips():
+    text = "- Led the managment team\n- Did recieve awards\n- Improved the enviroment\n- Managers manage\n"
+    out = proofread(text, spell=default_spell_index())
+    found = {f["text"]: f["suggestion"] for f in out["findings"] if f["kind"] == "spelling"}
+    # a lost consonant is deliberately not reported: it too often makes a real word
+    assert found == {"managment": "management", "recieve": "receive"}
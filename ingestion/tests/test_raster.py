@@ -0,0 +1,30 @@
+import io
+import pathlib
+
+from PIL import Image
+
+from resume_reviewer.parser.raster import RasterCache, data_urls, page_thumbnails
+
+REPORT_PDF = pathlib.Path(__file__).parents[2] / "LingoMate_FInal_Report_DS_CV_reviewer.pdf"
+
+
+def test_thumbnails_cached_per_page(tmp_path, monkeypatch):
+    cache = RasterCache(tmp_path)
+    images = page_thumbnails(REPORT_PDF, cache=cache, max_pages=3, workers=2)
+    assert len(images) == 3
+    first = Image.open(io.BytesIO(images[0]))
+    assert first.mode == "P" and first.size[1] == 842  # A4 at 72 DPI
+    assert len(list(tmp_path.glob("*/*.png"))) == 3
+
+    # a second call, from the bytes, renders nothing
+    monkeypatch.setattr("resume_reviewer.parser.raster._render_parallel", None)
+    assert page_thumbnails(REPORT_PDF.read_bytes(), cache=cache, max_pages=3) == images
+    assert data_urls(images[:1])[0].startswith("data:image/png;base64,iVBOR")
+
+
+def test_raster_cache_is_bounded(tmp_path):
+    cache = RasterCache(tmp_path, max_bytes=1000)
+    cache.put("sha256:ab", {0: b"x" * 600})
+    cache.put("sha256:cd", {0: b"y" * 600})
+    assert cache.get("sha256:ab", 0) is None  # least recently used went
+    assert cache.get("sha256:cd", 0) == b"y" * 600
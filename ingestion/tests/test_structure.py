@@ -0,0 +1,85 @@
+# tests/test_structure.py
+from pathlib import Path
+
+from resume_reviewer.parser.structure import iter_events, to_schema
+
+SAMPLE = """Jane Doe
+jane@example.com | +49 151 1234567
+Experience
+Acme Corp Jan 2019 - Present
+- Built things
+- Led team
+Foo Inc March 2015 - Dec 2018
+• Did stuff
+
+Skills
+Python, Java
+Script; SQL/Go
+"""
+
+
+def test_iter_events_classifies_each_line():
+    kinds = [(section, kind) for section, kind, _, _ in iter_events(SAMPLE)]
+    assert kinds[:5] == [
+        ("misc", "text"),
+        ("misc", "contact"),
+        ("experience", "heading"),
+        ("experience", "date"),
+        ("experience", "bullet"),
+    ]
+
+
+def test_to_schema_streams_sections():
+    schema = to_schema(SAMPLE.splitlines(), filepath=Path("x.pdf"), checksum="sha256:0")
+    assert schema["candidate"]["full_name"] == "Jane Doe"
+    assert schema["candidate"]["contact"]["phone"] == "+49 151 1234567"
+    exp = schema["sections"]["experience"]
+    assert [(e["start_date"], e["end_date"]) for e in exp] == [("2019-01", "present"), ("2015-03", "2018-12")]
+    assert exp[0]["bullets"] == ["Built things", "Led team"]
+    # canonical lexicon names: "Java\nScript" is a synonym of JavaScript
+    assert schema["sections"]["skills"]["hard"] == ["Python", "JavaScript", "SQL", "Go"]
+
+
+def test_skills_from_lexicon_scan_with_offsets():
+    from resume_reviewer.parser.skills import SkillLexicon
+
+    text = (
+        "Jane Doe\n"
+        "Experience\n"
+        "- Cut deploy time with CI/CD on k8s; strong communication skills\n"
+        "- Willing to go the extra mile with Lean Six Sigma\n"
+        "Skills\n"
+        "Kubernetes, Go, Jenkinsfile wizardry, C++\n"
+    )
+    schema = to_schema(text, filepath=Path("x.pdf"), checksum="sha256:0")
+    skills, offsets = schema["sections"]["skills"], schema["skill_offsets"]
+    assert skills["hard"] == ["CI/CD", "Kubernetes", "Six Sigma", "Go", "C++"]
+    assert skills["soft"] == ["Communication"]
+    assert skills["other"] == ["Jenkinsfile wizardry"]
+    assert [text[s:e] for s, e in offsets["Kubernetes"]] == ["k8s", "Kubernetes"]
+    assert [text[s:e] for s, e in offsets["Six Sigma"]] == ["Lean Six Sigma"]  # not "go", not "Lean"
+
+    lexicon = SkillLexicon({"hard": [["Go", "golang"]], "soft": [], "case_sensitive": ["Go"]})
+    assert [m.skill for m in lexicon.scan("go to Google; GO; Go and golang")] == ["Go", "Go"]
+
+
+def test_records_round_trip_and_intern():
+    import json
+    import sys
+
+    from resume_reviewer.parser.records import ResumeRecord
+
+    schema = to_schema(SAMPLE.splitlines(), filepath=Path("x.pdf"), checksum="sha256:0")
+    schema["meta"]["timings"] = {"extract": 0.01}  # keys to_schema doesn't know survive
+    schema["sections"]["education"].append(
+        {"title": "BSc", "employer": "", "location": "", "start_date": "2010", "end_date": "2014"}
+    )
+    copy = json.loads(json.dumps(schema))
+    rec = ResumeRecord.from_dict(copy)
+    assert rec.to_dict() == schema
+    assert json.dumps(rec.to_dict()) == json.dumps(schema)
+    assert rec.sections.experience[0].bullets == ("Built things", "Led team")
+    assert rec.sections.education[0].bullets is None
+    assert rec.meta.extra == {"timings": {"extract": 0.01}}
+    assert rec.sections.skills.hard[0] is sys.intern("Python")
+    assert not hasattr(rec.sections, "__dict__")
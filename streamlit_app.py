@@ -1,5 +1,6 @@
 # streamlit_app.py
-import os, tempfile, json
+import os, json
+import threading
 from pathlib import Path
 
 import streamlit as st
@@ -7,8 +8,10 @@ import pandas as pd
 import plotly.express as px
 from streamlit_pdf_viewer import pdf_viewer
 
-from ingestion.resume_reviewer.parser import parse_resume
-from agents.pipeline import run_pipeline
+from ingestion.resume_reviewer.corpus import NearDuplicateIndex
+from ingestion.resume_reviewer.parser import ParseCache, parse_resume_sandboxed
+from ingestion.resume_reviewer.parser.raster import RasterCache, data_urls, page_thumbnails
+from agents.pipeline import find_prior_run, remember_run, run_pipeline
 
 # ── page & sidebar ───────────────────────────────────────────────────────
 st.set_page_config(page_title="LLM CV Evaluator", layout="wide")
@@ -24,17 +27,53 @@ with st.sidebar:
     role    = st.selectbox("Target role", ["Software Engineer", "Product Manager"])
     country = st.text_input("Target country", value="Germany")
     st.session_state.update(role=role, country=country)
+    multimodal = st.checkbox("Let the evaluator see the pages", help="Sends low-resolution page images")
+
+PARSE_CACHE = ParseCache()   # re-uploads of the same CV skip parsing
+DEDUPE_PATH = Path("~/.cache/resume_reviewer/near_duplicates.pkl").expanduser()
+RASTER_CACHE = RasterCache()  # page thumbnails on disk, shared across sessions
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def page_images(checksum: str, _pdf_bytes: bytes) -> list[str]:
+    """Page thumbnails as data URLs, rendered once per document rather than per rerun."""
+    images = page_thumbnails(
+        _pdf_bytes, checksum=checksum, cache=RASTER_CACHE, workers=os.cpu_count() or 1
+    )
+    return data_urls(images)
+
+
+@st.cache_resource
+def near_duplicates() -> NearDuplicateIndex:
+    """Earlier pipeline results by résumé text, shared across sessions and reruns."""
+    if DEDUPE_PATH.exists():
+        return NearDuplicateIndex.load(DEDUPE_PATH)
+    DEDUPE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    return NearDuplicateIndex(threshold=0.9)
+
+
+@st.cache_resource
+def near_duplicates_lock() -> threading.Lock:
+    """Serialises sessions reading, updating and saving the shared index."""
+    return threading.Lock()
 
 # ── upload résumé ────────────────────────────────────────────────────────
 resume_file = st.file_uploader("Upload your résumé (PDF, PNG, DOCX)", type=["pdf", "png", "docx"])
 if resume_file:
-    # Get file extension for proper temporary file naming
-    file_extension = resume_file.name.split('.')[-1].lower()
-    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{file_extension}") as tmp:
-        tmp.write(resume_file.read())
-        resume_path = tmp.name
-
-    parsed = parse_resume(resume_path, convert_to_md=False)
+    # parse straight from the upload buffer (no temp file) in a CPU/memory/page
+    # bounded child, so one pathological upload can't stall the app; reruns
+    # are answered from PARSE_CACHE in this process, without starting one
+    resume_bytes = resume_file.getvalue()
+    parsed = parse_resume_sandboxed(
+        resume_bytes,
+        filename=resume_file.name,
+        convert_to_md=False,
+        cache=PARSE_CACHE,
+        layout=True,  # visual/ats features, measured on the pages the fast backend has open
+        proofread=True,  # spelling/tense/language findings for the language score
+    )
+    file_extension = parsed.metadata["filetype"]
+    resume_path = resume_file.name
     st.session_state.update(
         pdf_path=resume_path,
         resume_text=parsed.text,
@@ -44,18 +83,36 @@ if resume_file:
     st.success("Résumé processed")
     # Only show PDF viewer for PDF files
     if file_extension == 'pdf':
-        pdf_viewer(resume_path, height=550)
+        pdf_viewer(resume_bytes, height=550)
     else:
         st.info(f"Uploaded {file_extension.upper()} file processed successfully")
 
-    with st.spinner("Running multi-agent analysis …"):
-        result = run_pipeline(
-            pdf_path        = resume_path,
-            resume_text     = parsed.text,
-            structured_json = parsed.structured,
-            role            = role,
-            country         = country,
-        )
+    # this very CV was analysed before: reuse that result unless asked to re-run
+    # (a merely similar one, re-export or small edits, is analysed afresh)
+    dedupe, dedupe_lock = near_duplicates(), near_duplicates_lock()
+    checksum = parsed.structured["meta"]["checksum"]
+    with dedupe_lock:
+        result = find_prior_run(dedupe, parsed.text, role, country, checksum=checksum)
+    if result is not None and not result["reused_from"]["same_file"]:
+        result = None
+    if result is not None and st.checkbox("Re-run the analysis (this CV was already analysed)"):
+        result = None
+    if result is None:
+        images = None
+        if multimodal and file_extension == "pdf":
+            images = page_images(checksum, resume_bytes)
+        with st.spinner("Running multi-agent analysis …"):
+            result = run_pipeline(
+                pdf_path        = resume_path,
+                resume_text     = parsed.text,
+                structured_json = parsed.structured,
+                role            = role,
+                country         = country,
+                page_images     = images,
+            )
+        with dedupe_lock:
+            remember_run(dedupe, parsed.text, parsed.structured, role, country, result)
+            dedupe.save(DEDUPE_PATH)
 
     # unwrap market dict if double-nested
     market_raw = result["market"]
@@ -152,12 +209,3 @@ if "report" in st.session_state:
             )
             st.markdown("---")
             st.markdown(summary)
-
-# ── cleanup tmp file on reload (unless user keeps it) ────────────────────
-if (tmp := st.session_state.get("pdf_path")) and not st.sidebar.checkbox(
-    "Keep temp file", value=False
-):
-    try:
-        os.unlink(tmp)
-    except OSError:
-        pass